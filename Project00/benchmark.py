@@ -0,0 +1,279 @@
+"""
+Benchmark harness for SinglyLinkedList operations
+Times each operation on lists of 10^3 up to 10^7 nodes, reports ops/sec and
+peak traced memory, and can save the results as a JSON baseline or compare a
+run against one so regressions show up before a deploy.
+
+usage: python benchmark.py [--max-exp 7] [--save baseline.json] [--compare baseline.json]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from random import Random
+from typing import Callable, Dict, List, Tuple
+
+from solution import SinglyLinkedList, help_mario
+
+
+def _build(n: int) -> SinglyLinkedList:
+    """
+    Builds the list every benchmark starts from, values 0..n-1 in order
+    :param n: number of nodes
+    :return: new SLL
+    """
+    return SinglyLinkedList.from_iterable(range(n))
+
+
+def _reps(n: int, budget: int = 10 ** 6) -> int:
+    """
+    Number of calls to time for an O(n) operation, so each size takes similar time
+    :param n: list size
+    :param budget: rough number of node visits to spend per timing
+    :return: number of calls, at least 1
+    """
+    return max(1, min(1000, budget // n))
+
+
+def _keys(n: int, count: int, seed: int = 331) -> List[int]:
+    """
+    Lookup keys, half present in the list and half absent
+    :param n: list size
+    :param count: number of keys
+    :param seed: RNG seed so runs are reproducible
+    :return: list of keys
+    """
+    rng = Random(seed)
+    return [rng.randrange(n) if i % 2 == 0 else n + rng.randrange(n) for i in range(count)]
+
+
+# Each benchmark takes the list size and returns (setup, run, ops): setup builds
+# whatever `run` needs and is not timed, `run` performs `ops` operations.
+Benchmark = Callable[[int], Tuple[Callable[[], object], Callable[[object], None], int]]
+
+
+def bench_append(n: int):
+    """
+    Times n appends onto an empty list
+    """
+    def run(sll: SinglyLinkedList) -> None:
+        append = sll.append
+        for i in range(n):
+            append(i)
+    return SinglyLinkedList, run, n
+
+
+def bench_to_string(n: int):
+    """
+    Times whole-list string conversions
+    """
+    reps = _reps(n)
+
+    def run(sll: SinglyLinkedList) -> None:
+        for _ in range(reps):
+            sll.to_string()
+    return lambda: _build(n), run, reps
+
+
+def bench_length(n: int):
+    """
+    Times length() calls
+    """
+    reps = 10 ** 5
+
+    def run(sll: SinglyLinkedList) -> None:
+        for _ in range(reps):
+            sll.length()
+    return lambda: _build(n), run, reps
+
+
+def bench_total(n: int):
+    """
+    Times total() calls
+    """
+    reps = 10 ** 5
+
+    def run(sll: SinglyLinkedList) -> None:
+        for _ in range(reps):
+            sll.total()
+    return lambda: _build(n), run, reps
+
+
+def bench_delete(n: int):
+    """
+    Times delete() calls, half of them for absent values
+    """
+    keys = _keys(n, _reps(n))
+
+    def run(sll: SinglyLinkedList) -> None:
+        for key in keys:
+            sll.delete(key)
+    return lambda: _build(n), run, len(keys)
+
+
+def bench_delete_all(n: int):
+    """
+    Times delete_all() calls, half of them for absent values
+    """
+    keys = _keys(n, _reps(n))
+
+    def run(sll: SinglyLinkedList) -> None:
+        for key in keys:
+            sll.delete_all(key)
+    return lambda: _build(n), run, len(keys)
+
+
+def bench_find(n: int):
+    """
+    Times find() calls, half of them for absent values
+    """
+    keys = _keys(n, _reps(n))
+
+    def run(sll: SinglyLinkedList) -> None:
+        for key in keys:
+            sll.find(key)
+    return lambda: _build(n), run, len(keys)
+
+
+def bench_find_sum(n: int):
+    """
+    Times find_sum() calls, half of them for absent values
+    """
+    keys = _keys(n, _reps(n))
+
+    def run(sll: SinglyLinkedList) -> None:
+        for key in keys:
+            sll.find_sum(key)
+    return lambda: _build(n), run, len(keys)
+
+
+def bench_help_mario(n: int):
+    """
+    Times help_mario() calls, half of them for absent allies
+    """
+    keys = _keys(n, _reps(n))
+
+    def run(sll: SinglyLinkedList) -> None:
+        for key in keys:
+            help_mario(sll, key)
+    return lambda: _build(n), run, len(keys)
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    'append': bench_append,
+    'to_string': bench_to_string,
+    'length': bench_length,
+    'total': bench_total,
+    'delete': bench_delete,
+    'delete_all': bench_delete_all,
+    'find': bench_find,
+    'find_sum': bench_find_sum,
+    'help_mario': bench_help_mario,
+}
+
+
+def measure(benchmark: Benchmark, n: int, repeat: int) -> Dict[str, float]:
+    """
+    Times one benchmark at one size
+    The best of `repeat` untraced runs gives ops/sec; one extra run under
+    tracemalloc gives the peak memory allocated by setup plus the operation.
+    :param benchmark: benchmark factory
+    :param n: list size
+    :param repeat: number of timed runs
+    :return: dict with ops_per_sec, seconds and peak_bytes
+    """
+    setup, run, ops = benchmark(n)
+    best = float('inf')
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        best = min(best, time.perf_counter() - start)
+        del state
+    tracemalloc.start()
+    run(setup())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'ops_per_sec': ops / best if best > 0 else float('inf'),
+            'seconds': best, 'peak_bytes': peak}
+
+
+def run_suite(sizes: List[int], names: List[str], repeat: int) -> dict:
+    """
+    Runs the selected benchmarks at every size, printing a line per result
+    :param sizes: list sizes to test
+    :param names: benchmark names to run
+    :param repeat: number of timed runs per measurement
+    :return: JSON-ready results, {name: {size: measurement}}
+    """
+    results = {}
+    for name in names:
+        results[name] = {}
+        for n in sizes:
+            result = measure(BENCHMARKS[name], n, repeat)
+            results[name][str(n)] = result
+            print(f"{name:>12} n={n:<9} {result['ops_per_sec']:>14,.1f} ops/s "
+                  f"{result['peak_bytes'] / 2 ** 20:>10.2f} MiB peak")
+    return {'python': platform.python_version(), 'platform': platform.platform(),
+            'results': results}
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    """
+    Lists every measurement that got slower than the baseline by more than `threshold`
+    :param current: results of this run
+    :param baseline: results loaded from a baseline file
+    :param threshold: allowed relative slowdown, 0.2 means 20%
+    :return: human-readable regression messages, empty if none
+    """
+    regressions = []
+    for name, sizes in current['results'].items():
+        for n, result in sizes.items():
+            old = baseline['results'].get(name, {}).get(n)
+            if old is None:
+                continue
+            ratio = result['ops_per_sec'] / old['ops_per_sec']
+            if ratio < 1 - threshold:
+                regressions.append(f"{name} n={n}: {old['ops_per_sec']:,.1f} -> "
+                                   f"{result['ops_per_sec']:,.1f} ops/s ({ratio:.0%} of baseline)")
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Command line entry point
+    :param argv: arguments, defaults to sys.argv
+    :return: exit code, 1 if --compare found regressions
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--min-exp', type=int, default=3, help='smallest size is 10^min-exp')
+    parser.add_argument('--max-exp', type=int, default=5, help='largest size is 10^max-exp (up to 7)')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), default=list(BENCHMARKS),
+                        help='benchmarks to run')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per measurement')
+    parser.add_argument('--save', metavar='PATH', help='write results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='fail on regressions against a baseline')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed slowdown before --compare fails (default 0.2)')
+    args = parser.parse_args(argv)
+
+    sizes = [10 ** e for e in range(args.min_exp, args.max_exp + 1)]
+    current = run_suite(sizes, args.only, args.repeat)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(current, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        for line in regressions:
+            print('REGRESSION', line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,10 +1,43 @@
-from typing import TypeVar  # For use in type hinting
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from fractions import Fraction
+from itertools import dropwhile, islice, takewhile
+from random import Random
+from typing import Callable, Iterable, Iterator, List, Set, TextIO, TypeVar  # For use in type hinting
+
+try:
+    import numpy as np
+except ImportError:  # NumericSinglyLinkedList falls back to its object path
+    np = None
 
 # Type declarations
 T = TypeVar('T')        # generic type
 SLL = TypeVar('SLL')    # forward declared Singly Linked List type
 Node = TypeVar('Node')  # forward declared Node type
 
+# Magnitude from which float64 can no longer tell neighbouring ints apart
+_FLOAT_EXACT = 2 ** 53
+
+# Values a running total can subtract back out without rounding; Decimal
+# sums round to the context precision, so they don't qualify
+_EXACT_TOTALS = (int, Fraction)
+
+# Binary SLL files: magic, then blocks of up to `chunk_size` values. Each block is
+# a header (value count, int/float/str counts, str byte count), one type tag per
+# value, then the little-endian int64 column, float64 column, uint32 str byte
+# lengths and the utf-8 str bytes. Bools ride in the int column with their own tag.
+_SLL_MAGIC = b'SLL\x01'
+_SLL_BLOCK = struct.Struct('<IIIIQ')
+_TAG_INT, _TAG_FLOAT, _TAG_STR, _TAG_BOOL = range(4)
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
 
 class SLLNode:
     """
@@ -47,21 +80,313 @@ class SLLNode:
         return self is other if other is not None else False
 
 
+class SLLNodePool:
+    """
+    Bounded stack of spare SLLNodes that lists can draw from instead of allocating
+    A node is only handed back once it has been unlinked, and it is wiped before
+    reuse, so a node never sits in two places at once and SLLNode's identity
+    `==` keeps working. Any number of lists may share one pool.
+    """
+
+    __slots__ = ['max_size', '_nodes', 'hits', 'misses', 'released', 'dropped']
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """
+        Initializes an empty pool
+        :param max_size: most nodes kept around, extra released nodes are left to the GC
+        :return: None
+        """
+        self.max_size = max_size
+        self._nodes = []
+        # acquires served from the pool / by allocating, releases kept / turned away
+        self.hits = self.misses = self.released = self.dropped = 0
+
+    def __len__(self) -> int:
+        """
+        :return: number of spare nodes currently held
+        """
+        return len(self._nodes)
+
+    def acquire(self, data: T) -> Node:
+        """
+        Hands out a node holding `data`, reusing a spare one when available
+        :param data: data value for the node
+        :return: node with `data` and no next node
+        """
+        if self._nodes:
+            self.hits += 1
+            node = self._nodes.pop()
+            node.data = data
+            return node
+        self.misses += 1
+        return SLLNode(data)
+
+    def release(self, node: Node) -> None:
+        """
+        Takes back a node that is no longer linked into any list
+        :param node: unlinked node
+        :return: None
+        """
+        # drop references so the old data can be collected
+        node.data = None
+        node.next = None
+        if len(self._nodes) < self.max_size:
+            self._nodes.append(node)
+            self.released += 1
+        else:
+            self.dropped += 1
+
+    def drain(self) -> int:
+        """
+        Empties the pool, leaving the spare nodes to the GC
+        :return: number of nodes dropped
+        """
+        count = len(self._nodes)
+        self._nodes = []
+        return count
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the pool's counters
+        :return: dict with size, max_size, hits, misses, released and dropped
+        """
+        return {'size': len(self._nodes), 'max_size': self.max_size, 'hits': self.hits,
+                'misses': self.misses, 'released': self.released, 'dropped': self.dropped}
+
+
+class SLLView:
+    """
+    Lazy pipeline over the values of an SLL (or any iterable)
+    Each step returns a new view and nothing runs until the view is iterated,
+    so huge lists are processed one value at a time without copying. A view
+    can be iterated any number of times; each pass re-reads the source.
+    """
+
+    __slots__ = ['_source', '_steps']
+
+    def __init__(self, source: Iterable[T], steps: tuple = ()) -> None:
+        """
+        Initializes a view
+        :param source: values the pipeline starts from
+        :param steps: functions turning one iterator into the next, applied in order
+        :return: None
+        """
+        self._source = source
+        self._steps = steps
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Runs the pipeline lazily
+        :return: iterator over the resulting values
+        """
+        values = iter(self._source)
+        for step in self._steps:
+            values = step(values)
+        return values
+
+    def _then(self, step: Callable[[Iterator[T]], Iterator[T]]) -> 'SLLView':
+        """
+        :param step: function turning one iterator into the next
+        :return: new view with `step` appended
+        """
+        return SLLView(self._source, self._steps + (step,))
+
+    def map(self, function: Callable[[T], T]) -> 'SLLView':
+        """
+        :param function: applied to every value
+        :return: view of the transformed values
+        """
+        return self._then(lambda values: map(function, values))
+
+    def filter(self, predicate: Callable[[T], bool]) -> 'SLLView':
+        """
+        :param predicate: values it accepts are kept
+        :return: view of the kept values
+        """
+        return self._then(lambda values: filter(predicate, values))
+
+    def take_while(self, predicate: Callable[[T], bool]) -> 'SLLView':
+        """
+        :param predicate: values are passed through until it first fails
+        :return: view of the leading values that pass
+        """
+        return self._then(lambda values: takewhile(predicate, values))
+
+    def drop_while(self, predicate: Callable[[T], bool]) -> 'SLLView':
+        """
+        :param predicate: values are skipped until it first fails
+        :return: view of the values from the first failure on
+        """
+        return self._then(lambda values: dropwhile(predicate, values))
+
+    def take(self, count: int) -> 'SLLView':
+        """
+        :param count: most values to pass through
+        :return: view of the first `count` values
+        """
+        return self._then(lambda values: islice(values, count))
+
+    def to_sll(self, indexed: bool = False) -> SLL:
+        """
+        Materializes the view into a new SLL in one bulk pass
+        :param indexed: if True, the new list keeps a value index
+        :return: new SLL
+        """
+        return SinglyLinkedList.from_iterable(self, indexed=indexed)
+
+
+# per-class instrumented subclasses, built the first time a list of that class opts in
+_INSTRUMENTED = {}
+
+
+def _first_visits(sll: SLL, data: T) -> int:
+    """
+    Number of nodes a scan for the first `data` walks over
+    :param sll: list to scan
+    :param data: value the scan stops at
+    :return: 1-based position of the first match, or the list length if absent
+    """
+    visited = 0
+    currNode = sll.head
+    while currNode is not None:
+        visited += 1
+        if currNode.data == data:
+            break
+        currNode = currNode.next
+    return visited
+
+
+def _traced(name: str, method: Callable, visits: Callable, allocates: Callable) -> Callable:
+    """
+    Wraps `method` so each call is recorded under `name` in the list's stats
+    :param name: key in the stats snapshot
+    :param method: unwrapped method
+    :param visits: works out the nodes the call walks from the list as it is
+        before the call, None if the method's walk isn't modelled
+    :param allocates: works out the nodes the call allocates from the length
+        before and after it, None if it allocates none
+    :return: recording method
+    """
+    def traced(self, *args, **kwargs):
+        record = self._stats.get(name)
+        if record is None:
+            record = self._stats[name] = {'calls': 0, 'nodes_visited': 0 if visits else None,
+                                          'allocations': 0, 'net_nodes_added': 0, 'seconds': 0.0}
+        # counted before the clock starts, so it never shows up in `seconds`
+        if visits is not None:
+            record['nodes_visited'] += visits(self, *args, **kwargs)
+        pool = self._pool
+        before = self._length
+        misses = None if pool is None else pool.misses
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            record['seconds'] += time.perf_counter() - start
+            record['calls'] += 1
+            record['net_nodes_added'] += self._length - before
+            # pool hits reuse a node, only misses allocate one
+            if pool is not None:
+                record['allocations'] += pool.misses - misses
+            elif allocates is not None:
+                record['allocations'] += allocates(before, self._length)
+    traced.__name__ = method.__name__
+    traced.__doc__ = method.__doc__
+    return traced
+
+
+def _instrumented_class(cls: type) -> type:
+    """
+    Subclass of `cls` whose traced methods record their calls
+    Lists switch to it in `enable_instrumentation`, so lists that never opt in
+    run the plain methods without so much as a flag check
+    :param cls: SLL class to instrument
+    :return: instrumented subclass, built once per class
+    """
+    instrumented = _INSTRUMENTED.get(cls)
+    if instrumented is None:
+        namespace = {'__slots__': (), '_plain': cls}
+        for name, visits in cls._TRACED.items():
+            method = getattr(cls, name, None)
+            # plain node lists rotate through the module function
+            if method is None and name == '_help_mario':
+                method = _help_mario_nodes
+            namespace[name] = _traced(name.lstrip('_'), method, visits, cls._ALLOCATING.get(name))
+        instrumented = _INSTRUMENTED[cls] = type('Instrumented' + cls.__name__, (cls,), namespace)
+    return instrumented
+
+
+def _umask() -> int:
+    """
+    Reads the process umask, which can only be done by briefly setting it
+    :return: current umask
+    """
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
 class SinglyLinkedList:
     """
     SLL implementation
     """
 
-    __slots__ = ['head', 'tail']
+    __slots__ = ['head', 'tail', '_index', '_prev', '_length', '_total', '_total_valid', '_pool',
+                 '_stats']
 
-    def __init__(self) -> None:
+    # method -> nodes one call walks, worked out from the list before the call;
+    # instrumented lists record these (see enable_instrumentation)
+    _TRACED = {
+        'append': lambda self, data: 0,
+        'extend': lambda self, iterable: 0,
+        'save': lambda self, path, chunk_size=65536: self._length,
+        'to_string': lambda self: self._length,
+        'write_string': lambda self, stream, chunk_size=1024: self._length,
+        'total': lambda self: 0 if self._total_valid else self._length,
+        'delete': lambda self, data: (0 if self._index is not None and data not in self._index
+                                      else _first_visits(self, data)),
+        'delete_all': lambda self, data: (0 if self._index is not None and data not in self._index
+                                          else self._length),
+        'delete_many': lambda self, values: (0 if self._index is not None and
+                                             not any(value in self._index for value in values)
+                                             else self._length),
+        'delete_if': lambda self, predicate: self._length,
+        'find': lambda self, data: 0 if self._index is not None else _first_visits(self, data),
+        'find_sum': lambda self, data: 0 if self._index is not None else self._length,
+        '_help_mario': lambda self, ally: (
+            0 if self._length < 2 or self.head.data == ally or
+            (self._index is not None and len(self._index.get(ally, ())) < 2)
+            else _first_visits(self, ally)),
+    }
+    # method -> nodes one call allocates, worked out from the length before and
+    # after the call; unlisted methods allocate none (pooled lists count misses)
+    _ALLOCATING = {
+        'append': lambda before, after: after - before,
+        'extend': lambda before, after: after - before,
+    }
+    # class a list goes back to when instrumentation is turned off
+    _plain = None
+
+    def __init__(self, indexed: bool = False, pool: SLLNodePool = None) -> None:
         """
         Initializes an SLL
+        :param indexed: if True, keep a value index so `find` and `find_sum` run in O(1)
+        :param pool: if given, nodes come from and go back to this pool
         return: None
-        DO NOT MODIFY THIS FUNCTION
         """
         self.head = None
         self.tail = None
+        # value -> {id(node): node} and id(node) -> previous node,
+        # only kept when indexing is turned on
+        self._index = {} if indexed else None
+        self._prev = {} if indexed else None
+        # node count and running sum, kept current by every mutation
+        self._length = 0
+        self._total = None
+        self._total_valid = True
+        self._pool = pool
+        # per-method call records, only kept once instrumentation is turned on
+        self._stats = None
 
     def __repr__(self) -> str:
         """
@@ -76,20 +401,228 @@ class SinglyLinkedList:
         Overloads `==` operator to compare SLLs
         :param other: right operand of `==`
         :return: True if equal, else False
-        DO NOT MODIFY THIS FUNCTION
+
+        SLLNode `==` is identity, so two lists compare equal exactly when they
+        start at the same node (or are both empty): a shared head means every
+        later node is shared too. Checking the heads gives the same answer as
+        walking both chains, in O(1) and without recursion.
         """
-        comp = lambda n1, n2: n1 == n2 and (comp(n1.next, n2.next) if (n1 and n2) else True)
-        return comp(self.head, other.head)
+        return self.head is other.head
 
     # ========== Modify below ========== #
 
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates over the values in the SLL, head to tail
+        :return: generator of values
+        """
+        currNode = self.head
+        while currNode is not None:
+            yield currNode.data
+            currNode = currNode.next
+
+    def __len__(self) -> int:
+        """
+        Overloads `len()`, uses the maintained node count
+        :return: number of nodes in list
+        """
+        return self._length
+
+    def __contains__(self, data: T) -> bool:
+        """
+        Overloads `in`, goes through `find` so indexed lists answer in O(1)
+        :param data: data to search for
+        :return: True if found, else False
+        """
+        return self.find(data)
+
+    def view(self) -> SLLView:
+        """
+        Starts a lazy pipeline over the values of the SLL
+        :return: view over this list
+        """
+        return SLLView(self)
+
+    def enable_instrumentation(self) -> None:
+        """
+        Starts recording calls, nodes visited, allocations, net nodes added and wall time per method
+        The list switches to an instrumented subclass of its own class, so a
+        list that never turns this on pays nothing for it. Nodes visited come
+        from the `_TRACED` model, which walks the list itself before each call,
+        outside the timing, so an instrumented `find` or `delete` walks the
+        list twice. Allocations come from `_ALLOCATING`, or from the pool's misses
+        :return: None
+        """
+        if self._stats is None:
+            self._stats = {}
+        if type(self)._plain is None:
+            self.__class__ = _instrumented_class(type(self))
+
+    def disable_instrumentation(self) -> None:
+        """
+        Stops recording, the counts so far stay readable through `stats`
+        :return: None
+        """
+        if type(self)._plain is not None:
+            self.__class__ = type(self)._plain
+
+    def stats(self, reset: bool = False) -> dict:
+        """
+        Snapshot of the instrumentation counts
+        Counts are inclusive: a sorted list's `append` goes through
+        `insert_sorted`, so that call is recorded under both
+        :param reset: if True, start counting from zero again afterwards
+        :return: {method: {'calls', 'nodes_visited', 'allocations', 'net_nodes_added', 'seconds'}},
+            nodes_visited is None for methods whose walk isn't modelled,
+            allocations counts new nodes (pool misses for pooled lists) and
+            net_nodes_added is the change in length, negative for deletes
+        """
+        if self._stats is None:
+            return {}
+        snapshot = {name: dict(record) for name, record in self._stats.items()}
+        if reset:
+            self._stats = {}
+        return snapshot
+
+    def enable_index(self) -> None:
+        """
+        Turns on the value index, building it from the nodes already in the list
+        Values must be hashable while the index is enabled
+        :return: None
+        """
+        self._index = {}
+        self._prev = {}
+        prevNode = None
+        currNode = self.head
+        while currNode is not None:
+            self._index_add(currNode, prevNode)
+            prevNode = currNode
+            currNode = currNode.next
+
+    def disable_index(self) -> None:
+        """
+        Turns off the value index, lookups go back to scanning the list
+        :return: None
+        """
+        self._index = None
+        self._prev = None
+
+    def _linked(self, node: Node, prevNode: Node) -> None:
+        """
+        Bookkeeping for a node that was just linked into the list
+        Updates the node count, the running total and the value index
+        :param node: node that was just linked into the list
+        :param prevNode: node now in front of `node`, None if it is the head
+        :return: None
+        """
+        self._length += 1
+        if self._total_valid:
+            data = node.data
+            if self._length == 1:
+                self._total = data
+            # only types that can be subtracted back out are summed as we go
+            elif hasattr(type(data), '__sub__'):
+                try:
+                    self._total += data
+                except TypeError:
+                    self._total_valid = False
+            else:
+                self._total_valid = False
+        if self._index is not None:
+            self._index_add(node, prevNode)
+
+    def _unlinked(self, node: Node) -> None:
+        """
+        Bookkeeping for a node that is being removed from the list
+        Must run before `node.next` is cleared
+        :param node: node being removed from the list
+        :return: None
+        """
+        self._length -= 1
+        if self._length == 0:
+            self._total = None
+            self._total_valid = True
+        elif self._total_valid:
+            data = node.data
+            # only exact numbers subtract back out; a float total would drift
+            if isinstance(data, _EXACT_TOTALS) and isinstance(self._total, _EXACT_TOTALS):
+                try:
+                    self._total -= data
+                except TypeError:
+                    self._total_valid = False
+            else:
+                self._total_valid = False
+        if self._index is not None:
+            self._index_remove(node)
+
+    def _index_add(self, node: Node, prevNode: Node) -> None:
+        """
+        Records a newly linked node in the value index
+        SLLNode is unhashable (identity __eq__), so nodes are keyed by id
+        :param node: node that was just linked into the list
+        :param prevNode: node now in front of `node`, None if it is the head
+        :return: None
+        """
+        nodes = self._index.get(node.data)
+        if nodes is None:
+            nodes = self._index[node.data] = {}
+        nodes[id(node)] = node
+        self._prev[id(node)] = prevNode
+
+    def _index_remove(self, node: Node) -> None:
+        """
+        Drops a node that is being unlinked from the value index
+        :param node: node being removed, `node.next` still set
+        :return: None
+        """
+        nodes = self._index[node.data]
+        del nodes[id(node)]
+        # no occurrences left, forget the value entirely
+        if not nodes:
+            del self._index[node.data]
+        # the following node now hangs off whatever preceded this one
+        prevNode = self._prev.pop(id(node))
+        if node.next is not None:
+            self._prev[id(node.next)] = prevNode
+
+    def _recycle(self, node: Node) -> None:
+        """
+        Hands a fully unlinked node back to the pool, if the list has one
+        :param node: node that was removed from the list
+        :return: None
+        """
+        if self._pool is not None:
+            self._pool.release(node)
+
+    def _rotate_to(self, prevNode: Node, node: Node) -> None:
+        """
+        Makes `node` the head, moving the nodes before it behind the tail
+        :param prevNode: node in front of `node`, becomes the new tail
+        :param node: node that becomes the new head
+        :return: None
+        """
+        if self._prev is not None:
+            self._prev[id(self.head)] = self.tail
+            self._prev[id(node)] = None
+        # the old head will move to after the tail
+        self.tail.next = self.head
+        # prev node will be new tail
+        prevNode.next = None
+        self.tail = prevNode
+        # ally will be new head
+        self.head = node
+        # concatenation and float totals depend on order, exact ones don't
+        if not isinstance(self._total, _EXACT_TOTALS):
+            self._total_valid = False
+
     def append(self, data: T) -> None:
         """
         Append an SLLNode to the end of the SLL
         :param data: data to append
         :return: None
         """
-        newNode = SLLNode(data)
+        newNode = SLLNode(data) if self._pool is None else self._pool.acquire(data)
+        prevNode = self.tail
         # empty list
         if self.head is None:
             self.head = newNode
@@ -98,44 +631,256 @@ class SinglyLinkedList:
         else:
             self.tail.next = newNode
             self.tail = newNode
+        self._linked(newNode, prevNode)
         return
 
+    def extend(self, iterable: Iterable[T]) -> None:
+        """
+        Appends every value of `iterable` to the end of the SLL in one pass
+        Values are pulled one at a time, so generators are never materialized,
+        and `tail` is only set once at the end. The new nodes are chained off
+        to the side and spliced on afterwards, so extending a list from itself
+        (or a view of it) copies the values it held when the call started
+        :param iterable: values to append, in order
+        :return: None
+        """
+        anchor = SLLNode(None)
+        lastNode = anchor
+        count = 0
+        makeNode = SLLNode if self._pool is None else self._pool.acquire
+        for data in iterable:
+            newNode = makeNode(data)
+            lastNode.next = newNode
+            lastNode = newNode
+            count += 1
+        if count == 0:
+            return
+        firstNode = anchor.next
+        anchor.next = None
+        prevTail = None if self.head is None else self.tail
+        if prevTail is None:
+            self.head = firstNode
+        else:
+            prevTail.next = firstNode
+        self.tail = lastNode
+        self._length += count
+        # summed lazily by the next total() instead of inside the hot loop
+        self._total_valid = False
+        if self._index is not None:
+            prevNode = prevTail
+            currNode = firstNode
+            while currNode is not None:
+                self._index_add(currNode, prevNode)
+                prevNode = currNode
+                currNode = currNode.next
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T], indexed: bool = False) -> SLL:
+        """
+        Builds a new SLL holding the values of `iterable`, in order
+        :param iterable: values to store
+        :param indexed: if True, the new list keeps a value index
+        :return: new SLL
+        """
+        sll = cls(indexed=indexed)
+        sll.extend(iterable)
+        return sll
+
+    def save(self, path: str, chunk_size: int = 65536) -> None:
+        """
+        Writes the SLL to `path` in the compact binary format
+        Values are streamed out one block at a time, so at most `chunk_size`
+        of them are buffered no matter how long the list is. The blocks go to a
+        temporary file that only replaces `path` once every value was written,
+        so a rejected value leaves any existing file untouched
+        :param path: file to write
+        :param chunk_size: number of values per block
+        :return: None
+        """
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_SLL_MAGIC)
+                tags, ints, floats, strings = bytearray(), array('q'), array('d'), []
+                currNode = self.head
+                while currNode is not None:
+                    data = currNode.data
+                    kind = type(data)
+                    if kind is int:
+                        if not _INT64_MIN <= data <= _INT64_MAX:
+                            raise ValueError(f"can't save {data}, ints must fit in 64 bits")
+                        tags.append(_TAG_INT)
+                        ints.append(data)
+                    elif kind is float:
+                        tags.append(_TAG_FLOAT)
+                        floats.append(data)
+                    elif kind is str:
+                        tags.append(_TAG_STR)
+                        strings.append(data.encode('utf-8'))
+                    elif kind is bool:
+                        tags.append(_TAG_BOOL)
+                        ints.append(data)
+                    else:
+                        raise TypeError(f"can't save {kind.__name__} values, only int, float, str and bool")
+                    if len(tags) == chunk_size:
+                        self._write_block(f, tags, ints, floats, strings)
+                        tags, ints, floats, strings = bytearray(), array('q'), array('d'), []
+                    currNode = currNode.next
+                if tags:
+                    self._write_block(f, tags, ints, floats, strings)
+            # mkstemp makes the file owner-only, give it the mode a plain create would
+            os.chmod(tmp, 0o666 & ~_umask())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @staticmethod
+    def _write_block(f, tags: bytearray, ints: array, floats: array, strings: list) -> None:
+        """
+        Writes one block of the binary format
+        :param f: binary file open for writing
+        :param tags: type tag of each value, in list order
+        :param ints: int and bool column
+        :param floats: float column
+        :param strings: utf-8 encoded str column
+        :return: None
+        """
+        lengths = array('I', map(len, strings))
+        blob = b''.join(strings)
+        # the format is little-endian on disk
+        if sys.byteorder == 'big':
+            ints.byteswap()
+            floats.byteswap()
+            lengths.byteswap()
+        f.write(_SLL_BLOCK.pack(len(tags), len(ints), len(floats), len(strings), len(blob)))
+        f.write(tags)
+        f.write(ints.tobytes())
+        f.write(floats.tobytes())
+        f.write(lengths.tobytes())
+        f.write(blob)
+
+    @staticmethod
+    def iter_load(path: str) -> Iterator[T]:
+        """
+        Lazily yields the values stored in a binary SLL file, in list order
+        The file is memory-mapped and decoded one block at a time
+        :param path: file written by `save`
+        :return: generator of values
+        """
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                if view[:len(_SLL_MAGIC)] != _SLL_MAGIC:
+                    raise ValueError(f"{path} is not a binary SLL file")
+                offset = len(_SLL_MAGIC)
+                while offset < len(view):
+                    count, intCount, floatCount, strCount, blobSize = _SLL_BLOCK.unpack_from(view, offset)
+                    offset += _SLL_BLOCK.size
+                    tags = bytes(view[offset:offset + count])
+                    offset += count
+                    ints, floats, lengths = array('q'), array('d'), array('I')
+                    ints.frombytes(view[offset:offset + 8 * intCount])
+                    offset += 8 * intCount
+                    floats.frombytes(view[offset:offset + 8 * floatCount])
+                    offset += 8 * floatCount
+                    lengths.frombytes(view[offset:offset + 4 * strCount])
+                    offset += 4 * strCount
+                    if sys.byteorder == 'big':
+                        ints.byteswap()
+                        floats.byteswap()
+                        lengths.byteswap()
+                    # next unread position in each column
+                    intAt = floatAt = strAt = 0
+                    for tag in tags:
+                        if tag == _TAG_INT:
+                            yield ints[intAt]
+                            intAt += 1
+                        elif tag == _TAG_FLOAT:
+                            yield floats[floatAt]
+                            floatAt += 1
+                        elif tag == _TAG_STR:
+                            yield str(view[offset:offset + lengths[strAt]], 'utf-8')
+                            offset += lengths[strAt]
+                            strAt += 1
+                        else:
+                            yield bool(ints[intAt])
+                            intAt += 1
+            finally:
+                # the map can't close while a view of it is alive
+                view.release()
+
+    @classmethod
+    def load(cls, path: str, indexed: bool = False, pool: SLLNodePool = None) -> SLL:
+        """
+        Builds an SLL from a binary SLL file in one bulk pass
+        :param path: file written by `save`
+        :param indexed: if True, the new list keeps a value index
+        :param pool: if given, the new list draws its nodes from this pool
+        :return: new SLL
+        """
+        sll = cls(indexed=indexed, pool=pool)
+        sll.extend(cls.iter_load(path))
+        return sll
+
     def to_string(self) -> str:
         """
         Converts an SLL to a string
         :return: string representation of SLL
         """
+        # one join over the pieces keeps this linear, unlike repeated +=
+        return "".join(self.iter_string())
+
+    def iter_string(self, chunk_size: int = 1024) -> Iterator[str]:
+        """
+        Yields the string representation of the SLL piece by piece
+        Joining the pieces gives exactly `to_string()`
+        :param chunk_size: number of nodes rendered into each piece
+        :return: generator of string pieces
+        """
         if self.head is None:
-            return "None"
+            yield "None"
+            return
         currNode = self.head
-        # initializes string with head
-        SLLString = str(self.head.data)
-        # iterate through nodes
-        while currNode is not self.tail:
-            # iterate step first because we have head already
-            currNode = currNode.next
-            SLLString += " --> " + str(currNode.data)
-        return SLLString
+        first = True
+        while currNode is not None:
+            pieces = []
+            count = 0
+            # render up to chunk_size nodes at a time
+            while currNode is not None and count < chunk_size:
+                pieces.append(str(currNode.data))
+                currNode = currNode.next
+                count += 1
+            chunk = " --> ".join(pieces)
+            # later chunks need the separator that joins them to the last one
+            yield chunk if first else " --> " + chunk
+            first = False
+
+    def write_string(self, stream: TextIO, chunk_size: int = 1024) -> None:
+        """
+        Writes the string representation of the SLL to a file-like object
+        Only one chunk of the string is held in memory at a time
+        :param stream: object with a `write(str)` method
+        :param chunk_size: number of nodes rendered into each write
+        :return: None
+        """
+        for piece in self.iter_string(chunk_size):
+            stream.write(piece)
     def length(self) -> int:
         """
         Determines number of nodes in the list
         :return: number of nodes in list
         """
-        count = 0
-        currNode = self.head
-        # increments count on every step
-        while currNode is not None:
-            count += 1
-            currNode = currNode.next
-        return count
+        return self._length
 
     def total(self) -> T:
         """
         Sums up the values in the list
         :return: total sum of values in the list
         """
-        if self.head is None:
-            return None
+        if self._total_valid:
+            return self._total
+        # running total was dropped for values that can't be subtracted
         sum = self.head.data
         currNode = self.head
         # add data to sum on each step through the SLL
@@ -143,6 +888,8 @@ class SinglyLinkedList:
             currNode = currNode.next
             if currNode is not None:
                 sum += currNode.data
+        self._total = sum
+        self._total_valid = True
         return sum
 
     def delete(self, data: T) -> bool:
@@ -154,7 +901,15 @@ class SinglyLinkedList:
         # edge cases
         if self.head is None:
             return False
+        # index says there is nothing to delete
+        elif self._index is not None and data not in self._index:
+            return False
         elif self.head == self.tail:
+            # only node holds something else
+            if self.head.data != data:
+                return False
+            self._unlinked(self.head)
+            self._recycle(self.head)
             self.head = self.tail = None
             return True
 
@@ -163,6 +918,7 @@ class SinglyLinkedList:
         while currNode is not None:
             # this is the one we want
             if currNode.data == data:
+                self._unlinked(currNode)
                 # if head, we need to establish new head
                 if currNode == self.head:
                     self.head = currNode.next
@@ -175,6 +931,7 @@ class SinglyLinkedList:
                 else:
                     # last node points to one after deleted
                     prevNode.next = currNode.next
+                self._recycle(currNode)
                 return True
             # step right one node
             prevNode = currNode
@@ -194,7 +951,15 @@ class SinglyLinkedList:
         # edge cases
         if self.head is None:
             return False
+        # index says there is nothing to delete
+        elif self._index is not None and data not in self._index:
+            return False
         elif self.head == self.tail:
+            # only node holds something else
+            if self.head.data != data:
+                return False
+            self._unlinked(self.head)
+            self._recycle(self.head)
             self.head = self.tail = None
             return True
         currNode = self.head
@@ -204,17 +969,26 @@ class SinglyLinkedList:
         while currNode is not None:
             # the one we want
             if currNode.data == data:
+                self._unlinked(currNode)
                 # same logic as delete
                 if currNode == self.head:
                     self.head = currNode.next
+                    # that was the last node left
+                    if self.head is None:
+                        self.tail = None
                     currNode.next = None
+                    self._recycle(currNode)
                     currNode = self.head
                 elif currNode == self.tail:
                     prevNode.next = None
                     self.tail = prevNode
+                    self._recycle(currNode)
+                    # nothing left past the old tail
+                    currNode = None
                 else:
                     prevNode.next = currNode.next
                     currNode.next = None
+                    self._recycle(currNode)
                     currNode = prevNode.next
                 removedAny = True
             else:
@@ -222,12 +996,61 @@ class SinglyLinkedList:
                 currNode = currNode.next
         return removedAny
 
+    def delete_many(self, values: Set[T]) -> int:
+        """
+        Deletes every node whose data is in `values`, in a single pass
+        :param values: set of data to remove
+        :return: number of nodes removed
+        """
+        # index says none of the values are present
+        if self._index is not None and not any(value in self._index for value in values):
+            return 0
+        return self._delete_matching(values.__contains__)
+
+    def delete_if(self, predicate: Callable[[T], bool]) -> int:
+        """
+        Deletes every node whose data satisfies `predicate`, in a single pass
+        :param predicate: called with each node's data, True means remove
+        :return: number of nodes removed
+        """
+        return self._delete_matching(predicate)
+
+    def _delete_matching(self, match: Callable[[T], bool]) -> int:
+        """
+        Unlinks every node whose data `match` accepts, then fixes up `tail`
+        :param match: called with each node's data, True means remove
+        :return: number of nodes removed
+        """
+        removed = 0
+        prevNode = None
+        currNode = self.head
+        while currNode is not None:
+            nextNode = currNode.next
+            if match(currNode.data):
+                # if head, the next node becomes head
+                if prevNode is None:
+                    self.head = nextNode
+                else:
+                    prevNode.next = nextNode
+                self._unlinked(currNode)
+                currNode.next = None
+                self._recycle(currNode)
+                removed += 1
+            else:
+                prevNode = currNode
+            currNode = nextNode
+        # last surviving node is the tail, None if everything went
+        self.tail = prevNode
+        return removed
+
     def find(self, data: T) -> bool:
         """
         Looks through the SLL for a node containing `data`
         :param data: data to search for
         :return: True if found, else False
         """
+        if self._index is not None:
+            return data in self._index
         currNode = self.head
         while currNode is not None:
             if currNode.data == data:
@@ -241,6 +1064,9 @@ class SinglyLinkedList:
         :param data: data to find and sum up
         :return: number of times the data occurred
         """
+        if self._index is not None:
+            nodes = self._index.get(data)
+            return 0 if nodes is None else len(nodes)
         count = 0
         currNode = self.head
         while currNode is not None:
@@ -257,6 +1083,23 @@ def help_mario(roster: SLL, ally: str) -> bool:
     :param roster: initial order of racers
     :param ally: the racer that needs to go first
     :return: True if the roster was changed, else False
+
+    Rotating the roster never changes which values it holds, so an indexed
+    roster's value index stays current without any upkeep here
+    """
+    # engines with their own storage layout rotate it themselves
+    rotate = getattr(roster, '_help_mario', None)
+    if rotate is not None:
+        return rotate(ally)
+    return _help_mario_nodes(roster, ally)
+
+
+def _help_mario_nodes(roster: SLL, ally: str) -> bool:
+    """
+    `help_mario` for node-based SLLs
+    :param roster: initial order of racers
+    :param ally: the racer that needs to go first
+    :return: True if the roster was changed, else False
     """
     prevNode = None
     currNode = roster.head
@@ -266,16 +1109,1609 @@ def help_mario(roster: SLL, ally: str) -> bool:
     # no need for change
     if roster.head.data == ally:
         return False
+    if roster._index is not None:
+        nodes = roster._index.get(ally)
+        # indexed roster without the ally needs no scan
+        if nodes is None:
+            return False
+        # a unique ally is its own first occurrence, no scan needed
+        if len(nodes) == 1:
+            currNode = next(iter(nodes.values()))
+            roster._rotate_to(roster._prev[id(currNode)], currNode)
+            return True
     while currNode is not None:
         if currNode.data == ally:
-            # the old head will move to after the tail
-            roster.tail.next = roster.head
-            # prev node will be new tail
-            prevNode.next = None
-            roster.tail = prevNode
-            # ally will be new head
-            roster.head = currNode
+            roster._rotate_to(prevNode, currNode)
             return True
         prevNode = currNode
         currNode = currNode.next
-    return False
\ No newline at end of file
+    return False
+
+
+def help_mario_batch(roster: SLL, allies: Iterable[str]) -> List[bool]:
+    """
+    Applies `help_mario` for each ally in turn, but rotates the roster only once
+    Every promotion is a rotation, so the flags can be worked out against a
+    moving virtual head and the pointers fixed up for the final head alone
+    :param roster: initial order of racers
+    :param allies: racers to move to the front, in order
+    :return: what `help_mario` would have returned for each ally
+    """
+    allies = list(allies)
+    # engines with their own storage layout rotate it themselves; looked up on
+    # the plain class so an instrumented node list keeps the single rotation
+    engine = getattr(type(roster), '_plain', None) or type(roster)
+    rotate = getattr(engine, '_help_mario', None)
+    if rotate is not None:
+        return [rotate(roster, ally) for ally in allies]
+    # edge cases
+    if roster.head is None or roster.head == roster.tail:
+        return [False] * len(allies)
+    changed = []
+    headNode, prevNode = roster.head, None
+    index = roster._index
+    if index is not None and all(len(index.get(ally, ())) <= 1 for ally in allies):
+        # every ally is unique, the index hands over its node directly
+        for ally in allies:
+            nodes = index.get(ally)
+            allyNode = None if nodes is None else next(iter(nodes.values()))
+            if allyNode is None or allyNode is headNode:
+                changed.append(False)
+            else:
+                changed.append(True)
+                headNode = allyNode
+        prevNode = roster._prev[id(headNode)]
+    else:
+        # one scan records where each ally occurs, in list order
+        wanted = set(allies)
+        positions = {}
+        occurrences = {}
+        position = 0
+        scanPrev, currNode = None, roster.head
+        while currNode is not None:
+            if currNode.data in wanted:
+                positions.setdefault(currNode.data, []).append(position)
+                occurrences.setdefault(currNode.data, []).append((scanPrev, currNode))
+            scanPrev = currNode
+            currNode = currNode.next
+            position += 1
+        headPosition = 0
+        for ally in allies:
+            allyPositions = positions.get(ally)
+            if allyPositions is None:
+                changed.append(False)
+                continue
+            # first occurrence at or after the virtual head, wrapping around
+            i = bisect_left(allyPositions, headPosition)
+            if i == len(allyPositions):
+                i = 0
+            if allyPositions[i] == headPosition:
+                changed.append(False)
+            else:
+                changed.append(True)
+                headPosition = allyPositions[i]
+                prevNode, headNode = occurrences[ally][i]
+    if headNode is not roster.head:
+        roster._rotate_to(prevNode, headNode)
+    return changed
+
+
+class CompactSinglyLinkedList:
+    """
+    SLL implementation backed by parallel arrays instead of SLLNode objects
+    Slot i holds its value in `_data[i]` and the slot of the next value in `_next[i]`,
+    with -1 standing in for None. Deleted slots are chained into a free list through
+    `_next` and handed out again by `append`; `compact` squeezes them out.
+    """
+
+    __slots__ = ['_data', '_next', '_head', '_tail', '_free', '_length']
+
+    # marks an unused slot in `_data`, never == to user data
+    _FREE = object()
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty compact SLL
+        return: None
+        """
+        self._data = []
+        self._next = array('q')
+        self._head = self._tail = -1
+        # first slot of the free list, -1 if there are no free slots
+        self._free = -1
+        self._length = 0
+
+    def __repr__(self) -> str:
+        """
+        Represents a compact SLL as a string
+        :return: string representation of SLL
+        """
+        return self.to_string()
+
+    def __eq__(self, other: SLL) -> bool:
+        """
+        Overloads `==` operator to compare compact SLLs
+        Mirrors SLLNode identity semantics: slots are never shared between lists,
+        so only the same list or two empty lists are equal
+        :param other: right operand of `==`
+        :return: True if equal, else False
+        """
+        return self is other or (self._head == -1 and other._head == -1)
+
+    def _alloc(self, data: T) -> int:
+        """
+        Hands out a slot holding `data`, reusing a freed slot when there is one
+        :param data: value to store
+        :return: index of the slot
+        """
+        slot = self._free
+        if slot == -1:
+            slot = len(self._data)
+            self._data.append(data)
+            self._next.append(-1)
+        else:
+            self._free = self._next[slot]
+            self._data[slot] = data
+            self._next[slot] = -1
+        return slot
+
+    def _release(self, slot: int) -> None:
+        """
+        Pushes an unlinked slot onto the free list
+        :param slot: index of the slot to free
+        :return: None
+        """
+        # drop the reference so the value can be collected
+        self._data[slot] = self._FREE
+        self._next[slot] = self._free
+        self._free = slot
+        self._length -= 1
+
+    def append(self, data: T) -> None:
+        """
+        Append a value to the end of the SLL
+        :param data: data to append
+        :return: None
+        """
+        slot = self._alloc(data)
+        # empty list
+        if self._head == -1:
+            self._head = slot
+        # end of nonempty list
+        else:
+            self._next[self._tail] = slot
+        self._tail = slot
+        self._length += 1
+
+    def to_string(self) -> str:
+        """
+        Converts a compact SLL to a string
+        :return: string representation of SLL
+        """
+        if self._head == -1:
+            return "None"
+        data, nxt = self._data, self._next
+        pieces = []
+        slot = self._head
+        while slot != -1:
+            pieces.append(str(data[slot]))
+            slot = nxt[slot]
+        return " --> ".join(pieces)
+
+    def length(self) -> int:
+        """
+        Determines number of values in the list
+        :return: number of values in list
+        """
+        return self._length
+
+    def total(self) -> T:
+        """
+        Sums up the values in the list, in list order
+        :return: total sum of values in the list
+        """
+        if self._head == -1:
+            return None
+        data, nxt = self._data, self._next
+        sum = data[self._head]
+        slot = nxt[self._head]
+        while slot != -1:
+            sum += data[slot]
+            slot = nxt[slot]
+        return sum
+
+    def delete(self, data: T) -> bool:
+        """
+        Deletes the first occurrence of `data` from the SLL
+        :param data: data to remove
+        :return: True if a value was removed, else False
+        """
+        values, nxt = self._data, self._next
+        prev = -1
+        slot = self._head
+        while slot != -1:
+            if values[slot] == data:
+                # if head, the next slot becomes head
+                if prev == -1:
+                    self._head = nxt[slot]
+                else:
+                    nxt[prev] = nxt[slot]
+                # if tail, the previous slot becomes tail
+                if slot == self._tail:
+                    self._tail = prev
+                self._release(slot)
+                return True
+            prev = slot
+            slot = nxt[slot]
+        return False
+
+    def delete_all(self, data: T) -> bool:
+        """
+        Deletes all occurrences of `data` from the SLL in one pass
+        :param data: data to remove
+        :return: True if a value was removed, else False
+        """
+        values, nxt = self._data, self._next
+        removedAny = False
+        prev = -1
+        slot = self._head
+        while slot != -1:
+            following = nxt[slot]
+            if values[slot] == data:
+                if prev == -1:
+                    self._head = following
+                else:
+                    nxt[prev] = following
+                if slot == self._tail:
+                    self._tail = prev
+                self._release(slot)
+                removedAny = True
+            else:
+                prev = slot
+            slot = following
+        return removedAny
+
+    def find(self, data: T) -> bool:
+        """
+        Looks through the SLL for `data`
+        Live values sit in one flat list, so a miss is a single C-level scan;
+        `in` also accepts the very same object (NaN) and may match `_FREE`, so
+        a hit is confirmed with `==` over the live slots
+        :param data: data to search for
+        :return: True if found, else False
+        """
+        if data not in self._data:
+            return False
+        free = self._FREE
+        return any(value == data for value in self._data if value is not free)
+
+    def find_sum(self, data: T) -> int:
+        """
+        Returns the number of occurrences of `data` in this list
+        :param data: data to find and sum up
+        :return: number of times the data occurred
+        """
+        # same fast miss and exact recount as `find`
+        if data not in self._data:
+            return 0
+        free = self._FREE
+        return sum(1 for value in self._data if value is not free and value == data)
+
+    def compact(self) -> None:
+        """
+        Rewrites the arrays in list order, dropping every free slot
+        :return: None
+        """
+        data, nxt = self._data, self._next
+        packed = []
+        slot = self._head
+        while slot != -1:
+            packed.append(data[slot])
+            slot = nxt[slot]
+        # slot i is followed by slot i + 1, the last one by nothing
+        self._data = packed
+        self._next = array('q', range(1, len(packed) + 1))
+        self._free = -1
+        if packed:
+            self._next[-1] = -1
+            self._head, self._tail = 0, len(packed) - 1
+        else:
+            self._head = self._tail = -1
+
+    def _help_mario(self, ally: str) -> bool:
+        """
+        Rotates the list so the first occurrence of `ally` comes first,
+        behaves exactly like `help_mario` on a node-based SLL
+        :param ally: the racer that needs to go first
+        :return: True if the roster was changed, else False
+        """
+        values, nxt = self._data, self._next
+        # edge cases
+        if self._head == self._tail or values[self._head] == ally:
+            return False
+        prev = self._head
+        slot = nxt[prev]
+        while slot != -1:
+            if values[slot] == ally:
+                # old head follows the old tail, prev becomes the new tail
+                nxt[self._tail] = self._head
+                nxt[prev] = -1
+                self._tail = prev
+                self._head = slot
+                return True
+            prev = slot
+            slot = nxt[slot]
+        return False
+
+
+def _equal_at(values: list, data: T) -> int:
+    """
+    Position of the first value `==` to `data`
+    Unlike `list.index` and `in` there is no identity shortcut, so NaN and
+    custom `__eq__` match exactly as they do on the node-based SLL
+    :param values: values to search
+    :param data: data to search for
+    :return: position of the first match, -1 if there is none
+    """
+    for position, value in enumerate(values):
+        if value == data:
+            return position
+    return -1
+
+
+class SLLBlock:
+    """
+    Node of an unrolled SLL, holds a small run of values instead of just one
+    """
+
+    __slots__ = ['values', 'next']
+
+    def __init__(self, values: list, next: 'SLLBlock' = None) -> None:
+        """
+        Initialize an SLL block
+        :param values: values held by the block, in order
+        :param next: reference to the next block in the list
+        :return: None
+        """
+        self.values = values
+        self.next = next
+
+    def __repr__(self) -> str:
+        """
+        Overloads `repr()` method for use in debugging
+        :return: string representation of block
+        """
+        return '(Block: ' + str(self.values) + ' )'
+
+
+class UnrolledSinglyLinkedList:
+    """
+    SLL implementation where each node holds up to `capacity` values
+    Scans run over short Python lists instead of chasing one node per value.
+    Blocks are never left empty; underfull blocks are merged with their
+    successor on delete, and help_mario splits a block to put the ally first.
+    """
+
+    __slots__ = ['head', 'tail', 'capacity', '_length']
+
+    def __init__(self, capacity: int = 64) -> None:
+        """
+        Initializes an empty unrolled SLL
+        :param capacity: maximum number of values per block
+        return: None
+        """
+        if capacity < 2:
+            raise ValueError("block capacity must be at least 2")
+        self.head = None
+        self.tail = None
+        self.capacity = capacity
+        self._length = 0
+
+    def __repr__(self) -> str:
+        """
+        Represents an unrolled SLL as a string
+        :return: string representation of SLL
+        """
+        return self.to_string()
+
+    def __eq__(self, other: SLL) -> bool:
+        """
+        Overloads `==` operator to compare unrolled SLLs
+        Mirrors SLLNode identity semantics: lists are equal when they share
+        their first block, or are both empty
+        :param other: right operand of `==`
+        :return: True if equal, else False
+        """
+        return self.head is other.head
+
+    def append(self, data: T) -> None:
+        """
+        Append a value to the end of the SLL, opening a new block when the tail is full
+        :param data: data to append
+        :return: None
+        """
+        # empty list
+        if self.tail is None:
+            self.head = self.tail = SLLBlock([data])
+        # tail block is full
+        elif len(self.tail.values) >= self.capacity:
+            newBlock = SLLBlock([data])
+            self.tail.next = newBlock
+            self.tail = newBlock
+        else:
+            self.tail.values.append(data)
+        self._length += 1
+
+    def to_string(self) -> str:
+        """
+        Converts an unrolled SLL to a string
+        :return: string representation of SLL
+        """
+        if self.head is None:
+            return "None"
+        pieces = []
+        currBlock = self.head
+        while currBlock is not None:
+            pieces.extend(map(str, currBlock.values))
+            currBlock = currBlock.next
+        return " --> ".join(pieces)
+
+    def length(self) -> int:
+        """
+        Determines number of values in the list
+        :return: number of values in list
+        """
+        return self._length
+
+    def total(self) -> T:
+        """
+        Sums up the values in the list, in list order
+        :return: total sum of values in the list
+        """
+        if self.head is None:
+            return None
+        first = True
+        currBlock = self.head
+        while currBlock is not None:
+            for value in currBlock.values:
+                if first:
+                    sum = value
+                    first = False
+                else:
+                    sum += value
+            currBlock = currBlock.next
+        return sum
+
+    def _unlink_block(self, prevBlock: SLLBlock, block: SLLBlock) -> None:
+        """
+        Removes an emptied block from the chain
+        :param prevBlock: block before `block`, None if `block` is the head
+        :param block: block to remove
+        :return: None
+        """
+        if prevBlock is None:
+            self.head = block.next
+        else:
+            prevBlock.next = block.next
+        if block is self.tail:
+            self.tail = prevBlock
+        block.next = None
+
+    def _merge_next(self, block: SLLBlock) -> None:
+        """
+        Folds the following block into `block` when both fit in one
+        Keeps blocks at least half full after deletes
+        :param block: block that just shrank
+        :return: None
+        """
+        nextBlock = block.next
+        if nextBlock is not None and len(block.values) + len(nextBlock.values) <= self.capacity:
+            block.values.extend(nextBlock.values)
+            block.next = nextBlock.next
+            if nextBlock is self.tail:
+                self.tail = block
+
+    def delete(self, data: T) -> bool:
+        """
+        Deletes the first occurrence of `data` from the SLL
+        :param data: data to remove
+        :return: True if a value was removed, else False
+        """
+        prevBlock = None
+        currBlock = self.head
+        while currBlock is not None:
+            values = currBlock.values
+            position = _equal_at(values, data)
+            if position != -1:
+                del values[position]
+                self._length -= 1
+                if not values:
+                    self._unlink_block(prevBlock, currBlock)
+                elif len(values) <= self.capacity // 2:
+                    self._merge_next(currBlock)
+                return True
+            prevBlock = currBlock
+            currBlock = currBlock.next
+        return False
+
+    def delete_all(self, data: T) -> bool:
+        """
+        Deletes all occurrences of `data` from the SLL in one pass
+        :param data: data to remove
+        :return: True if a value was removed, else False
+        """
+        removedAny = False
+        prevBlock = None
+        currBlock = self.head
+        while currBlock is not None:
+            values = currBlock.values
+            kept = [value for value in values if not value == data]
+            if len(kept) < len(values):
+                self._length -= len(values) - len(kept)
+                removedAny = True
+                if not kept:
+                    nextBlock = currBlock.next
+                    self._unlink_block(prevBlock, currBlock)
+                    currBlock = nextBlock
+                    continue
+                currBlock.values = kept
+                if len(kept) <= self.capacity // 2:
+                    nextBlock = currBlock.next
+                    self._merge_next(currBlock)
+                    # merged-in values haven't been checked yet
+                    if currBlock.next is not nextBlock:
+                        continue
+            prevBlock = currBlock
+            currBlock = currBlock.next
+        return removedAny
+
+    def find(self, data: T) -> bool:
+        """
+        Looks through the SLL for `data`
+        :param data: data to search for
+        :return: True if found, else False
+        """
+        currBlock = self.head
+        while currBlock is not None:
+            if _equal_at(currBlock.values, data) != -1:
+                return True
+            currBlock = currBlock.next
+        return False
+
+    def find_sum(self, data: T) -> int:
+        """
+        Returns the number of occurrences of `data` in this list
+        :param data: data to find and sum up
+        :return: number of times the data occurred
+        """
+        count = 0
+        currBlock = self.head
+        while currBlock is not None:
+            count += sum(1 for value in currBlock.values if value == data)
+            currBlock = currBlock.next
+        return count
+
+    def _help_mario(self, ally: str) -> bool:
+        """
+        Rotates the list so the first occurrence of `ally` comes first,
+        behaves exactly like `help_mario` on a node-based SLL
+        :param ally: the racer that needs to go first
+        :return: True if the roster was changed, else False
+        """
+        # edge cases
+        if self._length < 2 or self.head.values[0] == ally:
+            return False
+        prevBlock = None
+        currBlock = self.head
+        while currBlock is not None:
+            values = currBlock.values
+            position = _equal_at(values, ally)
+            if position != -1:
+                # split so the ally starts its own block
+                if position > 0:
+                    allyBlock = SLLBlock(values[position:], currBlock.next)
+                    del values[position:]
+                    currBlock.next = allyBlock
+                    if currBlock is self.tail:
+                        self.tail = allyBlock
+                    prevBlock, currBlock = currBlock, allyBlock
+                # same rotation as the node-based version, one block at a time
+                self.tail.next = self.head
+                prevBlock.next = None
+                self.tail = prevBlock
+                self.head = currBlock
+                return True
+            prevBlock = currBlock
+            currBlock = currBlock.next
+        return False
+
+
+class NumericSinglyLinkedList(CompactSinglyLinkedList):
+    """
+    Compact SLL that keeps int or float values in a contiguous NumPy buffer
+    `total`, `find` and `find_sum` run as vectorized reductions over the live
+    slots. The first value that doesn't fit the buffer (another type, a bool,
+    an int outside int64) moves the list back to the plain object path, as
+    does a missing NumPy install, so callers never need to check the data.
+    """
+
+    __slots__ = ['_numeric', '_kind', '_used', '_live']
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty numeric SLL
+        return: None
+        """
+        super().__init__()
+        self._numeric = np is not None
+        # Python type stored in the buffer, fixed by the first value
+        self._kind = None
+        self._used = 0
+        # which buffer slots hold list values, None while on the object path
+        self._live = None
+
+    def _accepts(self, data: T) -> bool:
+        """
+        Checks whether `data` can go in the NumPy buffer, creating it on first use
+        :param data: value about to be appended
+        :return: True if the buffer can hold `data` exactly
+        """
+        kind = type(data)
+        if self._kind is None:
+            if kind is not int and kind is not float:
+                return False
+            self._kind = kind
+            self._data = np.zeros(16, dtype=np.int64 if kind is int else np.float64)
+            self._live = np.zeros(16, dtype=bool)
+        if kind is not self._kind:
+            return False
+        return kind is float or -2 ** 63 <= data < 2 ** 63
+
+    def _to_objects(self) -> None:
+        """
+        Moves the values out of the NumPy buffer and onto the object path for good
+        :return: None
+        """
+        if self._live is not None:
+            values = self._data[:self._used].tolist()
+            live = self._live[:self._used].tolist()
+            self._data = [value if alive else self._FREE for value, alive in zip(values, live)]
+            self._live = None
+        self._numeric = False
+
+    def _alloc(self, data: T) -> int:
+        """
+        Hands out a buffer slot holding `data`, reusing a freed slot when there is one
+        :param data: value to store
+        :return: index of the slot
+        """
+        if self._live is None:
+            return super()._alloc(data)
+        slot = self._free
+        if slot == -1:
+            slot = self._used
+            # double the buffer when it fills up
+            if slot == len(self._data):
+                self._data = np.concatenate((self._data, np.zeros_like(self._data)))
+                self._live = np.concatenate((self._live, np.zeros_like(self._live)))
+            self._used += 1
+            self._next.append(-1)
+        else:
+            self._free = self._next[slot]
+            self._next[slot] = -1
+        self._data[slot] = data
+        self._live[slot] = True
+        return slot
+
+    def _release(self, slot: int) -> None:
+        """
+        Pushes an unlinked slot onto the free list
+        :param slot: index of the slot to free
+        :return: None
+        """
+        if self._live is None:
+            return super()._release(slot)
+        self._live[slot] = False
+        self._data[slot] = 0
+        self._next[slot] = self._free
+        self._free = slot
+        self._length -= 1
+
+    def _live_values(self):
+        """
+        :return: NumPy array of the values currently in the list, in slot order
+        """
+        return self._data[:self._used][self._live[:self._used]]
+
+    def append(self, data: T) -> None:
+        """
+        Append a value to the end of the SLL
+        :param data: data to append
+        :return: None
+        """
+        if self._numeric and not self._accepts(data):
+            self._to_objects()
+        super().append(data)
+
+    def to_string(self) -> str:
+        """
+        Converts a numeric SLL to a string
+        :return: string representation of SLL
+        """
+        if self._live is None or self._head == -1:
+            return super().to_string()
+        # plain Python numbers print the same way the node-based list does
+        values, nxt = self._data.tolist(), self._next
+        pieces = []
+        slot = self._head
+        while slot != -1:
+            pieces.append(str(values[slot]))
+            slot = nxt[slot]
+        return " --> ".join(pieces)
+
+    def total(self) -> T:
+        """
+        Sums up the values in the list with one vectorized reduction
+        Float sums may differ from a left-to-right sum in the last bits
+        :return: total sum of values in the list
+        """
+        if self._live is None or self._head == -1:
+            return super().total()
+        values = self._live_values()
+        # int64 could wrap, let Python's unbounded ints take over
+        if self._kind is int and max(-int(values.min()), int(values.max())) * len(values) >= 2 ** 63:
+            return sum(values.tolist())
+        return values.sum().item()
+
+    def _matches(self, data: T):
+        """
+        Vectorized `==` of every live value against `data`
+        :param data: value to compare against
+        :return: boolean NumPy array over the used slots, None if NumPy can't compare `data`
+        """
+        if self._live is None or not isinstance(data, (int, float)):
+            return None
+        # mixed int/float compares go through float64, where ints from 2**53 on
+        # can round onto a neighbouring value
+        if (self._data.dtype.kind == 'f') != isinstance(data, float) and abs(data) >= _FLOAT_EXACT:
+            return None
+        try:
+            return (self._data[:self._used] == data) & self._live[:self._used]
+        except (OverflowError, TypeError):
+            return None
+
+    def find(self, data: T) -> bool:
+        """
+        Looks through the SLL for `data`
+        :param data: data to search for
+        :return: True if found, else False
+        """
+        if self._live is None:
+            return super().find(data)
+        matches = self._matches(data)
+        if matches is None:
+            return any(value == data for value in self._live_values().tolist())
+        return bool(matches.any())
+
+    def find_sum(self, data: T) -> int:
+        """
+        Returns the number of occurrences of `data` in this list
+        :param data: data to find and sum up
+        :return: number of times the data occurred
+        """
+        if self._live is None:
+            return super().find_sum(data)
+        matches = self._matches(data)
+        if matches is None:
+            return sum(1 for value in self._live_values().tolist() if value == data)
+        return int(np.count_nonzero(matches))
+
+    def delete(self, data: T) -> bool:
+        """
+        Deletes the first occurrence of `data` from the SLL
+        :param data: data to remove
+        :return: True if a value was removed, else False
+        """
+        # vectorized check spares the walk when there is nothing to delete
+        if self._live is not None and not self.find(data):
+            return False
+        return super().delete(data)
+
+    def delete_all(self, data: T) -> bool:
+        """
+        Deletes all occurrences of `data` from the SLL in one pass
+        :param data: data to remove
+        :return: True if a value was removed, else False
+        """
+        if self._live is not None and not self.find(data):
+            return False
+        return super().delete_all(data)
+
+    def compact(self) -> None:
+        """
+        Rewrites the buffer in list order, dropping every free slot
+        :return: None
+        """
+        if self._live is None:
+            return super().compact()
+        nxt = self._next
+        order = []
+        slot = self._head
+        while slot != -1:
+            order.append(slot)
+            slot = nxt[slot]
+        count = len(order)
+        self._data = self._data[order] if count else np.zeros(16, dtype=self._data.dtype)
+        self._live = np.ones(len(self._data), dtype=bool)
+        self._live[count:] = False
+        self._used = count
+        self._next = array('q', range(1, count + 1))
+        self._free = -1
+        if count:
+            self._next[-1] = -1
+            self._head, self._tail = 0, count - 1
+        else:
+            self._head = self._tail = -1
+
+    def _help_mario(self, ally: str) -> bool:
+        """
+        Rotates the list so the first occurrence of `ally` comes first
+        :param ally: the racer that needs to go first
+        :return: True if the roster was changed, else False
+        """
+        if self._live is not None and not self.find(ally):
+            return False
+        return super()._help_mario(ally)
+
+
+class ConcurrentSinglyLinkedList(SinglyLinkedList):
+    """
+    SLL that many threads can append to while others read it
+    Writers serialize on one lock, held only for the tail swap and bookkeeping;
+    a writer finding it taken yields up to `_SPINS` times before blocking.
+    Readers (`find`, `find_sum`, iteration, `to_string`) never lock; alongside
+    appends they see a consistent prefix of the list, relying only on atomic
+    attribute loads and stores. Deletes and `help_mario` take the lock too, but
+    a reader running across a delete may stop early at the cut `next`, and one
+    running across a rotation may walk the nodes before the ally twice, so its
+    counts are off. Node pools aren't supported
+    """
+
+    __slots__ = ['_lock', '_acquisitions', '_contended', '_waited']
+
+    _SPINS = 100
+
+    def __init__(self, indexed: bool = False, pool: SLLNodePool = None) -> None:
+        """
+        Initializes a concurrent SLL
+        :param indexed: if True, keep a value index so `find` and `find_sum` run in O(1)
+        :param pool: must be None, accepted so the base class constructors work
+        return: None
+        """
+        if pool is not None:
+            raise ValueError("concurrent lists can't use a node pool")
+        super().__init__(indexed=indexed)
+        self._lock = threading.Lock()
+        # lock statistics, only updated while holding the lock
+        self._acquisitions = 0
+        self._contended = 0
+        self._waited = 0.0
+
+    def _acquire(self) -> None:
+        """
+        Takes the writer lock, recording whether another thread held it
+        Yields to the holder a bounded number of times before blocking on it
+        :return: None
+        """
+        if not self._lock.acquire(blocking=False):
+            start = time.perf_counter()
+            for _ in range(self._SPINS):
+                time.sleep(0)
+                if self._lock.acquire(blocking=False):
+                    break
+            else:
+                self._lock.acquire()
+            self._contended += 1
+            self._waited += time.perf_counter() - start
+        self._acquisitions += 1
+
+    def contention(self) -> dict:
+        """
+        Snapshot of the writer lock statistics
+        :return: dict with acquisitions, contended (acquires that had to wait),
+            contention_rate and wait_seconds
+        """
+        acquisitions = self._acquisitions
+        return {'acquisitions': acquisitions, 'contended': self._contended,
+                'contention_rate': self._contended / acquisitions if acquisitions else 0.0,
+                'wait_seconds': self._waited}
+
+    def append(self, data: T) -> None:
+        """
+        Append an SLLNode to the end of the SLL, safe to call from many threads
+        :param data: data to append
+        :return: None
+        """
+        newNode = SLLNode(data)
+        self._acquire()
+        try:
+            prevNode = self.tail
+            if prevNode is None:
+                self.head = newNode
+            else:
+                prevNode.next = newNode
+            self.tail = newNode
+            self._linked(newNode, prevNode)
+        finally:
+            self._lock.release()
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        """
+        Appends every value of `iterable` as one contiguous run
+        The chain is built without the lock and spliced on in one step
+        :param iterable: values to append, in order
+        :return: None
+        """
+        anchor = SLLNode(None)
+        lastNode = anchor
+        count = 0
+        for data in iterable:
+            newNode = SLLNode(data)
+            lastNode.next = newNode
+            lastNode = newNode
+            count += 1
+        if count == 0:
+            return
+        firstNode = anchor.next
+        self._acquire()
+        try:
+            prevTail = None if self.head is None else self.tail
+            if prevTail is None:
+                self.head = firstNode
+            else:
+                prevTail.next = firstNode
+            self.tail = lastNode
+            self._length += count
+            self._total_valid = False
+            if self._index is not None:
+                prevNode = prevTail
+                currNode = firstNode
+                while currNode is not None:
+                    self._index_add(currNode, prevNode)
+                    prevNode = currNode
+                    currNode = currNode.next
+        finally:
+            self._lock.release()
+
+    def total(self) -> T:
+        """
+        Sums up the values in the list
+        The running total is read without locking; a recompute takes the lock
+        :return: total sum of values in the list
+        """
+        if self._total_valid:
+            return self._total
+        self._acquire()
+        try:
+            return super().total()
+        finally:
+            self._lock.release()
+
+    def delete(self, data: T) -> bool:
+        """
+        Deletes the first node containing `data` from the SLL
+        :param data: data to remove
+        :return: True if a node was removed, else False
+        """
+        self._acquire()
+        try:
+            return super().delete(data)
+        finally:
+            self._lock.release()
+
+    def delete_all(self, data: T) -> bool:
+        """
+        Deletes all instances of a node containing `data` from the SLL
+        :param data: data to remove
+        :return: True if a node was removed, else False
+        """
+        self._acquire()
+        try:
+            return super().delete_all(data)
+        finally:
+            self._lock.release()
+
+    def _delete_matching(self, match: Callable[[T], bool]) -> int:
+        """
+        Unlinks every node whose data `match` accepts, under the writer lock
+        Backs both `delete_many` and `delete_if`
+        :param match: called with each node's data, True means remove
+        :return: number of nodes removed
+        """
+        self._acquire()
+        try:
+            return super()._delete_matching(match)
+        finally:
+            self._lock.release()
+
+    def enable_index(self) -> None:
+        """
+        Turns on the value index, building it under the writer lock
+        :return: None
+        """
+        self._acquire()
+        try:
+            super().enable_index()
+        finally:
+            self._lock.release()
+
+    def _help_mario(self, ally: str) -> bool:
+        """
+        Rotates the roster under the writer lock
+        :param ally: the racer that needs to go first
+        :return: True if the roster was changed, else False
+        """
+        self._acquire()
+        try:
+            return _help_mario_nodes(self, ally)
+        finally:
+            self._lock.release()
+
+
+class SkipLane:
+    """
+    Express-lane entry of a sorted SLL, skips ahead over the SLLNode chain
+    """
+
+    __slots__ = ['node', 'next', 'down']
+
+    def __init__(self, node: Node, next: 'SkipLane' = None, down: 'SkipLane' = None) -> None:
+        """
+        Initialize a lane entry
+        :param node: SLLNode this entry stands for
+        :param next: next entry on the same lane
+        :param down: entry for the same node one lane lower, None on the lowest lane
+        :return: None
+        """
+        self.node = node
+        self.next = next
+        self.down = down
+
+
+class SortedSinglyLinkedList(SinglyLinkedList):
+    """
+    SLL kept in ascending order, with skip-list express lanes over its nodes
+    The values still live in an ordinary SLLNode chain (so `to_string`,
+    iteration and the counters are the base class's), and each node is also
+    promoted onto lane k with probability 2^-k. Lookups run down the lanes and
+    finish on the chain, giving expected O(log n) `insert_sorted`, `find`,
+    `delete` and `range`. Values must be mutually comparable with `<`.
+    """
+
+    __slots__ = ['_lanes', '_random']
+
+    # lanes above this are never built, plenty for 2^32 values
+    MAX_LANES = 32
+    # lane walks aren't modelled, so instrumented sorted lists record calls,
+    # allocations, net nodes added and time but leave nodes_visited as None
+    _TRACED = dict.fromkeys(list(SinglyLinkedList._TRACED) + ['insert_sorted'])
+    _ALLOCATING = dict(SinglyLinkedList._ALLOCATING,
+                       insert_sorted=SinglyLinkedList._ALLOCATING['append'])
+
+    def __init__(self, indexed: bool = False, pool: SLLNodePool = None, seed: int = None) -> None:
+        """
+        Initializes an empty sorted SLL
+        :param indexed: if True, keep a value index so `find` and `find_sum` run in O(1)
+        :param pool: if given, nodes come from and go back to this pool
+        :param seed: seeds the lane promotion coin flips, for reproducible layouts
+        return: None
+        """
+        super().__init__(indexed=indexed, pool=pool)
+        # first entry of each lane, lowest lane first
+        self._lanes = []
+        self._random = Random(seed)
+
+    def _search(self, data: T, inclusive: bool = False) -> tuple:
+        """
+        Walks down the lanes to the last node before `data`
+        :param data: value to position on
+        :param inclusive: if True, stop after the last node <= `data` instead of < `data`
+        :return: (last chain node before the position or None if it is the head,
+            list of the last entry before the position on each lane or None)
+        """
+        before = [None] * len(self._lanes)
+        entry = None
+        for level in range(len(self._lanes) - 1, -1, -1):
+            candidate = self._lanes[level] if entry is None else entry.next
+            while candidate is not None and (candidate.node.data <= data if inclusive
+                                             else candidate.node.data < data):
+                entry = candidate
+                candidate = entry.next
+            before[level] = entry
+            if entry is not None and level > 0:
+                entry = entry.down
+        # finish the walk on the node chain
+        prevNode = None if entry is None else entry.node
+        currNode = self.head if prevNode is None else prevNode.next
+        while currNode is not None and (currNode.data <= data if inclusive else currNode.data < data):
+            prevNode = currNode
+            currNode = currNode.next
+        return prevNode, before
+
+    def _lane_count(self) -> int:
+        """
+        Flips coins for how many lanes a new node is promoted onto
+        :return: number of lanes, 0 for most nodes
+        """
+        count = 0
+        while count < self.MAX_LANES and self._random.random() < 0.5:
+            count += 1
+        return count
+
+    def insert_sorted(self, data: T) -> None:
+        """
+        Inserts `data` after every value <= it, keeping the list sorted
+        :param data: data to insert
+        :return: None
+        """
+        prevNode, before = self._search(data, inclusive=True)
+        newNode = SLLNode(data) if self._pool is None else self._pool.acquire(data)
+        # link into the node chain
+        if prevNode is None:
+            newNode.next = self.head
+            self.head = newNode
+        else:
+            newNode.next = prevNode.next
+            prevNode.next = newNode
+        if newNode.next is None:
+            self.tail = newNode
+        self._linked(newNode, prevNode)
+        if newNode.next is not None and self._prev is not None:
+            self._prev[id(newNode.next)] = newNode
+        # promote onto the express lanes
+        below = None
+        for level in range(self._lane_count()):
+            if level == len(self._lanes):
+                self._lanes.append(None)
+                before.append(None)
+            entry = before[level]
+            if entry is None:
+                below = self._lanes[level] = SkipLane(newNode, self._lanes[level], below)
+            else:
+                below = entry.next = SkipLane(newNode, entry.next, below)
+
+    def append(self, data: T) -> None:
+        """
+        Sorted lists can't append out of order, `data` goes to its sorted place
+        :param data: data to insert
+        :return: None
+        """
+        self.insert_sorted(data)
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        """
+        Inserts every value of `iterable` at its sorted place
+        The list itself and views (which may read it) are copied first, since
+        every insert lands inside the part still being read
+        :param iterable: values to insert
+        :return: None
+        """
+        if iterable is self or isinstance(iterable, SLLView):
+            iterable = list(iterable)
+        for data in iterable:
+            self.insert_sorted(data)
+
+    def find(self, data: T) -> bool:
+        """
+        Looks for `data` through the express lanes
+        :param data: data to search for
+        :return: True if found, else False
+        """
+        if self._index is not None:
+            return super().find(data)
+        prevNode = self._search(data)[0]
+        currNode = self.head if prevNode is None else prevNode.next
+        return currNode is not None and currNode.data == data
+
+    def find_sum(self, data: T) -> int:
+        """
+        Counts the run of nodes equal to `data`
+        :param data: data to find and sum up
+        :return: number of times the data occurred
+        """
+        if self._index is not None:
+            return super().find_sum(data)
+        prevNode = self._search(data)[0]
+        currNode = self.head if prevNode is None else prevNode.next
+        count = 0
+        while currNode is not None and currNode.data == data:
+            count += 1
+            currNode = currNode.next
+        return count
+
+    def _cut_run(self, data: T, limit: int) -> int:
+        """
+        Unlinks up to `limit` leading nodes equal to `data`, from the chain and every lane
+        :param data: data to remove
+        :param limit: most nodes to remove
+        :return: number of nodes removed
+        """
+        prevNode, before = self._search(data)
+        currNode = self.head if prevNode is None else prevNode.next
+        removed = []
+        while currNode is not None and len(removed) < limit and currNode.data == data:
+            removed.append(currNode)
+            currNode = currNode.next
+        if not removed:
+            return 0
+        # drop the lane entries of the removed nodes
+        gone = {id(node) for node in removed}
+        for level, entry in enumerate(before):
+            candidate = self._lanes[level] if entry is None else entry.next
+            while candidate is not None and id(candidate.node) in gone:
+                candidate = candidate.next
+            if entry is None:
+                self._lanes[level] = candidate
+            else:
+                entry.next = candidate
+        # then the chain itself
+        for node in removed:
+            self._unlinked(node)
+        if prevNode is None:
+            self.head = currNode
+        else:
+            prevNode.next = currNode
+        if currNode is None:
+            self.tail = prevNode
+        for node in removed:
+            node.next = None
+            self._recycle(node)
+        return len(removed)
+
+    def delete(self, data: T) -> bool:
+        """
+        Deletes the first node containing `data`
+        :param data: data to remove
+        :return: True if a node was removed, else False
+        """
+        return self._cut_run(data, 1) == 1
+
+    def delete_all(self, data: T) -> bool:
+        """
+        Deletes every node containing `data`, they sit next to each other
+        :param data: data to remove
+        :return: True if a node was removed, else False
+        """
+        return self._cut_run(data, self._length) > 0
+
+    def _delete_matching(self, match: Callable[[T], bool]) -> int:
+        """
+        Unlinks every matching node, then rebuilds the express lanes
+        :param match: called with each node's data, True means remove
+        :return: number of nodes removed
+        """
+        removed = super()._delete_matching(match)
+        if removed:
+            self._rebuild_lanes()
+        return removed
+
+    def _rebuild_lanes(self) -> None:
+        """
+        Throws away the express lanes and promotes every node afresh
+        :return: None
+        """
+        self._lanes = []
+        last = []
+        currNode = self.head
+        while currNode is not None:
+            below = None
+            for level in range(self._lane_count()):
+                entry = SkipLane(currNode, None, below)
+                if level == len(self._lanes):
+                    self._lanes.append(entry)
+                    last.append(entry)
+                else:
+                    last[level].next = entry
+                    last[level] = entry
+                below = entry
+            currNode = currNode.next
+
+    def range(self, low: T, high: T) -> Iterator[T]:
+        """
+        Yields the values v with low <= v < high, in order
+        :param low: smallest value to include
+        :param high: values from here on are excluded
+        :return: generator of values
+        """
+        prevNode = self._search(low)[0]
+        currNode = self.head if prevNode is None else prevNode.next
+        while currNode is not None and currNode.data < high:
+            yield currNode.data
+            currNode = currNode.next
+
+    def _help_mario(self, ally: str) -> bool:
+        """
+        Rotating would break the sort order, so sorted rosters refuse it
+        :param ally: the racer that needs to go first
+        :return: never returns
+        """
+        raise TypeError("help_mario can't reorder a SortedSinglyLinkedList")
+
+
+class PersistentSinglyLinkedList:
+    """
+    Immutable SLL whose versions share their nodes
+    A version is a tuple of runs, each (first node, last node, count), over
+    SLLNode chains that never change once a version can see them. `append`,
+    `delete` and `help_mario` return a new version built from the old runs in
+    O(runs) plus the walk to the value, and every older version stays as it
+    was, so a snapshot is just a reference. Nodes are only allocated for
+    appended values. The one write to a shared node is `append` claiming the
+    empty `next` of the last run's last node; a version that finds it already
+    claimed starts a new run instead.
+    Runs whose nodes are already linked end to start are joined, and a version
+    left with more than `_MAX_RUNS` runs averaging under `_MIN_RUN` nodes is
+    compacted, so long delete histories don't keep piling up runs.
+    """
+
+    __slots__ = ['_runs', '_length']
+
+    _MAX_RUNS = 32
+    _MIN_RUN = 16
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty version
+        :return: None
+        """
+        self._runs = ()
+        self._length = 0
+
+    @classmethod
+    def _version(cls, runs: tuple, length: int) -> 'PersistentSinglyLinkedList':
+        """
+        Joins runs that are already linked, and compacts the version once its runs get short
+        :param runs: tuple of (first node, last node, count)
+        :param length: total count of the runs
+        :return: new version over `runs`
+        """
+        joined = []
+        for run in runs:
+            if joined and joined[-1][1].next is run[0]:
+                first, _, count = joined[-1]
+                joined[-1] = (first, run[1], count + run[2])
+            else:
+                joined.append(run)
+        if len(joined) > cls._MAX_RUNS and len(joined) * cls._MIN_RUN > length:
+            return cls.from_iterable(cls._values(joined))
+        version = cls()
+        version._runs = tuple(joined)
+        version._length = length
+        return version
+
+    @staticmethod
+    def _nodes(runs: Iterable[tuple]) -> Iterator[Node]:
+        """
+        Iterates over the nodes of `runs`, in order
+        :param runs: (first node, last node, count) runs
+        :return: generator of nodes
+        """
+        for currNode, _, count in runs:
+            for _ in range(count):
+                yield currNode
+                currNode = currNode.next
+
+    @classmethod
+    def _values(cls, runs: Iterable[tuple]) -> Iterator[T]:
+        """
+        Iterates over the values of `runs`, in order
+        :param runs: (first node, last node, count) runs
+        :return: generator of values
+        """
+        for node in cls._nodes(runs):
+            yield node.data
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T]) -> 'PersistentSinglyLinkedList':
+        """
+        Builds a version holding the values of `iterable` as a single run
+        :param iterable: values to store, in order
+        :return: new version
+        """
+        anchor = lastNode = SLLNode(None)
+        count = 0
+        for data in iterable:
+            lastNode.next = SLLNode(data)
+            lastNode = lastNode.next
+            count += 1
+        if count == 0:
+            return cls()
+        return cls._version(((anchor.next, lastNode, count),), count)
+
+    def __repr__(self) -> str:
+        """
+        Represents the version as a string
+        :return: string representation of the version
+        """
+        return self.to_string()
+
+    def __eq__(self, other: 'PersistentSinglyLinkedList') -> bool:
+        """
+        Overloads `==`, two versions are equal when they are made of the same nodes
+        in the same order, however their runs are split
+        :param other: right operand of `==`
+        :return: True if equal, else False
+        """
+        if not isinstance(other, PersistentSinglyLinkedList):
+            return NotImplemented
+        if self._length != other._length:
+            return False
+        return all(a is b for a, b in zip(self._nodes(self._runs), self._nodes(other._runs)))
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates over the values of the version, head to tail
+        :return: generator of values
+        """
+        for currNode, _, count in self._runs:
+            for _ in range(count):
+                yield currNode.data
+                currNode = currNode.next
+
+    def __len__(self) -> int:
+        """
+        Overloads `len()`
+        :return: number of values in the version
+        """
+        return self._length
+
+    def __contains__(self, data: T) -> bool:
+        """
+        Overloads `in`
+        :param data: data to search for
+        :return: True if found, else False
+        """
+        return self.find(data)
+
+    def to_string(self) -> str:
+        """
+        Converts the version to the same string an SLL with these values gives
+        :return: string representation of the version
+        """
+        if self._length == 0:
+            return "None"
+        return " --> ".join(str(data) for data in self)
+
+    def to_sll(self, indexed: bool = False) -> SLL:
+        """
+        Copies the version into a new mutable SLL
+        :param indexed: if True, the new list keeps a value index
+        :return: new SLL
+        """
+        return SinglyLinkedList.from_iterable(self, indexed=indexed)
+
+    def length(self) -> int:
+        """
+        Determines number of values in the version
+        :return: number of values
+        """
+        return self._length
+
+    def total(self) -> T:
+        """
+        Sums up the values in the version, in order
+        :return: total sum of values, None if empty
+        """
+        if self._length == 0:
+            return None
+        values = iter(self)
+        sum = next(values)
+        for data in values:
+            sum += data
+        return sum
+
+    def find(self, data: T) -> bool:
+        """
+        Looks through the version for `data`
+        :param data: data to search for
+        :return: True if found, else False
+        """
+        return self._locate(data) is not None
+
+    def find_sum(self, data: T) -> int:
+        """
+        Returns the number of occurrences of `data` in this version
+        :param data: data to find and sum up
+        :return: number of times the data occurred
+        """
+        count = 0
+        for value in self:
+            if value == data:
+                count += 1
+        return count
+
+    def _locate(self, data: T) -> tuple:
+        """
+        Finds the first node holding `data`
+        :param data: data to search for
+        :return: (run position, offset in the run, node before it in the run
+            or None, the node), or None if absent
+        """
+        for at, (currNode, _, count) in enumerate(self._runs):
+            prevNode = None
+            for offset in range(count):
+                if currNode.data == data:
+                    return at, offset, prevNode, currNode
+                prevNode = currNode
+                currNode = currNode.next
+        return None
+
+    def append(self, data: T) -> 'PersistentSinglyLinkedList':
+        """
+        Returns a new version with `data` added at the end
+        :param data: data to append
+        :return: new version, this one is unchanged
+        """
+        newNode = SLLNode(data)
+        runs = self._runs
+        if runs:
+            first, last, count = runs[-1]
+            # nobody has linked past our last node yet, extend the run in place
+            if last.next is None:
+                last.next = newNode
+                return self._version(runs[:-1] + ((first, newNode, count + 1),), self._length + 1)
+        return self._version(runs + ((newNode, newNode, 1),), self._length + 1)
+
+    def delete(self, data: T) -> 'PersistentSinglyLinkedList':
+        """
+        Returns a new version without the first node containing `data`
+        :param data: data to remove
+        :return: new version, or this one if `data` is absent
+        """
+        found = self._locate(data)
+        if found is None:
+            return self
+        at, offset, prevNode, node = found
+        first, last, count = self._runs[at]
+        # the run splits around the node, keeping whichever sides are nonempty
+        pieces = ()
+        if offset > 0:
+            pieces += ((first, prevNode, offset),)
+        if offset < count - 1:
+            pieces += ((node.next, last, count - offset - 1),)
+        return self._version(self._runs[:at] + pieces + self._runs[at + 1:], self._length - 1)
+
+    def help_mario(self, ally: str) -> 'PersistentSinglyLinkedList':
+        """
+        Returns a new version with the first `ally` at the front
+        Preserves relative order of racers around ally, like `help_mario`
+        :param ally: the racer that needs to go first
+        :return: new version, or this one if no change was needed
+        """
+        found = self._locate(ally)
+        if found is None or (found[0] == 0 and found[1] == 0):
+            return self
+        at, offset, prevNode, node = found
+        first, last, count = self._runs[at]
+        # ally to the end, then the old head up to the ally
+        runs = ((node, last, count - offset),) + self._runs[at + 1:] + self._runs[:at]
+        if offset > 0:
+            runs += ((first, prevNode, offset),)
+        return self._version(runs, self._length)
+
+    def _help_mario(self, ally: str) -> bool:
+        """
+        Versions can't be rotated in place
+        :param ally: the racer that needs to go first
+        :return: never returns
+        """
+        raise TypeError("help_mario can't change a PersistentSinglyLinkedList, "
+                        "use its help_mario method to get a new version")
+
+    def compact(self) -> 'PersistentSinglyLinkedList':
+        """
+        Copies the version into one fresh run, so later walks skip the run bookkeeping
+        and the version stops holding on to nodes only older versions need
+        :return: new single-run version
+        """
+        return self.from_iterable(self)
@@ -0,0 +1,96 @@
+"""
+Stress benchmark for ConcurrentSinglyLinkedList
+Runs writer threads that append to one shared list while reader threads call
+find/find_sum on it, then checks that no append was lost and reports
+throughput together with the writer lock's contention statistics.
+
+usage: python stress.py [--writers 8] [--readers 2] [--appends 100000] [--indexed]
+"""
+
+import argparse
+import sys
+import threading
+import time
+from typing import List
+
+from solution import ConcurrentSinglyLinkedList
+
+
+def run(writers: int, readers: int, appends: int, indexed: bool) -> dict:
+    """
+    Runs one stress round
+    :param writers: number of appending threads
+    :param readers: number of reading threads
+    :param appends: appends per writer
+    :param indexed: if True, the shared list keeps a value index
+    :return: dict with throughput, reader and contention figures
+    """
+    sll = ConcurrentSinglyLinkedList(indexed=indexed)
+    start_line = threading.Barrier(writers + readers + 1)
+    done = threading.Event()
+    reads = [0] * readers
+
+    def write(first: int) -> None:
+        start_line.wait()
+        append = sll.append
+        for value in range(first, first + appends):
+            append(value)
+
+    def read(slot: int) -> None:
+        start_line.wait()
+        count = 0
+        while not done.is_set():
+            sll.find(count % (writers * appends))
+            sll.find_sum(-1)
+            count += 1
+        reads[slot] = count
+
+    threads = [threading.Thread(target=write, args=(w * appends,)) for w in range(writers)]
+    watchers = [threading.Thread(target=read, args=(r,)) for r in range(readers)]
+    for thread in threads + watchers:
+        thread.start()
+    start_line.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    for thread in watchers:
+        thread.join()
+
+    expected = writers * appends
+    seen = sorted(sll)
+    if sll.length() != expected or seen != list(range(expected)):
+        raise AssertionError(f"lost or duplicated appends: {sll.length()} nodes, expected {expected}")
+    result = {'appends_per_sec': expected / elapsed, 'seconds': elapsed,
+              'reader_ops_per_sec': sum(reads) / elapsed}
+    result.update(sll.contention())
+    return result
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Command line entry point
+    :param argv: arguments, defaults to sys.argv
+    :return: exit code, 0 if every append was accounted for
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--writers', type=int, default=8, help='appending threads')
+    parser.add_argument('--readers', type=int, default=2, help='threads calling find/find_sum')
+    parser.add_argument('--appends', type=int, default=100000, help='appends per writer')
+    parser.add_argument('--indexed', action='store_true', help='keep a value index on the list')
+    args = parser.parse_args(argv)
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    result = run(args.writers, args.readers, args.appends, args.indexed)
+    print(f"{args.writers} writers x {args.appends} appends in {result['seconds']:.3f}s: "
+          f"{result['appends_per_sec']:,.0f} appends/s")
+    print(f"{args.readers} readers: {result['reader_ops_per_sec']:,.0f} lookups/s")
+    print(f"lock: {result['acquisitions']:,} acquisitions, {result['contended']:,} contended "
+          f"({result['contention_rate']:.1%}), {result['wait_seconds']:.3f}s waiting")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,19 @@
 import unittest
-from solution import SinglyLinkedList as SLL, help_mario, SLLNode
-from random import seed, randint, shuffle
+from solution import SinglyLinkedList as SLL, help_mario, help_mario_batch, SLLNode, SLLNodePool
+from solution import CompactSinglyLinkedList as CompactSLL, UnrolledSinglyLinkedList as UnrolledSLL
+from solution import NumericSinglyLinkedList as NumericSLL, np
+from solution import ConcurrentSinglyLinkedList as ConcurrentSLL, SortedSinglyLinkedList as SortedSLL
+from solution import PersistentSinglyLinkedList as PersistentSLL
+from decimal import Decimal
+from fractions import Fraction
+from random import seed, randint, shuffle, choice
 from typing import Tuple
 import string
+import io
+import sys
+import os
+import tempfile
+import threading
 
 
 class MyTestCase(unittest.TestCase):
@@ -279,6 +290,17 @@ class MyTestCase(unittest.TestCase):
         self.assertIs(None, sll.head)  # 8
         self.assertIs(None, sll.tail)  # 8
 
+        # 9. Delete every node of a multi-node list in one call
+        for value in [4, 4, 4]:
+            sll.append(value)
+        self.assertEqual(True, sll.delete_all(4))  # 9, SLL: Empty
+        self.assertIs(None, sll.head)  # 9
+        self.assertIsNone(sll.tail)  # 9
+        self.assertEqual(0, sll.length())  # 9
+        sll.append(1)
+        self.assertEqual("1", sll.to_string())  # 9
+        self.assertIs(sll.head, sll.tail)  # 9
+
     def test_find(self):
         sll = SLL()
 
@@ -501,6 +523,1043 @@ class MyTestCase(unittest.TestCase):
                       f'below.')
                 raise e
 
+    def test_index(self):
+        sll = SLL(indexed=True)
+
+        # 1. Lookups on an empty indexed list
+        self.assertEqual(False, sll.find(331))  # 1
+        self.assertEqual(0, sll.find_sum(331))  # 1
+
+        sll.append(4)
+        sll.append(2)
+        sll.append(4)
+        sll.append(1)  # SLL: 4 --> 2 --> 4 --> 1
+
+        # 2. Appends are counted by the index
+        self.assertEqual(True, sll.find(4))  # 2
+        self.assertEqual(2, sll.find_sum(4))  # 2
+        self.assertEqual(1, sll.find_sum(1))  # 2
+        self.assertEqual(False, sll.find(6))  # 2
+
+        # 3. delete keeps the index current
+        self.assertEqual(True, sll.delete(4))  # 3, SLL: 2 --> 4 --> 1
+        self.assertEqual(1, sll.find_sum(4))  # 3
+        self.assertEqual(False, sll.delete(6))  # 3
+        self.assertEqual("2 --> 4 --> 1", sll.to_string())  # 3
+
+        # 4. delete_all keeps the index current
+        sll.append(4)  # SLL: 2 --> 4 --> 1 --> 4
+        self.assertEqual(True, sll.delete_all(4))  # 4, SLL: 2 --> 1
+        self.assertEqual(False, sll.find(4))  # 4
+        self.assertEqual(0, sll.find_sum(4))  # 4
+        self.assertIs(sll.tail, sll.head.next)  # 4
+
+        # 5. Deleting a missing value from a one-element list leaves it alone
+        self.assertEqual(True, sll.delete(2))  # 5, SLL: 1
+        self.assertEqual(False, sll.delete(2))  # 5
+        self.assertEqual(False, sll.delete_all(2))  # 5
+        self.assertEqual(1, sll.head.data)  # 5
+        self.assertIs(sll.head, sll.tail)  # 5
+
+        # 6. help_mario leaves the index current
+        roster = SLL(indexed=True)
+        for racer in ['Luigi', 'King Boo', 'Toad', 'Morton Koopa Jr.']:
+            roster.append(racer)
+        self.assertIs(False, help_mario(roster, 'Yoshi'))  # 6
+        self.assertIs(True, help_mario(roster, 'Toad'))  # 6
+        self.assertEqual('Toad', roster.head.data)  # 6
+        self.assertEqual(1, roster.find_sum('Luigi'))  # 6
+
+        # 7. Index can be turned on for an existing list and off again
+        sll = SLL()
+        for i in [3, 1, 3, 3]:
+            sll.append(i)
+        sll.enable_index()
+        self.assertEqual(3, sll.find_sum(3))  # 7
+        sll.disable_index()
+        sll.append(3)
+        self.assertEqual(4, sll.find_sum(3))  # 7
+
+    def test_running_totals(self):
+        sll = SLL()
+
+        # 1. Counter and total start out empty
+        self.assertEqual(0, sll.length())  # 1
+        self.assertIs(None, sll.total())  # 1
+
+        for i in [5, 8, 2, 5]:
+            sll.append(i)  # SLL: 5 --> 8 --> 2 --> 5
+
+        # 2. Appends update the counter and the total
+        self.assertEqual(4, sll.length())  # 2
+        self.assertEqual(20, sll.total())  # 2
+
+        # 3. delete and delete_all subtract what they remove
+        sll.delete(8)  # SLL: 5 --> 2 --> 5
+        self.assertEqual(3, sll.length())  # 3
+        self.assertEqual(12, sll.total())  # 3
+        sll.delete_all(5)  # SLL: 2
+        self.assertEqual(1, sll.length())  # 3
+        self.assertEqual(2, sll.total())  # 3
+
+        # 4. Missed deletes leave both alone
+        sll.delete(7)
+        sll.delete_all(7)
+        self.assertEqual(1, sll.length())  # 4
+        self.assertEqual(2, sll.total())  # 4
+
+        # 5. Emptying the list resets the total
+        sll.delete(2)
+        self.assertEqual(0, sll.length())  # 5
+        self.assertIs(None, sll.total())  # 5
+
+        # 6. Strings can't be subtracted, total is recomputed in list order
+        sll = SLL()
+        for word in ['Hello', 'World!', 'Bye']:
+            sll.append(word)
+        self.assertEqual('HelloWorld!Bye', sll.total())  # 6
+        sll.delete('World!')
+        self.assertEqual('HelloBye', sll.total())  # 6
+        help_mario(sll, 'Bye')
+        self.assertEqual('ByeHello', sll.total())  # 6
+        self.assertEqual(2, sll.length())  # 6
+
+        # 7. Numeric totals survive help_mario untouched
+        roster = SLL()
+        for i in [1, 2, 3]:
+            roster.append(i)
+        help_mario(roster, 3)
+        self.assertEqual(6, roster.total())  # 7
+        self.assertEqual(3, roster.length())  # 7
+
+        # 8. Float deletes recompute the total instead of subtracting
+        sll = SLL()
+        for f in [1e16, 1.0]:
+            sll.append(f)
+        sll.delete(1e16)
+        self.assertEqual(1.0, sll.total())  # 8
+        sll = SLL()
+        for f in [float('inf'), 2.0]:
+            sll.append(f)
+        sll.delete(float('inf'))
+        self.assertEqual(2.0, sll.total())  # 8
+        sll = SLL()
+        for f in [0.1, 0.2, 0.3]:
+            sll.append(f)
+        sll.delete(0.1)
+        sll.delete(0.2)
+        self.assertEqual(0.3, sll.total())  # 8
+        sll.append(4)
+        sll.delete(4)
+        self.assertEqual(0.3, sll.total())  # 8
+
+        # 9. Fractions stay exact through deletes, Decimals are recomputed
+        sll = SLL()
+        for value in [Fraction(1, 3), Fraction(1, 6), 1]:
+            sll.append(value)
+        sll.delete(Fraction(1, 6))
+        self.assertEqual(Fraction(4, 3), sll.total())  # 9
+        sll = SLL()
+        for value in [Decimal('0.1'), Decimal('0.2'), 3]:
+            sll.append(value)
+        sll.delete(3)
+        self.assertEqual(Decimal('0.3'), sll.total())  # 9
+        sll = SLL()
+        for value in [Decimal('1e30'), Decimal(1)]:
+            sll.append(value)
+        sll.delete(Decimal('1e30'))
+        self.assertEqual(Decimal(1), sll.total())  # 9
+        sll.append(Decimal('1e30'))
+        help_mario(sll, Decimal('1e30'))
+        self.assertEqual(Decimal('1e30') + Decimal(1), sll.total())  # 9
+
+    def test_stream_string(self):
+        sll = SLL()
+
+        # 1. Empty list streams the same string as to_string
+        self.assertEqual(["None"], list(sll.iter_string()))  # 1
+
+        for i in range(10):
+            sll.append(i)
+
+        # 2. Pieces join back into to_string
+        pieces = list(sll.iter_string(chunk_size=3))
+        self.assertEqual(4, len(pieces))  # 2
+        self.assertEqual(sll.to_string(), "".join(pieces))  # 2
+        self.assertEqual(" --> ".join(str(i) for i in range(10)), sll.to_string())  # 2
+
+        # 3. write_string writes the same text to a file-like object
+        stream = io.StringIO()
+        sll.write_string(stream, chunk_size=4)
+        self.assertEqual(sll.to_string(), stream.getvalue())  # 3
+
+        # 4. Long lists render in one go
+        sll = SLL()
+        for i in range(100000):
+            sll.append(i % 10)
+        self.assertEqual(100000 * 6 - 5, len(sll.to_string()))  # 4
+
+    def test_eq(self):
+        sll = SLL()
+        other = SLL()
+
+        # 1. Two empty lists are equal
+        self.assertTrue(sll == other)  # 1
+
+        # 2. Lists with equal values but different nodes are not equal
+        for i in range(3):
+            sll.append(i)
+            other.append(i)
+        self.assertFalse(sll == other)  # 2
+        self.assertFalse(sll == SLL())  # 2
+
+        # 3. Lists sharing their nodes are equal
+        other.head, other.tail = sll.head, sll.tail
+        self.assertTrue(sll == other)  # 3
+
+        # 4. Lists longer than the recursion limit compare without crashing
+        sll = SLL()
+        for i in range(sys.getrecursionlimit() * 2):
+            sll.append(i)
+        other = SLL()
+        other.head, other.tail = sll.head, sll.tail
+        self.assertTrue(sll == other)  # 4
+        self.assertTrue(sll == sll)  # 4
+
+    def test_compact(self):
+        sll = CompactSLL()
+
+        # 1. Empty compact list
+        self.assertEqual("None", sll.to_string())  # 1
+        self.assertEqual(0, sll.length())  # 1
+        self.assertIs(None, sll.total())  # 1
+        self.assertEqual(False, sll.delete(331))  # 1
+        self.assertIs(False, help_mario(sll, 'Toad'))  # 1
+
+        # 2. Appends, deletes and lookups
+        for i in [4, 2, 4, 1]:
+            sll.append(i)  # SLL: 4 --> 2 --> 4 --> 1
+        self.assertEqual("4 --> 2 --> 4 --> 1", sll.to_string())  # 2
+        self.assertEqual(True, sll.delete(4))  # 2, SLL: 2 --> 4 --> 1
+        self.assertEqual(1, sll.find_sum(4))  # 2
+        self.assertEqual(True, sll.delete_all(1))  # 2, SLL: 2 --> 4
+        self.assertEqual(False, sll.find(1))  # 2
+        self.assertEqual(6, sll.total())  # 2
+
+        # 3. Freed slots are reused by append
+        slots = len(sll._data)
+        sll.append(7)
+        sll.append(8)  # SLL: 2 --> 4 --> 7 --> 8
+        self.assertEqual(slots, len(sll._data))  # 3
+        self.assertEqual("2 --> 4 --> 7 --> 8", sll.to_string())  # 3
+
+        # 4. compact keeps the order and drops free slots
+        sll.delete(2)
+        sll.compact()  # SLL: 4 --> 7 --> 8
+        self.assertEqual(3, len(sll._data))  # 4
+        self.assertEqual("4 --> 7 --> 8", sll.to_string())  # 4
+        sll.append(9)
+        self.assertEqual("4 --> 7 --> 8 --> 9", sll.to_string())  # 4
+
+        # 5. Random operations behave exactly like the node-based list
+        seed(331)
+        nodes, compact = SLL(), CompactSLL()
+        for _ in range(2000):
+            op, value = randint(0, 5), randint(0, 20)
+            if op <= 1:
+                nodes.append(value)
+                compact.append(value)
+            elif op == 2:
+                self.assertEqual(nodes.delete(value), compact.delete(value))  # 5
+            elif op == 3:
+                self.assertEqual(nodes.delete_all(value), compact.delete_all(value))  # 5
+            elif op == 4:
+                self.assertEqual(help_mario(nodes, value), help_mario(compact, value))  # 5
+            else:
+                compact.compact()
+            self.assertEqual(nodes.to_string(), compact.to_string())  # 5
+            self.assertEqual(nodes.find_sum(value), compact.find_sum(value))  # 5
+            self.assertEqual(nodes.find(value), compact.find(value))  # 5
+            self.assertEqual(nodes.length(), compact.length())  # 5
+            self.assertEqual(nodes.total(), compact.total())  # 5
+
+        # 6. NaN never equals itself, and freed slots never match, just like the nodes
+        class Anything:
+            def __eq__(self, other):
+                return True
+
+        nan, anything = float('nan'), Anything()
+        nodes, compact = SLL(), CompactSLL()
+        for _ in range(500):
+            op, value = randint(0, 3), choice([nan, randint(0, 5)])
+            if op <= 1:
+                nodes.append(value)
+                compact.append(value)
+            elif op == 2:
+                self.assertEqual(nodes.delete(value), compact.delete(value))  # 6
+            else:
+                compact.compact()
+            for probe in (nan, value, anything):
+                self.assertEqual(nodes.find(probe), compact.find(probe))  # 6
+                self.assertEqual(nodes.find_sum(probe), compact.find_sum(probe))  # 6
+        compact = CompactSLL()
+        compact.append(nan)
+        self.assertFalse(compact.find(nan))  # 6
+        self.assertEqual(0, compact.find_sum(nan))  # 6
+
+    def test_extend(self):
+        sll = SLL()
+
+        # 1. Extending with nothing leaves an empty list alone
+        sll.extend([])
+        self.assertIs(None, sll.head)  # 1
+        self.assertIs(None, sll.tail)  # 1
+        self.assertEqual(0, sll.length())  # 1
+
+        # 2. Extending an empty list sets head and tail
+        sll.extend([15, 7])  # SLL: 15 --> 7
+        self.assertEqual(15, sll.head.data)  # 2
+        self.assertEqual(7, sll.tail.data)  # 2
+        self.assertIs(sll.head.next, sll.tail)  # 2
+        self.assertIs(None, sll.tail.next)  # 2
+
+        # 3. Extending a nonempty list with a generator
+        sll.extend(i for i in range(3))  # SLL: 15 --> 7 --> 0 --> 1 --> 2
+        self.assertEqual("15 --> 7 --> 0 --> 1 --> 2", sll.to_string())  # 3
+        self.assertEqual(2, sll.tail.data)  # 3
+        self.assertIs(None, sll.tail.next)  # 3
+        self.assertEqual(5, sll.length())  # 3
+        self.assertEqual(25, sll.total())  # 3
+
+        # 4. from_iterable builds an indexed list
+        sll = SLL.from_iterable(iter('CSE331'), indexed=True)
+        self.assertEqual("C --> S --> E --> 3 --> 3 --> 1", sll.to_string())  # 4
+        self.assertEqual(2, sll.find_sum('3'))  # 4
+        self.assertEqual('CSE331', sll.total())  # 4
+        self.assertEqual(True, sll.delete_all('3'))  # 4
+        self.assertEqual("C --> S --> E --> 1", sll.to_string())  # 4
+        self.assertEqual('1', sll.tail.data)  # 4
+
+        # 5. Extending a list that delete_all emptied
+        for cls in (SLL, ConcurrentSLL):
+            sll = cls()
+            sll.append(0)
+            sll.append(0)
+            sll.delete_all(0)
+            sll.extend([5, 6])
+            self.assertEqual("5 --> 6", sll.to_string())  # 5
+            self.assertEqual([5, 6], list(sll))  # 5
+            self.assertEqual(2, sll.length())  # 5
+            self.assertIn(5, sll)  # 5
+            self.assertEqual(6, sll.tail.data)  # 5
+
+        # 6. Extending a list from itself copies the values it started with
+        for cls in (SLL, ConcurrentSLL):
+            sll = cls.from_iterable([1, 2], indexed=True)
+            sll.extend(sll)
+            self.assertEqual("1 --> 2 --> 1 --> 2", sll.to_string())  # 6
+            sll.extend(sll.view().map(lambda x: x * 10))
+            self.assertEqual([1, 2, 1, 2, 10, 20, 10, 20], list(sll))  # 6
+            self.assertEqual(8, sll.length())  # 6
+            self.assertEqual(2, sll.find_sum(10))  # 6
+            self.assertEqual(20, sll.tail.data)  # 6
+        sll = SortedSLL.from_iterable([2, 1])
+        sll.extend(sll)
+        sll.extend(sll.view().take(2))
+        self.assertEqual("1 --> 1 --> 1 --> 1 --> 2 --> 2", sll.to_string())  # 6
+
+    def test_delete_many(self):
+        sll = SLL()
+
+        # 1. Deleting from an empty list
+        self.assertEqual(0, sll.delete_many({1, 2}))  # 1
+        self.assertEqual(0, sll.delete_if(lambda x: True))  # 1
+
+        sll.extend([8, 5, 3, 5, 9, 3, 7, 0])
+        # SLL: 8 --> 5 --> 3 --> 5 --> 9 --> 3 --> 7 --> 0
+
+        # 2. Delete several values at once, including head and tail
+        self.assertEqual(4, sll.delete_many({8, 5, 0}))  # 2, SLL: 3 --> 9 --> 3 --> 7
+        self.assertEqual("3 --> 9 --> 3 --> 7", sll.to_string())  # 2
+        self.assertEqual(3, sll.head.data)  # 2
+        self.assertEqual(7, sll.tail.data)  # 2
+        self.assertIs(None, sll.tail.next)  # 2
+        self.assertEqual(4, sll.length())  # 2
+        self.assertEqual(22, sll.total())  # 2
+
+        # 3. Values that aren't present remove nothing
+        self.assertEqual(0, sll.delete_many({100, 200}))  # 3
+        self.assertEqual("3 --> 9 --> 3 --> 7", sll.to_string())  # 3
+
+        # 4. Delete by predicate
+        self.assertEqual(2, sll.delete_if(lambda x: x > 5))  # 4, SLL: 3 --> 3
+        self.assertEqual("3 --> 3", sll.to_string())  # 4
+        self.assertIs(sll.tail, sll.head.next)  # 4
+
+        # 5. Delete everything
+        self.assertEqual(2, sll.delete_if(lambda x: True))  # 5, SLL: Empty
+        self.assertIs(None, sll.head)  # 5
+        self.assertIs(None, sll.tail)  # 5
+        self.assertEqual(0, sll.length())  # 5
+
+        # 6. Indexed lists stay current
+        sll = SLL.from_iterable(['a', 'b', 'c', 'a'], indexed=True)
+        self.assertEqual(3, sll.delete_many({'a', 'c'}))  # 6
+        self.assertEqual(False, sll.find('a'))  # 6
+        self.assertEqual(1, sll.find_sum('b'))  # 6
+        self.assertEqual('b', sll.total())  # 6
+
+    def test_unrolled(self):
+        sll = UnrolledSLL(capacity=4)
+
+        # 1. Empty unrolled list
+        self.assertEqual("None", sll.to_string())  # 1
+        self.assertIs(None, sll.total())  # 1
+        self.assertEqual(False, sll.delete(331))  # 1
+        self.assertIs(False, help_mario(sll, 'Toad'))  # 1
+
+        # 2. Appends fill blocks up to capacity
+        for i in range(10):
+            sll.append(i)
+        self.assertEqual([0, 1, 2, 3], sll.head.values)  # 2
+        self.assertEqual([8, 9], sll.tail.values)  # 2
+        self.assertEqual(" --> ".join(str(i) for i in range(10)), sll.to_string())  # 2
+        self.assertEqual(45, sll.total())  # 2
+        self.assertEqual(10, sll.length())  # 2
+
+        # 3. Underfull blocks merge with their successor
+        sll.delete(1)  # blocks: [0, 2, 3] [4, 5, 6, 7] [8, 9]
+        sll.delete(2)  # blocks: [0, 3] [4, 5, 6, 7] [8, 9], too big to merge
+        sll.delete(3)  # blocks: [0] [4, 5, 6, 7] [8, 9], still too big
+        sll.delete(5)  # blocks: [0] [4, 6, 7] [8, 9]
+        sll.delete(6)  # blocks: [0] [4, 7, 8, 9] after merging
+        self.assertEqual([4, 7, 8, 9], sll.head.next.values)  # 3
+        self.assertIs(sll.tail, sll.head.next)  # 3
+        self.assertEqual("0 --> 4 --> 7 --> 8 --> 9", sll.to_string())  # 3
+
+        # 4. Emptied blocks are unlinked
+        self.assertEqual(True, sll.delete_all(0))  # 4
+        self.assertEqual([4, 7, 8, 9], sll.head.values)  # 4
+        self.assertIs(sll.head, sll.tail)  # 4
+
+        # 5. help_mario splits the ally's block
+        self.assertIs(True, help_mario(sll, 8))  # 5
+        self.assertEqual("8 --> 9 --> 4 --> 7", sll.to_string())  # 5
+        self.assertEqual([4, 7], sll.tail.values)  # 5
+
+        # 6. Random operations behave exactly like the node-based list
+        seed(331)
+        nodes, unrolled = SLL(), UnrolledSLL(capacity=8)
+        for _ in range(3000):
+            op, value = randint(0, 5), randint(0, 20)
+            if op <= 2:
+                nodes.append(value)
+                unrolled.append(value)
+            elif op == 3:
+                self.assertEqual(nodes.delete(value), unrolled.delete(value))  # 6
+            elif op == 4:
+                self.assertEqual(nodes.delete_all(value), unrolled.delete_all(value))  # 6
+            else:
+                self.assertEqual(help_mario(nodes, value), help_mario(unrolled, value))  # 6
+            self.assertEqual(nodes.to_string(), unrolled.to_string())  # 6
+            self.assertEqual(nodes.find_sum(value), unrolled.find_sum(value))  # 6
+            self.assertEqual(nodes.find(value), unrolled.find(value))  # 6
+            self.assertEqual(nodes.length(), unrolled.length())  # 6
+            self.assertEqual(nodes.total(), unrolled.total())  # 6
+
+        # 7. NaN never equals itself, even as the very same object
+        nan = float('nan')
+        for sll in (SLL(), UnrolledSLL(capacity=4)):
+            sll.append(nan)
+            self.assertFalse(sll.find(nan))  # 7
+            self.assertEqual(0, sll.find_sum(nan))  # 7
+            self.assertFalse(sll.delete(nan))  # 7
+            self.assertFalse(sll.delete_all(nan))  # 7
+            self.assertFalse(help_mario(sll, nan))  # 7
+            self.assertEqual(1, sll.length())  # 7
+
+    def test_numeric(self):
+        sll = NumericSLL()
+
+        # 1. Empty numeric list
+        self.assertEqual("None", sll.to_string())  # 1
+        self.assertIs(None, sll.total())  # 1
+        self.assertEqual(False, sll.find(0))  # 1
+        self.assertEqual(0, sll.find_sum(0))  # 1
+
+        # 2. Integer aggregates
+        for i in [5, 8, 2, 5, 0]:
+            sll.append(i)  # SLL: 5 --> 8 --> 2 --> 5 --> 0
+        self.assertEqual(20, sll.total())  # 2
+        self.assertIs(int, type(sll.total()))  # 2
+        self.assertEqual(2, sll.find_sum(5))  # 2
+        self.assertEqual(True, sll.find(0))  # 2
+        self.assertEqual(False, sll.find('5'))  # 2
+        self.assertEqual("5 --> 8 --> 2 --> 5 --> 0", sll.to_string())  # 2
+
+        # 3. Freed slots don't count towards aggregates
+        self.assertEqual(True, sll.delete(0))  # 3, SLL: 5 --> 8 --> 2 --> 5
+        self.assertEqual(False, sll.find(0))  # 3
+        self.assertEqual(True, sll.delete_all(5))  # 3, SLL: 8 --> 2
+        self.assertEqual(10, sll.total())  # 3
+        self.assertEqual(0, sll.find_sum(5))  # 3
+        sll.compact()
+        self.assertEqual("8 --> 2", sll.to_string())  # 3
+
+        # 4. Large ints sum without wrapping
+        sll = NumericSLL()
+        sll.append(2 ** 62)
+        sll.append(2 ** 62)
+        self.assertEqual(2 ** 63, sll.total())  # 4
+
+        # 5. Non-numeric data falls back to the object path
+        sll = NumericSLL()
+        sll.append(1)
+        sll.append('Hello')
+        self.assertEqual("1 --> Hello", sll.to_string())  # 5
+        self.assertEqual(True, sll.find('Hello'))  # 5
+        self.assertIs(None, sll._live)  # 5
+        sll = NumericSLL()
+        for word in ['Hello', 'World!']:
+            sll.append(word)
+        self.assertEqual('HelloWorld!', sll.total())  # 5
+
+        # 6. Random operations behave exactly like the node-based list
+        seed(331)
+        nodes, numeric = SLL(), NumericSLL()
+        for _ in range(1000):
+            op, value = randint(0, 5), randint(0, 20)
+            if op <= 1:
+                nodes.append(value)
+                numeric.append(value)
+            elif op == 2:
+                self.assertEqual(nodes.delete(value), numeric.delete(value))  # 6
+            elif op == 3:
+                self.assertEqual(nodes.delete_all(value), numeric.delete_all(value))  # 6
+            elif op == 4:
+                self.assertEqual(help_mario(nodes, value), help_mario(numeric, value))  # 6
+            else:
+                numeric.compact()
+            self.assertEqual(nodes.to_string(), numeric.to_string())  # 6
+            self.assertEqual(nodes.find_sum(value), numeric.find_sum(value))  # 6
+            self.assertEqual(nodes.find(value), numeric.find(value))  # 6
+            self.assertEqual(nodes.total(), numeric.total())  # 6
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numeric_buffer(self):
+        sll = NumericSLL()
+
+        # 1. Ints and floats are kept in a typed buffer
+        for i in range(100):
+            sll.append(i)
+        self.assertEqual(np.int64, sll._data.dtype)  # 1
+        self.assertEqual(4950, sll.total())  # 1
+
+        # 2. Mixing in a float keeps exact values on the object path
+        sll.append(0.5)
+        self.assertIs(None, sll._live)  # 2
+        self.assertEqual(4950.5, sll.total())  # 2
+        self.assertEqual("98 --> 99 --> 0.5", sll.to_string()[-17:])  # 2
+
+        # 3. Floats get their own buffer
+        sll = NumericSLL()
+        sll.append(0.1)
+        sll.append(0.2)
+        self.assertEqual(np.float64, sll._data.dtype)  # 3
+        self.assertEqual("0.1 --> 0.2", sll.to_string())  # 3
+        self.assertEqual(1, sll.find_sum(0.2))  # 3
+
+        # 4. Ints past 2**53 don't match the float they round to, and vice versa
+        sll = NumericSLL()
+        sll.append(2.0 ** 53)
+        self.assertFalse(sll.find(2 ** 53 + 1))  # 4
+        self.assertTrue(sll.find(2 ** 53))  # 4
+        self.assertEqual(0, sll.find_sum(2 ** 53 + 1))  # 4
+        sll = NumericSLL()
+        sll.append(2 ** 53 + 1)
+        self.assertFalse(sll.find(2.0 ** 53))  # 4
+        self.assertTrue(sll.find(2 ** 53 + 1))  # 4
+        self.assertEqual(0, sll.find_sum(2.0 ** 53))  # 4
+
+    def test_help_mario_batch(self):
+        roster = SLL()
+
+        # 1. Batch on an empty roster changes nothing
+        self.assertEqual([False, False], help_mario_batch(roster, ['Toad', 'Yoshi']))  # 1
+
+        # 2. Batch matches calling help_mario one ally at a time
+        racers = ['Luigi', 'King Boo', 'Toad', 'Morton Koopa Jr.', 'Yoshi']
+        allies = ['Toad', 'Toad', 'Bowser', 'Luigi', 'Yoshi', 'King Boo']
+        expected = SLL.from_iterable(racers)
+        flags = [help_mario(expected, ally) for ally in allies]
+        for indexed in [False, True]:
+            roster = SLL.from_iterable(racers, indexed=indexed)
+            self.assertEqual(flags, help_mario_batch(roster, allies))  # 2
+            self.assertEqual(expected.to_string(), roster.to_string())  # 2
+            self.assertEqual(expected.tail.data, roster.tail.data)  # 2
+            self.assertIs(None, roster.tail.next)  # 2
+
+        # 3. Duplicated allies use their first occurrence from the current head
+        seed(331)
+        for indexed in [False, True]:
+            for _ in range(200):
+                racers = [randint(0, 9) for _ in range(randint(0, 15))]
+                allies = [randint(0, 11) for _ in range(randint(0, 6))]
+                expected = SLL.from_iterable(racers)
+                flags = [help_mario(expected, ally) for ally in allies]
+                roster = SLL.from_iterable(racers, indexed=indexed)
+                self.assertEqual(flags, help_mario_batch(roster, allies))  # 3
+                self.assertEqual(expected.to_string(), roster.to_string())  # 3
+
+        # 4. Indexed help_mario stays correct through other mutations
+        seed(3310)
+        plain, indexed = SLL(), SLL(indexed=True)
+        for _ in range(2000):
+            op, value = randint(0, 5), randint(0, 30)
+            if op <= 2:
+                plain.append(value)
+                indexed.append(value)
+            elif op == 3:
+                plain.delete(value)
+                indexed.delete(value)
+            elif op == 4:
+                plain.delete_many({value, value + 1})
+                indexed.delete_many({value, value + 1})
+            self.assertEqual(help_mario(plain, value), help_mario(indexed, value))  # 4
+            self.assertEqual(plain.to_string(), indexed.to_string())  # 4
+            self.assertIs(None, indexed.tail.next if indexed.tail else None)  # 4
+
+        # 5. Other engines fall back to one help_mario call per ally
+        roster = CompactSLL()
+        for racer in ['Luigi', 'Toad', 'Yoshi']:
+            roster.append(racer)
+        self.assertEqual([True, False, True], help_mario_batch(roster, ['Yoshi', 'Yoshi', 'Luigi']))  # 5
+        self.assertEqual("Luigi --> Toad --> Yoshi", roster.to_string())  # 5
+
+    def test_node_pool(self):
+        pool = SLLNodePool(max_size=3)
+        sll = SLL(pool=pool)
+
+        # 1. An empty pool allocates fresh nodes
+        for i in range(5):
+            sll.append(i)  # SLL: 0 --> 1 --> 2 --> 3 --> 4
+        self.assertEqual(5, pool.misses)  # 1
+        self.assertEqual(0, len(pool))  # 1
+
+        # 2. Deleted nodes go back to the pool, wiped
+        tail = sll.tail
+        self.assertEqual(True, sll.delete(4))  # 2, SLL: 0 --> 1 --> 2 --> 3
+        self.assertEqual(1, len(pool))  # 2
+        self.assertIs(None, tail.data)  # 2
+        self.assertIs(None, sll.tail.next)  # 2
+
+        # 3. append reuses pooled nodes
+        sll.append(9)  # SLL: 0 --> 1 --> 2 --> 3 --> 9
+        self.assertIs(tail, sll.tail)  # 3
+        self.assertEqual(1, pool.hits)  # 3
+        self.assertEqual("0 --> 1 --> 2 --> 3 --> 9", sll.to_string())  # 3
+
+        # 4. The pool never grows past max_size
+        self.assertEqual(5, sll.delete_if(lambda x: True))  # 4
+        self.assertEqual(3, len(pool))  # 4
+        self.assertEqual(2, pool.dropped)  # 4
+        self.assertEqual({'size': 3, 'max_size': 3, 'hits': 1, 'misses': 5,
+                          'released': 4, 'dropped': 2}, pool.stats())  # 4
+
+        # 5. Node identity stays correct between pooled lists
+        other = SLL(pool=pool)
+        sll.extend([1, 2])
+        other.extend([1, 2])
+        self.assertFalse(sll == other)  # 5
+        self.assertIsNot(sll.head, other.head)  # 5
+        self.assertEqual("1 --> 2", sll.to_string())  # 5
+        self.assertEqual("1 --> 2", other.to_string())  # 5
+
+        # 6. delete_all recycles too and drain empties the pool
+        sll.delete_all(1)
+        self.assertEqual(1, len(pool))  # 6
+        self.assertEqual(1, pool.drain())  # 6
+        self.assertEqual(0, len(pool))  # 6
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'roster.sll')
+
+            # 1. An empty list round-trips
+            SLL().save(path)
+            sll = SLL.load(path)
+            self.assertIs(None, sll.head)  # 1
+            self.assertIs(None, sll.tail)  # 1
+
+            # 2. Mixed ints, floats, strings and bools keep their order and types
+            values = [15, 7.5, 'CSE331', True, -2 ** 63, '', 0.0, False, 'Müller']
+            SLL.from_iterable(values).save(path, chunk_size=4)
+            loaded = list(SLL.iter_load(path))
+            self.assertEqual(values, loaded)  # 2
+            self.assertEqual([type(v) for v in values], [type(v) for v in loaded])  # 2
+
+            # 3. load builds the list in one pass
+            sll = SLL.load(path, indexed=True)
+            self.assertEqual(len(values), sll.length())  # 3
+            self.assertEqual('Müller', sll.tail.data)  # 3
+            self.assertEqual(True, sll.find('CSE331'))  # 3
+
+            # 4. Larger lists span many blocks
+            SLL.from_iterable(range(10000)).save(path, chunk_size=1000)
+            sll = SLL.load(path)
+            self.assertEqual(10000, sll.length())  # 4
+            self.assertEqual(sum(range(10000)), sll.total())  # 4
+
+            # 5. Unsupported types and foreign files are rejected
+            with self.assertRaises(TypeError):
+                SLL.from_iterable([1, None]).save(path)  # 5
+            with open(path, 'wb') as f:
+                f.write(b'not an SLL')
+            with self.assertRaises(ValueError):
+                SLL.load(path)  # 5
+
+            # 6. A failed save leaves the previous file in place
+            SLL.from_iterable([1, 2, 3]).save(path)
+            with self.assertRaises(ValueError):
+                SLL.from_iterable([4, 2 ** 63]).save(path)  # 6
+            with self.assertRaises(ValueError):
+                SLL.from_iterable([-2 ** 63 - 1]).save(path)  # 6
+            with self.assertRaises(TypeError):
+                SLL.from_iterable([4, None]).save(path)  # 6
+            self.assertEqual([1, 2, 3], list(SLL.iter_load(path)))  # 6
+            self.assertEqual(['roster.sll'], os.listdir(folder))  # 6
+            mask = os.umask(0o022)
+            try:
+                os.remove(path)
+                SLL.from_iterable([1]).save(path)
+                self.assertEqual(0o644, os.stat(path).st_mode & 0o777)  # 6
+            finally:
+                os.umask(mask)
+
+    def test_iteration(self):
+        sll = SLL()
+
+        # 1. Iterating, len and in on an empty list
+        self.assertEqual([], list(sll))  # 1
+        self.assertEqual(0, len(sll))  # 1
+        self.assertFalse(5 in sll)  # 1
+
+        sll.extend([3, 1, 4, 1, 5, 9, 2, 6])
+
+        # 2. Iteration runs head to tail
+        self.assertEqual([3, 1, 4, 1, 5, 9, 2, 6], list(sll))  # 2
+        self.assertEqual(8, len(sll))  # 2
+        self.assertTrue(9 in sll)  # 2
+        self.assertFalse(7 in sll)  # 2
+
+        # 3. Views are lazy and re-iterable
+        seen = []
+        view = sll.view().map(lambda x: seen.append(x) or x * 10)
+        self.assertEqual([], seen)  # 3
+        self.assertEqual([30, 10, 40], list(view.take(3)))  # 3
+        self.assertEqual([3, 1, 4], seen)  # 3
+        self.assertEqual(8, len(list(view)))  # 3
+
+        # 4. Steps chain in order
+        view = sll.view().filter(lambda x: x != 1).take_while(lambda x: x < 9).map(str)
+        self.assertEqual(['3', '4', '5'], list(view))  # 4
+        self.assertEqual([9, 2, 6], list(sll.view().drop_while(lambda x: x != 9)))  # 4
+
+        # 5. Views see later changes to the list and can be materialized
+        view = sll.view().filter(lambda x: x % 2 == 0)
+        sll.append(8)
+        copy = view.to_sll(indexed=True)
+        self.assertEqual("4 --> 2 --> 6 --> 8", copy.to_string())  # 5
+        self.assertTrue(8 in copy)  # 5
+        self.assertEqual(4, len(copy))  # 5
+
+    def test_concurrent(self):
+        sll = ConcurrentSLL()
+
+        # 1. Behaves like a plain list from one thread
+        sll.extend([4, 2, 4])
+        sll.append(1)  # SLL: 4 --> 2 --> 4 --> 1
+        self.assertEqual("4 --> 2 --> 4 --> 1", sll.to_string())  # 1
+        self.assertEqual(True, sll.delete(2))  # 1
+        self.assertEqual(1, sll.delete_many({1}))  # 1
+        self.assertIs(False, help_mario(sll, 4))  # 1
+        self.assertEqual(8, sll.total())  # 1
+        self.assertEqual(sll.head.next, sll.tail)  # 1
+
+        # 2. Many threads appending while others read
+        sll = ConcurrentSLL(indexed=True)
+        writers, per_writer = 8, 2000
+        done = threading.Event()
+        reads = []
+
+        def write(start):
+            for i in range(start, start + per_writer):
+                sll.append(i)
+
+        def read():
+            count = 0
+            while not done.is_set():
+                sll.find(0)
+                sll.find_sum(per_writer)
+                count += 1
+            reads.append(count)
+
+        readers = [threading.Thread(target=read) for _ in range(2)]
+        threads = [threading.Thread(target=write, args=(w * per_writer,)) for w in range(writers)]
+        for thread in readers + threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        total = writers * per_writer
+        self.assertEqual(total, sll.length())  # 2
+        self.assertEqual(list(range(total)), sorted(sll))  # 2
+        self.assertEqual(total, len(list(sll)))  # 2
+        self.assertIs(None, sll.tail.next)  # 2
+        self.assertEqual(sum(range(total)), sll.total())  # 2
+        self.assertTrue(all(sll.find(i) for i in range(0, total, 97)))  # 2
+        self.assertEqual(2, len(reads))  # 2
+
+        # 3. Lock statistics add up
+        stats = sll.contention()
+        self.assertEqual(total, stats['acquisitions'])  # 3
+        self.assertLessEqual(stats['contended'], stats['acquisitions'])  # 3
+
+        # 4. Pools are refused
+        with self.assertRaises(ValueError):
+            ConcurrentSLL(pool=SLLNodePool())  # 4
+
+    def test_sorted(self):
+        sll = SortedSLL(seed=331)
+
+        # 1. Empty sorted list
+        self.assertEqual("None", sll.to_string())  # 1
+        self.assertEqual(False, sll.find(5))  # 1
+        self.assertEqual(False, sll.delete(5))  # 1
+        self.assertEqual([], list(sll.range(0, 10)))  # 1
+
+        # 2. Inserts land in sorted order, to_string matches the base list
+        for i in [5, 1, 9, 3, 7, 3]:
+            sll.insert_sorted(i)  # SLL: 1 --> 3 --> 3 --> 5 --> 7 --> 9
+        self.assertEqual(SLL.from_iterable([1, 3, 3, 5, 7, 9]).to_string(), sll.to_string())  # 2
+        self.assertEqual(1, sll.head.data)  # 2
+        self.assertEqual(9, sll.tail.data)  # 2
+        self.assertEqual(2, sll.find_sum(3))  # 2
+        self.assertEqual(True, sll.find(7))  # 2
+        self.assertEqual(False, sll.find(4))  # 2
+
+        # 3. Range queries are half-open
+        self.assertEqual([3, 3, 5], list(sll.range(2, 7)))  # 3
+        self.assertEqual([7, 9], list(sll.range(6, 100)))  # 3
+
+        # 4. Deletes keep head, tail and the lanes consistent
+        self.assertEqual(True, sll.delete(1))  # 4, SLL: 3 --> 3 --> 5 --> 7 --> 9
+        self.assertEqual(True, sll.delete_all(3))  # 4, SLL: 5 --> 7 --> 9
+        self.assertEqual(True, sll.delete(9))  # 4, SLL: 5 --> 7
+        self.assertEqual("5 --> 7", sll.to_string())  # 4
+        self.assertEqual(5, sll.head.data)  # 4
+        self.assertEqual(7, sll.tail.data)  # 4
+        self.assertEqual(12, sll.total())  # 4
+        self.assertEqual(2, sll.length())  # 4
+
+        # 5. help_mario can't reorder a sorted list
+        with self.assertRaises(TypeError):
+            help_mario(sll, 7)  # 5
+
+        # 6. Random operations match a sorted Python list
+        seed(331)
+        for indexed in [False, True]:
+            sll = SortedSLL(indexed=indexed, seed=3310)
+            expected = []
+            for _ in range(2000):
+                op, value = randint(0, 6), randint(0, 50)
+                if op <= 2:
+                    sll.insert_sorted(value)
+                    expected.append(value)
+                    expected.sort()
+                elif op == 3:
+                    self.assertEqual(value in expected, sll.delete(value))  # 6
+                    if value in expected:
+                        expected.remove(value)
+                elif op == 4:
+                    self.assertEqual(value in expected, sll.delete_all(value))  # 6
+                    expected = [v for v in expected if v != value]
+                elif op == 5:
+                    sll.delete_if(lambda x: x % 13 == value % 13)
+                    expected = [v for v in expected if v % 13 != value % 13]
+                else:
+                    self.assertEqual([v for v in expected if value <= v < value + 10],
+                                     list(sll.range(value, value + 10)))  # 6
+                self.assertEqual(expected, list(sll))  # 6
+                self.assertEqual(expected.count(value), sll.find_sum(value))  # 6
+                self.assertEqual(value in expected, sll.find(value))  # 6
+                if not expected:
+                    self.assertIs(None, sll.tail)  # 6
+                else:
+                    self.assertEqual(expected[-1], sll.tail.data)  # 6
+                    self.assertIs(None, sll.tail.next)  # 6
+            # every lane entry still points at a node of the chain, in order
+            nodes = set()
+            node = sll.head
+            while node is not None:
+                nodes.add(id(node))
+                node = node.next
+            for lane in sll._lanes:
+                values = []
+                while lane is not None:
+                    self.assertIn(id(lane.node), nodes)  # 6
+                    values.append(lane.node.data)
+                    lane = lane.next
+                self.assertEqual(sorted(values), values)  # 6
+
+    def test_instrumentation(self):
+        # 1. Disabled by default, nothing recorded
+        sll = SLL.from_iterable(range(10))
+        sll.find(3)
+        self.assertEqual({}, sll.stats())  # 1
+        self.assertIs(SLL, type(sll))  # 1
+
+        # 2. Scans record the nodes they walk
+        sll.enable_instrumentation()
+        self.assertIsInstance(sll, SLL)  # 2
+        self.assertTrue(sll.find(3))  # 2
+        self.assertFalse(sll.find(99))  # 2
+        self.assertTrue(sll.delete_all(4))  # 2
+        stats = sll.stats()
+        self.assertEqual(2, stats['find']['calls'])  # 2
+        self.assertEqual(4 + 10, stats['find']['nodes_visited'])  # 2
+        self.assertEqual(10, stats['delete_all']['nodes_visited'])  # 2
+        self.assertGreaterEqual(stats['find']['seconds'], 0)  # 2
+
+        # 3. Allocations and net nodes added, help_mario goes through the module function
+        sll.append(42)
+        self.assertTrue(help_mario(sll, 5))  # 3
+        self.assertEqual([True, True], help_mario_batch(sll, [7, 8]))  # 3
+        stats = sll.stats(reset=True)
+        self.assertEqual(1, stats['append']['net_nodes_added'])  # 3
+        self.assertEqual(1, stats['append']['allocations'])  # 3
+        self.assertEqual(0, stats['help_mario']['allocations'])  # 3
+        self.assertEqual(5, stats['help_mario']['nodes_visited'])  # 3
+        self.assertEqual('8 --> 9 --> 42 --> 0 --> 1 --> 2 --> 3 --> 5 --> 6 --> 7', sll.to_string())  # 3
+        self.assertEqual(10, sll.stats()['to_string']['nodes_visited'])  # 3
+
+        # 4. Indexed lookups walk nothing, pool hits allocate nothing
+        pool = SLLNodePool()
+        sll = SLL(indexed=True, pool=pool)
+        sll.enable_instrumentation()
+        sll.append(1)
+        sll.delete(1)
+        sll.append(2)
+        sll.find(2)
+        stats = sll.stats()
+        self.assertEqual(2, stats['append']['net_nodes_added'])  # 4
+        self.assertEqual(1, stats['append']['allocations'])  # 4
+        self.assertEqual(-1, stats['delete']['net_nodes_added'])  # 4
+        self.assertEqual((1, 1), (pool.hits, pool.misses))  # 4
+        self.assertEqual(0, stats['find']['nodes_visited'])  # 4
+
+        # 5. Turning it off restores the plain class and keeps the counts
+        sll.disable_instrumentation()
+        self.assertIs(SLL, type(sll))  # 5
+        sll.find(2)
+        self.assertEqual(1, sll.stats()['find']['calls'])  # 5
+
+        # 6. Subclasses keep their behavior, unmodelled walks report None
+        sll = SortedSLL(seed=3)
+        sll.enable_instrumentation()
+        sll.extend([3, 1, 2])
+        self.assertEqual('1 --> 2 --> 3', sll.to_string())  # 6
+        self.assertTrue(sll.find(2))  # 6
+        self.assertIsNone(sll.stats()['find']['nodes_visited'])  # 6
+        with self.assertRaises(TypeError):
+            help_mario(sll, 2)  # 6
+        sll = ConcurrentSLL()
+        sll.enable_instrumentation()
+        sll.append(1)
+        self.assertEqual(1, sll.stats()['append']['net_nodes_added'])  # 6
+        self.assertEqual(1, sll.contention()['acquisitions'])  # 6
+
+    def test_persistent(self):
+        # 1. Empty version
+        empty = PersistentSLL()
+        self.assertEqual('None', empty.to_string())  # 1
+        self.assertEqual(0, empty.length())  # 1
+        self.assertIsNone(empty.total())  # 1
+        self.assertIs(empty, empty.delete(1))  # 1
+        self.assertIs(empty, empty.help_mario(1))  # 1
+
+        # 2. Appends return new versions and leave old ones alone
+        base = PersistentSLL.from_iterable(range(5))
+        longer = base.append(5)
+        branch = base.append(9)
+        self.assertEqual('0 --> 1 --> 2 --> 3 --> 4', base.to_string())  # 2
+        self.assertEqual([0, 1, 2, 3, 4, 5], list(longer))  # 2
+        self.assertEqual([0, 1, 2, 3, 4, 9], list(branch))  # 2
+
+        # 3. Delete and help_mario share nodes with the version they came from
+        deleted = longer.delete(3)
+        rotated = deleted.help_mario(4)
+        self.assertEqual([0, 1, 2, 4, 5], list(deleted))  # 3
+        self.assertEqual([4, 5, 0, 1, 2], list(rotated))  # 3
+        self.assertEqual([4, 5, 0, 1, 2, 7], list(rotated.append(7)))  # 3
+        self.assertEqual([0, 1, 2, 3, 4, 5], list(longer))  # 3
+        self.assertIs(longer._runs[0][0], rotated._runs[-1][0])  # 3
+        self.assertIs(rotated, rotated.help_mario(4))  # 3
+        self.assertIs(rotated, rotated.delete(42))  # 3
+
+        # 4. Queries
+        self.assertEqual(12, rotated.total())  # 4
+        self.assertTrue(rotated.find(0))  # 4
+        self.assertNotIn(3, rotated)  # 4
+        self.assertEqual(2, longer.append(1).find_sum(1))  # 4
+        self.assertEqual(5, len(rotated))  # 4
+
+        # 5. Compacting copies, converting gives a mutable SLL
+        compact = rotated.compact()
+        self.assertEqual(list(rotated), list(compact))  # 5
+        self.assertEqual(1, len(compact._runs))  # 5
+        self.assertEqual(rotated.to_string(), rotated.to_sll().to_string())  # 5
+        with self.assertRaises(TypeError):
+            help_mario(rotated, 0)  # 5
+
+        # 6. Random histories match list snapshots
+        seed(331)
+        versions = [(PersistentSLL(), [])]
+        for _ in range(500):
+            version, expected = versions[randint(0, len(versions) - 1)]
+            op, value = randint(0, 2), randint(0, 7)
+            if op == 0:
+                version, expected = version.append(value), expected + [value]
+            elif op == 1:
+                version = version.delete(value)
+                if value in expected:
+                    expected = expected[:]
+                    expected.remove(value)
+            else:
+                version = version.help_mario(value)
+                if value in expected:
+                    at = expected.index(value)
+                    expected = expected[at:] + expected[:at]
+            versions.append((version, expected))
+        for version, expected in versions:
+            self.assertEqual(expected, list(version))  # 6
+            self.assertEqual(len(expected), version.length())  # 6
+
+        # 7. Equality follows the nodes, and runs stay few
+        base = PersistentSLL.from_iterable([1, 2, 3])
+        self.assertEqual(base, base.help_mario(2).help_mario(1))  # 7
+        self.assertEqual(1, len(base.help_mario(2).help_mario(1)._runs))  # 7
+        self.assertNotEqual(base, PersistentSLL.from_iterable([1, 2, 3]))  # 7
+        self.assertNotEqual(base, base.delete(3))  # 7
+        version = PersistentSLL.from_iterable(range(2000))
+        for value in range(0, 2000, 2):
+            version = version.delete(value)
+        self.assertEqual(list(range(1, 2000, 2)), list(version))  # 7
+        self.assertLessEqual(len(version._runs), max(PersistentSLL._MAX_RUNS, len(version) // PersistentSLL._MIN_RUN))  # 7
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""
+Microbenchmark for the DLL engines
+Times DLL against an indexed DLL, SentinelDLL and BlockDLL on push/pop-heavy workloads
+and on whole-list scans, and prints ops/sec for each engine plus its speedup
+over DLL.
+
+usage: python benchmark.py [--ops 200000] [--repeat 5] [--only queue stack]
+"""
+
+import argparse
+import sys
+import time
+from functools import partial
+from random import Random
+from typing import Callable, Dict, List, Tuple
+
+from solution import DLL, BlockDLL, SentinelDLL
+
+ENGINES = {'DLL': DLL, 'indexed DLL': partial(DLL, True), 'SentinelDLL': SentinelDLL,
+           'BlockDLL': BlockDLL}
+
+
+# Each workload takes the number of operations and returns (setup, run, ops):
+# setup builds the list `run` starts from and is not timed, `run` performs
+# `ops` operations on it.
+Workload = Callable[[type, int], Tuple[Callable[[], object], Callable[[object], None], int]]
+
+
+def queue(engine: type, n: int):
+    """
+    FIFO: push to the back, pop from the front, on a queue holding ~1000 items
+    """
+    def setup():
+        dll = engine()
+        dll.list_to_dll(range(1000))
+        return dll
+
+    def run(dll) -> None:
+        push, pop = dll.push, dll.pop
+        for i in range(n // 2):
+            push(i)
+            pop(False)
+    return setup, run, n // 2 * 2
+
+
+def stack(engine: type, n: int):
+    """
+    LIFO: push and pop at the back, draining to empty every 64 pushes
+    """
+    def run(dll) -> None:
+        push, pop = dll.push, dll.pop
+        for _ in range(n // 128):
+            for i in range(64):
+                push(i)
+            for _ in range(64):
+                pop()
+    return engine, run, n // 128 * 128
+
+
+def deque(engine: type, n: int):
+    """
+    Random mix of pushes and pops at both ends, hovering around empty
+    """
+    rng = Random(331)
+    plan = [(rng.random() < 0.5, rng.random() < 0.55) for _ in range(n)]
+
+    def run(dll) -> None:
+        push, pop = dll.push, dll.pop
+        for back, grow in plan:
+            if grow:
+                push(0, back)
+            else:
+                pop(back)
+    return engine, run, n
+
+
+def front(engine: type, n: int):
+    """
+    Push a handful of repeated values to the front, so an index keeps long buckets
+    """
+    def run(dll) -> None:
+        push = dll.push
+        for i in range(n):
+            push(i % 4, False)
+    return engine, run, n
+
+
+def churn(engine: type, n: int):
+    """
+    Unlink the front Node and push a replacement at the back, through remove_node
+    """
+    def setup():
+        dll = engine()
+        dll.list_to_dll(range(1000))
+        return dll
+
+    def run(dll) -> None:
+        push, remove_node = dll.push, dll.remove_node
+        for i in range(n // 2):
+            remove_node(dll.head)
+            push(i)
+    return setup, run, n // 2 * 2
+
+
+def scan(engine: type, n: int):
+    """
+    find() for an absent value and dll_to_list() on a list of 100000 values
+    """
+    reps = max(1, n // 100000)
+
+    def setup():
+        dll = engine()
+        dll.list_to_dll(range(100000))
+        return dll
+
+    def run(dll) -> None:
+        for _ in range(reps):
+            dll.find(-1)
+            dll.dll_to_list()
+    return setup, run, reps * 2
+
+
+WORKLOADS: Dict[str, Workload] = {
+    'queue': queue,
+    'stack': stack,
+    'deque': deque,
+    'front': front,
+    'churn': churn,
+    'scan': scan,
+}
+
+
+def measure(workload: Workload, engine: type, n: int, repeat: int) -> Dict[str, float]:
+    """
+    Times one workload on one engine, best of `repeat` runs
+    :param workload: workload factory
+    :param engine: DLL class to run it on
+    :param n: number of operations
+    :param repeat: number of timed runs
+    :return: dict with ops_per_sec and seconds
+    """
+    setup, run, ops = workload(engine, n)
+    best = float('inf')
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        best = min(best, time.perf_counter() - start)
+    return {'ops_per_sec': ops / best if best > 0 else float('inf'), 'seconds': best}
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Command line entry point
+    :param argv: arguments, defaults to sys.argv
+    :return: exit code
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--ops', type=int, default=200000, help='operations per workload')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per measurement')
+    parser.add_argument('--only', nargs='+', choices=sorted(WORKLOADS), default=list(WORKLOADS),
+                        help='workloads to run')
+    args = parser.parse_args(argv)
+
+    for name in args.only:
+        results = {label: measure(WORKLOADS[name], engine, args.ops, args.repeat)
+                   for label, engine in ENGINES.items()}
+        for label, result in results.items():
+            print(f"{name:>6} {label:>12} {result['ops_per_sec']:>14,.0f} ops/s")
+        for label, result in results.items():
+            if label != 'DLL':
+                speedup = result['ops_per_sec'] / results['DLL']['ops_per_sec']
+                print(f"{name:>6} {label:>12} {speedup:>14.2f}x DLL")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
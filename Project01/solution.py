@@ -8,7 +8,9 @@ solution.py
 """
 
 from __future__ import annotations
-from typing import List, TypeVar, Tuple, Optional
+import time
+from itertools import chain, islice
+from typing import Callable, Iterable, List, TypeVar, Tuple, Optional
 
 # for more information on type hinting, check out https://docs.python.org/3/library/typing.html
 T = TypeVar("T")  # represents generic type
@@ -54,21 +56,248 @@ class Node:
     __str__ = __repr__
 
 
+class _Bucket:
+    """
+    Nodes of an indexed DLL that hold one value, in physical list order.
+    `front` holds the Nodes added before all the others, newest first, and
+    `back` the rest in order, so adding at either end and removing are O(1).
+    """
+    __slots__ = ["front", "back"]
+
+    def __init__(self) -> None:
+        """
+        Construct an empty bucket.
+
+        :return: None.
+        """
+        self.front = {}
+        self.back = {}
+
+    def __len__(self) -> int:
+        """
+        Number of Nodes in the bucket.
+
+        :return: Node count.
+        """
+        return len(self.front) + len(self.back)
+
+    def __iter__(self) -> Iterable[Node]:
+        """
+        Iterate over the Nodes in physical order.
+
+        :return: iterator of Nodes.
+        """
+        return chain(reversed(self.front), self.back)
+
+    def __reversed__(self) -> Iterable[Node]:
+        """
+        Iterate over the Nodes in reverse physical order.
+
+        :return: iterator of Nodes.
+        """
+        return chain(reversed(self.back), self.front)
+
+    def __contains__(self, node: Node) -> bool:
+        """
+        Check whether `node` is in the bucket.
+
+        :param node: Node to look for.
+        :return: True if present, else False.
+        """
+        return node in self.back or node in self.front
+
+    def remove(self, node: Node) -> None:
+        """
+        Forget `node`.
+
+        :param node: Node in the bucket.
+        :return: None.
+        """
+        if node in self.back:
+            del self.back[node]
+        else:
+            del self.front[node]
+
+    def reverse(self) -> None:
+        """
+        Follow a reversal of the DLL, in O(1).
+
+        :return: None.
+        """
+        self.front, self.back = self.back, self.front
+
+    def insert_after(self, before: Node, node: Node) -> None:
+        """
+        Place `node` right after `before`; O(1) if `before` is the last Node, else a rebuild.
+
+        :param before: Node in the bucket.
+        :param node: Node to add.
+        :return: None.
+        """
+        if before is next(reversed(self)):
+            self.back[node] = None
+            return
+        nodes = []
+        for other in self:
+            nodes.append(other)
+            if other is before:
+                nodes.append(node)
+        self.front, self.back = {}, dict.fromkeys(nodes)
+
+    def insert_before(self, after: Node, node: Node) -> None:
+        """
+        Place `node` right before `after`; O(1) if `after` is the first Node, else a rebuild.
+
+        :param after: Node in the bucket.
+        :param node: Node to add.
+        :return: None.
+        """
+        if after is next(iter(self)):
+            self.front[node] = None
+            return
+        nodes = []
+        for other in self:
+            if other is after:
+                nodes.append(node)
+            nodes.append(other)
+        self.front, self.back = {}, dict.fromkeys(nodes)
+
+
+# per-class instrumented subclasses, built the first time a DLL of that class opts in
+_INSTRUMENTED = {}
+
+
+def _traced(name: str, method: Callable, visits: Callable, allocates: Callable) -> Callable:
+    """
+    Wrap `method` so each call is recorded under `name` in the DLL's stats.
+
+    :param name: key in the stats snapshot.
+    :param method: unwrapped method.
+    :param visits: works out the Nodes the call walks from the DLL as it is before the call.
+    :param allocates: works out the Nodes the call allocates from the size before and
+        after it, None if it allocates none.
+    :return: recording method.
+    """
+    def traced(self, *args, **kwargs):
+        record = self._stats.get(name)
+        if record is None:
+            record = self._stats[name] = {"calls": 0, "nodes_visited": 0, "allocations": 0,
+                                          "net_nodes_added": 0, "seconds": 0.0}
+        # counted before the clock starts, so it never shows up in `seconds`
+        record["nodes_visited"] += visits(self, *args, **kwargs)
+        before = self.size
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            record["seconds"] += time.perf_counter() - start
+            record["calls"] += 1
+            record["net_nodes_added"] += self.size - before
+            if allocates is not None:
+                record["allocations"] += allocates(before, self.size)
+    traced.__name__ = method.__name__
+    traced.__doc__ = method.__doc__
+    return traced
+
+
+def _first_visits(dll: DLL, val: T) -> int:
+    """
+    Count the Nodes a scan for the first `val` walks over.
+
+    :param dll: DLL to scan.
+    :param val: value the scan stops at.
+    :return: 1-based position of the first match, or the size if `val` is absent.
+    """
+    visited = 0
+    node = dll.tail if dll._flipped else dll.head
+    while node is not None:
+        visited += 1
+        if node.value == val:
+            break
+        node = node.prev if dll._flipped else node.next
+    return visited
+
+
+def _instrumented_class(cls: type) -> type:
+    """
+    Build (once per class) the subclass of `cls` whose traced methods record their calls.
+    DLLs switch to it in `enable_instrumentation`, so DLLs that never opt in
+    run the plain methods without so much as a flag check.
+
+    :param cls: DLL class to instrument.
+    :return: instrumented subclass.
+    """
+    instrumented = _INSTRUMENTED.get(cls)
+    if instrumented is None:
+        namespace = {"__slots__": (), "_plain": cls}
+        for name, visits in cls._TRACED.items():
+            namespace[name] = _traced(name, getattr(cls, name), visits, cls._ALLOCATING.get(name))
+        instrumented = _INSTRUMENTED[cls] = type("Instrumented" + cls.__name__, (cls,), namespace)
+    return instrumented
+
+
 class DLL:
     """
     Implementation of a doubly linked list without padding nodes.
     Modify only below indicated line.
     """
-    __slots__ = ["head", "tail", "size"]
+    __slots__ = ["head", "tail", "size", "_stats", "_index", "_finger", "_finger_index", "_flipped"]
 
-    def __init__(self) -> None:
+    # method -> Nodes one call walks, worked out from the DLL before the call;
+    # instrumented DLLs record these (see enable_instrumentation)
+    _TRACED = {
+        "push": lambda self, val, back=True: 0,
+        "pop": lambda self, back=True: 0,
+        "list_to_dll": lambda self, source: 0,
+        "extend": lambda self, iterable, back=True: 0,
+        "extendleft": lambda self, iterable: 0,
+        "dll_to_list": lambda self: self.size,
+        "find": lambda self, val: 0 if self._index is not None else _first_visits(self, val),
+        "find_all": lambda self, val: 0 if self._index is not None else self.size,
+        "remove_node": lambda self, to_remove: 0,
+        "remove": lambda self, val: 0 if self._index is not None else _first_visits(self, val),
+        "remove_all": lambda self, val: 0 if self._index is not None else self.size,
+        "remove_values": lambda self, values: 0 if self._index is not None else self.size,
+        "remove_if": lambda self, predicate: self.size,
+        "reverse": lambda self: self.size if self.size > 1 else 0,
+        "flip": lambda self: 0,
+        "realign": lambda self: self.size if self._flipped and self.size > 1 else 0,
+        "__getitem__": lambda self, index: self._walk_length(self._physical(index)),
+        "insert_at": lambda self, index, val: (0 if self._insert_position(index) in (-1, 0, self.size)
+                                               else self._walk_length(self._insert_position(index))),
+        "pop_at": lambda self, index: self._walk_length(self._physical(index)),
+    }
+    # method -> Nodes one call allocates, worked out from the size before and after
+    # the call; list_to_dll builds every Node anew, unlisted methods allocate none
+    _ALLOCATING = {
+        "push": lambda before, after: after - before,
+        "list_to_dll": lambda before, after: after,
+        "extend": lambda before, after: after - before,
+        "extendleft": lambda before, after: after - before,
+        "insert_at": lambda before, after: after - before,
+    }
+    # class a DLL goes back to when instrumentation is turned off
+    _plain = None
+
+    def __init__(self, indexed: bool = False) -> None:
         """
         Construct an empty doubly linked list.
 
+        :param indexed: if True, keep a value index so lookups and removals
+            cost time proportional to the number of matches.
         :return: None.
         """
         self.head = self.tail = None
         self.size = 0
+        # per-method call records, only kept once instrumentation is turned on
+        self._stats = None
+        # value -> {Node: None} in list order, only kept when indexing is turned on
+        self._index = {} if indexed else None
+        # last Node reached by position and its index, None when unknown
+        self._finger = None
+        self._finger_index = 0
+        # True while the DLL reads tail to head, see flip
+        self._flipped = False
 
     def __repr__(self) -> str:
         """
@@ -77,10 +306,10 @@ class DLL:
         :return: string representation of the DLL.
         """
         result = []
-        node = self.head
+        node = self.tail if self._flipped else self.head
         while node is not None:
             result.append(str(node))
-            node = node.next
+            node = node.prev if self._flipped else node.next
         return " <-> ".join(result)
 
     def __str__(self) -> str:
@@ -93,6 +322,126 @@ class DLL:
 
     # MODIFY BELOW #
 
+    def enable_instrumentation(self) -> None:
+        """
+        Start recording calls, Nodes visited, allocations, net Nodes added and wall time per method.
+        The DLL switches to an instrumented subclass of its own class, so a DLL
+        that never turns this on pays nothing for it. Nodes visited come from
+        the `_TRACED` model, which walks the DLL itself before each call, outside
+        the timing, so an instrumented `find` or `remove` walks the DLL twice.
+        Allocations come from the `_ALLOCATING` model in the same way.
+
+        :return: None.
+        """
+        if self._stats is None:
+            self._stats = {}
+        if type(self)._plain is None:
+            self.__class__ = _instrumented_class(type(self))
+
+    def disable_instrumentation(self) -> None:
+        """
+        Stop recording; the counts so far stay readable through `stats`.
+
+        :return: None.
+        """
+        if type(self)._plain is not None:
+            self.__class__ = type(self)._plain
+
+    def stats(self, reset: bool = False) -> dict:
+        """
+        Snapshot of the instrumentation counts. Counts are inclusive: `remove`
+        walks the DLL through `find`, so that walk is recorded under both.
+
+        :param reset: if True, start counting from zero again afterwards.
+        :return: {method: {"calls", "nodes_visited", "allocations", "net_nodes_added", "seconds"}},
+            where allocations counts new Nodes and net_nodes_added is the change
+            in size, negative for removals.
+        """
+        if self._stats is None:
+            return {}
+        snapshot = {name: dict(record) for name, record in self._stats.items()}
+        if reset:
+            self._stats = {}
+        return snapshot
+
+    def enable_index(self) -> None:
+        """
+        Turn on the value index, building it from the Nodes already in the DLL.
+        Values must be hashable while the index is enabled.
+
+        :return: None.
+        """
+        self._index = {}
+        node = self.head
+        while node is not None:
+            self._index_add(node)
+            node = node.next
+
+    def disable_index(self) -> None:
+        """
+        Turn off the value index; lookups go back to scanning the DLL.
+
+        :return: None.
+        """
+        self._index = None
+
+    def _index_add(self, node: Node, front: bool = False) -> None:
+        """
+        Record a Node that was just linked in at the back (or front) of the DLL.
+
+        :param node: Node to record.
+        :param front: if True, `node` is now the first Node holding its value.
+        :return: None.
+        """
+        nodes = self._index.get(node.value)
+        if nodes is None:
+            nodes = self._index[node.value] = _Bucket()
+        if front:
+            nodes.front[node] = None
+        else:
+            nodes.back[node] = None
+
+    def _index_insert(self, node: Node) -> None:
+        """
+        Record a Node that was just linked in somewhere in the middle of the DLL.
+        Walks outwards both ways at once until it meets a Node with the same
+        value or an end, so it never walks further than twice the nearer end.
+
+        :param node: Node to record.
+        :return: None.
+        """
+        nodes = self._index.get(node.value)
+        if nodes is None:
+            self._index_add(node)
+            return
+        before, after = node.prev, node.next
+        while True:
+            if before is None:
+                nodes.front[node] = None
+                return
+            if before in nodes:
+                nodes.insert_after(before, node)
+                return
+            if after is None:
+                nodes.back[node] = None
+                return
+            if after in nodes:
+                nodes.insert_before(after, node)
+                return
+            before, after = before.prev, after.next
+
+    def _index_remove(self, node: Node) -> None:
+        """
+        Forget a Node that is being unlinked.
+
+        :param node: Node to forget.
+        :return: None.
+        """
+        nodes = self._index[node.value]
+        nodes.remove(node)
+        if not nodes:
+            del self._index[node.value]
+
     def empty(self) -> bool:
         """
         Return boolean indicating whether DLL is empty.
@@ -110,6 +459,9 @@ class DLL:
             if False, add to front (head-end).
         :return: None.
         """
+        # a flipped DLL's back is its physical head
+        if self._flipped:
+            back = not back
         newNode = Node(val)
 
         if self.size == 0:
@@ -128,6 +480,11 @@ class DLL:
             newNode.next = self.head
             # head = new
             self.head = newNode
+        if self._index is not None:
+            self._index_add(newNode, not back)
+        # everything after a new head moves one position right
+        if self._finger is not None and not back:
+            self._finger_index += 1
         self.size += 1
         return
     def pop(self, back: bool = True) -> None:
@@ -140,6 +497,15 @@ class DLL:
         """
         if self.size == 0:
             return
+        if self._flipped:
+            back = not back
+        if self._index is not None:
+            self._index_remove(self.tail if back else self.head)
+        if self._finger is not None:
+            if self._finger is (self.tail if back else self.head):
+                self._finger = None
+            elif not back:
+                self._finger_index -= 1
         if self.size == 1:
             self.head = self.tail = None
         elif back:
@@ -159,17 +525,103 @@ class DLL:
         return
     def list_to_dll(self, source: List[T]) -> None:
         """
-        Construct DLL from a standard Python list.
+        Construct DLL from a standard Python list, or any iterable, in one linking pass.
 
         :param source: standard Python list from which to construct DLL.
         :return: None.
         """
         self.head = self.tail = None
         self.size = 0
-        for value in source:
-            self.push(value, True)
+        self._finger = None
+        self._flipped = False
+        if self._index is not None:
+            self._index = {}
+        self._splice(source, True, False)
         return
 
+    def extend(self, iterable: Iterable[T], back: bool = True) -> None:
+        """
+        Add every value of `iterable` to the back (or front) of the DLL, keeping their order.
+        Values are linked in one pass and `size` is updated once.
+
+        :param iterable: values to be added; generators are consumed lazily.
+        :param back: if True, add after the last value; if False, before the first.
+        :return: None.
+        """
+        self._splice(iterable, back != self._flipped, self._flipped)
+
+    def extendleft(self, iterable: Iterable[T]) -> None:
+        """
+        Push every value of `iterable` to the front in turn, so they end up in
+        reverse order, like `collections.deque.extendleft`. Linked in one pass.
+
+        :param iterable: values to be added; generators are consumed lazily.
+        :return: None.
+        """
+        self._splice(iterable, self._flipped, not self._flipped)
+
+    def _splice(self, iterable: Iterable[T], at_tail: bool, reverse: bool) -> None:
+        """
+        Link the values of `iterable` into a chain, then splice it onto one end.
+
+        :param iterable: values to be added.
+        :param at_tail: if True, splice after `tail`; if False, before `head`.
+        :param reverse: if True, the chain runs from the last value to the first.
+        :return: None.
+        """
+        count = 0
+        if reverse:
+            first = last = None
+            for count, value in enumerate(iterable, 1):
+                first = Node(value, first)
+                if last is None:
+                    last = first
+                else:
+                    first.next.prev = first
+        else:
+            anchor = last = Node(None)
+            for count, value in enumerate(iterable, 1):
+                last.next = last = Node(value, None, last)
+            first = anchor.next
+            if first is not None:
+                first.prev = None
+        if count == 0:
+            return
+        if self.size == 0:
+            self.head, self.tail = first, last
+        elif at_tail:
+            self.tail.next, first.prev = first, self.tail
+            self.tail = last
+        else:
+            last.next, self.head.prev = self.head, last
+            self.head = first
+            if self._finger is not None:
+                self._finger_index += count
+        self.size += count
+        if self._index is not None:
+            self._index_chain(first, last, at_tail)
+
+    def _index_chain(self, first: Node, last: Node, at_tail: bool) -> None:
+        """
+        Record a chain of Nodes that was just spliced onto one end of the DLL.
+
+        :param first: first Node of the chain.
+        :param last: last Node of the chain.
+        :param at_tail: True if the chain went after the old tail.
+        :return: None.
+        """
+        if at_tail:
+            node = first
+            while node is not None:
+                self._index_add(node)
+                node = node.next
+            return
+        # new Nodes come before every old one, so add them last to first
+        node = last
+        while node is not None:
+            self._index_add(node, True)
+            node = node.prev
+
     def dll_to_list(self) -> List[T]:
         """
         Construct standard Python list from DLL.
@@ -181,6 +633,8 @@ class DLL:
         while currNode is not None:
             dllList.append(currNode.value)
             currNode = currNode.next
+        if self._flipped:
+            dllList.reverse()
         return dllList
 
     def _find_nodes(self, val: T, find_first: bool = False) -> List[Node]:
@@ -192,7 +646,15 @@ class DLL:
         occurrences of val
         :return: A list of all the Nodes with value val.
         """
-        currNode = self.head
+        if self._index is not None:
+            nodes = self._index.get(val)
+            if nodes is None:
+                return []
+            # buckets are in physical order
+            if self._flipped:
+                return [next(reversed(nodes))] if find_first else list(reversed(nodes))
+            return [next(iter(nodes))] if find_first else list(nodes)
+        currNode = self.tail if self._flipped else self.head
         matches = []
         # iterates through DLL
         while currNode is not None:
@@ -201,7 +663,7 @@ class DLL:
                 # breaks if we only need one
                 if find_first:
                     return matches
-            currNode = currNode.next
+            currNode = currNode.prev if self._flipped else currNode.next
         return matches
     def find(self, val: T) -> Node:
         """
@@ -211,7 +673,7 @@ class DLL:
         :return: first Node object in DLL containing `val`.
             If `val` does not exist in DLL, return an empty list.
         """
-        lis = self._find_nodes(val)
+        lis = self._find_nodes(val, True)
         # if none found
         if len(lis) == 0:
             return None
@@ -237,6 +699,10 @@ class DLL:
         """
         if self.head is None:
             return
+        if self._index is not None:
+            self._index_remove(to_remove)
+        # positions after the removed Node shift, and it may be the finger
+        self._finger = None
         if self.size == 1:
             self.head = self.tail = None
         else:
@@ -273,16 +739,103 @@ class DLL:
 
     def remove_all(self, val: T) -> int:
         """
-        Delete all instances of `val` in the DLL. Must call _remove_node.
+        Delete all instances of `val` in the DLL, unlinking them in a single pass.
 
         :param val: value to be deleted from DLL.
         :return: integer indicating the number of Nodes containing `val` deleted from DLL;
                  if no Node containing `val` exists in DLL, return 0.
         """
-        vals = self.find_all(val)
-        for item in vals:
-            self.remove_node(item)
-        return len(vals)
+        if self._index is not None:
+            return self._remove_buckets([val]).get(val, 0)
+        return self._remove_matching(lambda value: value == val)
+
+    def remove_values(self, values: set) -> dict:
+        """
+        Delete every Node whose value is in `values`, in a single pass.
+
+        :param values: set of values to be deleted from DLL.
+        :return: dict mapping each value in `values` to the number of Nodes deleted, 0 if none.
+        """
+        counts = dict.fromkeys(values, 0)
+        if self._index is not None:
+            counts.update(self._remove_buckets(values))
+        else:
+            self._remove_matching(values.__contains__, counts)
+        return counts
+
+    def remove_if(self, predicate: Callable[[T], bool]) -> dict:
+        """
+        Delete every Node whose value satisfies `predicate`, in a single pass.
+
+        :param predicate: called with each Node's value, True means delete.
+        :return: dict mapping each deleted value to the number of Nodes deleted.
+        """
+        counts = {}
+        self._remove_matching(predicate, counts)
+        return counts
+
+    def _unlink(self, node: Node) -> None:
+        """
+        Splice `node` out of the DLL, leaving `size` and the index to the caller.
+        Like remove_node, the unlinked Node keeps its own `next` and `prev`.
+
+        :param node: Node to unlink.
+        :return: None.
+        """
+        prevNode, nextNode = node.prev, node.next
+        if prevNode is None:
+            self.head = nextNode
+        else:
+            prevNode.next = nextNode
+        if nextNode is None:
+            self.tail = prevNode
+        else:
+            nextNode.prev = prevNode
+
+    def _remove_matching(self, match: Callable[[T], bool], counts: dict = None) -> int:
+        """
+        Walk the DLL once, unlinking every Node whose value `match` accepts.
+        The DLL stays consistent if `match` or the tally raises part way.
+
+        :param match: called with each Node's value, True means delete.
+        :param counts: if given, tallies each deleted value; values must then be hashable.
+        :return: number of Nodes deleted.
+        """
+        removed = 0
+        node = self.head
+        while node is not None:
+            nextNode = node.next
+            if match(node.value):
+                # tallied first, so an unhashable value leaves its Node in place
+                if counts is not None:
+                    counts[node.value] = counts.get(node.value, 0) + 1
+                self._unlink(node)
+                if self._index is not None:
+                    self._index_remove(node)
+                self._finger = None
+                self.size -= 1
+                removed += 1
+            node = nextNode
+        return removed
+
+    def _remove_buckets(self, values: Iterable[T]) -> dict:
+        """
+        Unlink every Node holding one of `values` straight from the index.
+
+        :param values: values to be deleted from DLL.
+        :return: dict mapping each deleted value to the number of Nodes deleted.
+        """
+        counts = {}
+        for val in values:
+            nodes = self._index.pop(val, None)
+            if nodes is None:
+                continue
+            for node in nodes:
+                self._unlink(node)
+            self._finger = None
+            counts[val] = len(nodes)
+            self.size -= len(nodes)
+        return counts
 
     def reverse(self) -> None:
         """
@@ -314,8 +867,1174 @@ class DLL:
             if nextNode:
                 nextNode = nextNode.prev
         self.tail.next = None
+        if self._index is not None:
+            # every bucket keeps list order, so each one flips too
+            for nodes in self._index.values():
+                nodes.reverse()
+        if self._finger is not None:
+            self._finger_index = self.size - 1 - self._finger_index
         return
 
+    def flip(self) -> None:
+        """
+        Reverse the DLL in O(1) by switching which end it reads from.
+        push, pop, find, positions, dll_to_list and repr all follow the new
+        direction while `head`, `tail` and the links stay where they are;
+        call `realign` to relink the Nodes to match.
+
+        :return: None.
+        """
+        self._flipped = not self._flipped
+
+    def realign(self) -> None:
+        """
+        Relink the Nodes so `head` is the front again after an odd number of flips.
+
+        :return: None.
+        """
+        if self._flipped:
+            self._flipped = False
+            self.reverse()
+
+    def _physical(self, index: int) -> int:
+        """
+        Translate a position in reading order to one counted from `head`.
+
+        :param index: position, negative counts from the back.
+        :return: position from `head`, out of range if `index` was.
+        """
+        if index < 0:
+            index += self.size
+        if self._flipped and 0 <= index < self.size:
+            index = self.size - 1 - index
+        return index
+
+    def _insert_position(self, index: int) -> int:
+        """
+        Translate an `insert_at` position in reading order to the position counted
+        from `head` that the new Node must take.
+
+        :param index: position in [-size, size].
+        :return: position in [0, size], -1 if `index` is out of range.
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index <= self.size:
+            return -1
+        return self.size - index if self._flipped else index
+
+    def _walk_start(self, index: int) -> Tuple[Node, int]:
+        """
+        Pick the closest of head, tail and the finger to start a walk to `index` from.
+
+        :param index: position in [0, size).
+        :return: (Node to start from, its position).
+        """
+        if index <= self.size - 1 - index:
+            start, at = self.head, 0
+        else:
+            start, at = self.tail, self.size - 1
+        if self._finger is not None and abs(self._finger_index - index) < abs(at - index):
+            start, at = self._finger, self._finger_index
+        return start, at
+
+    def _walk_length(self, index: int) -> int:
+        """
+        Count the steps `_node_at` takes to reach `index`, 0 if it is out of range.
+
+        :param index: position counted from `head`.
+        :return: number of links followed.
+        """
+        if not 0 <= index < self.size:
+            return 0
+        return abs(self._walk_start(index)[1] - index)
+
+    def _node_at(self, index: int) -> Node:
+        """
+        Find the Node at position `index`, walking from the closest of head, tail
+        and the finger, and leave the finger on it.
+
+        :param index: position counted from `head`.
+        :return: Node at that position.
+        """
+        if not 0 <= index < self.size:
+            raise IndexError("DLL index out of range")
+        node, at = self._walk_start(index)
+        while at < index:
+            node = node.next
+            at += 1
+        while at > index:
+            node = node.prev
+            at -= 1
+        self._finger, self._finger_index = node, index
+        return node
+
+    def __getitem__(self, index: int) -> T:
+        """
+        Return the value at position `index`. Nearby positions in a row cost O(1) each.
+
+        :param index: position, negative counts from the back.
+        :return: value stored there.
+        """
+        return self._node_at(self._physical(index)).value
+
+    def insert_at(self, index: int, val: T) -> None:
+        """
+        Create Node containing `val` so it ends up at position `index`, like `list.insert`.
+
+        :param index: position in [-size, size]; size appends to the back.
+        :param val: value to be added to the DLL.
+        :return: None.
+        """
+        index = self._insert_position(index)
+        if index == -1:
+            raise IndexError("DLL index out of range")
+        # push flips `back` itself, so it's told the reading-order end
+        if index == self.size:
+            self.push(val, not self._flipped)
+            return
+        if index == 0:
+            self.push(val, self._flipped)
+            return
+        after = self._node_at(index)
+        newNode = Node(val, after, after.prev)
+        after.prev.next = newNode
+        after.prev = newNode
+        if self._index is not None:
+            self._index_insert(newNode)
+        self.size += 1
+        self._finger = newNode
+
+    def pop_at(self, index: int) -> T:
+        """
+        Remove the Node at position `index` and return its value, like `list.pop`.
+
+        :param index: position, negative counts from the back.
+        :return: value that was stored there.
+        """
+        node = self._node_at(self._physical(index))
+        index = self._finger_index
+        self._unlink(node)
+        if self._index is not None:
+            self._index_remove(node)
+        self.size -= 1
+        # keep the finger next to where the Node was
+        if node.next is not None:
+            self._finger = node.next
+        elif node.prev is not None:
+            self._finger, self._finger_index = node.prev, index - 1
+        else:
+            self._finger = None
+        return node.value
+
+
+class SentinelDLL:
+    """
+    Doubly linked list with DLL's list operations, built around one circular
+    sentinel Node. The sentinel sits before the first Node and after the last,
+    so every Node always has a real `next` and `prev`, and push, pop and
+    remove_node are straight-line pointer swaps with no head, tail or
+    single-Node cases. `head` and `tail` are read-only, read from the
+    sentinel, None when empty. Walking the Nodes by hand ends at the sentinel,
+    not at None. Unlike DLL there is no value index (`indexed`,
+    `enable_index`, `disable_index`), no `flip`/`realign` and no
+    instrumentation (`enable_instrumentation`, `disable_instrumentation`,
+    `stats`).
+    """
+    __slots__ = ["_sentinel", "size"]
+
+    def __init__(self) -> None:
+        """
+        Construct an empty sentinel doubly linked list.
+
+        :return: None.
+        """
+        self._sentinel = Node(None)
+        self._sentinel.next = self._sentinel.prev = self._sentinel
+        self.size = 0
+
+    def __repr__(self) -> str:
+        """
+        Represent the SentinelDLL as a string, like DLL does.
+
+        :return: string representation of the SentinelDLL.
+        """
+        sentinel = self._sentinel
+        result = []
+        node = sentinel.next
+        while node is not sentinel:
+            result.append(str(node))
+            node = node.next
+        return " <-> ".join(result)
+
+    __str__ = __repr__
+
+    @property
+    def head(self) -> Optional[Node]:
+        """
+        First Node, None if empty.
+        """
+        return None if self.size == 0 else self._sentinel.next
+
+    @property
+    def tail(self) -> Optional[Node]:
+        """
+        Last Node, None if empty.
+        """
+        return None if self.size == 0 else self._sentinel.prev
+
+    def empty(self) -> bool:
+        """
+        Return boolean indicating whether SentinelDLL is empty.
+
+        :return: True if empty, else False.
+        """
+        return self.size == 0
+
+    def push(self, val: T, back: bool = True) -> None:
+        """
+        Create Node containing `val` and add to back (or front). Increment size by one.
+
+        :param val: value to be added.
+        :param back: if True, add to back (tail-end); if False, add to front (head-end).
+        :return: None.
+        """
+        prevNode = self._sentinel.prev if back else self._sentinel
+        nextNode = prevNode.next
+        prevNode.next = nextNode.prev = Node(val, nextNode, prevNode)
+        self.size += 1
+
+    def pop(self, back: bool = True) -> None:
+        """
+        Remove Node from back (or front). Decrement size by 1. If empty, do nothing.
+
+        :param back: if True, remove from back (tail-end); if False, remove from front (head-end).
+        :return: None.
+        """
+        if self.size == 0:
+            return
+        node = self._sentinel.prev if back else self._sentinel.next
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        self.size -= 1
+
+    def remove_node(self, to_remove: Node) -> None:
+        """
+        Given a node in the list, remove it.
+
+        :param to_remove: node to be removed from the list.
+        :return: None
+        """
+        if self.size == 0:
+            return
+        to_remove.prev.next = to_remove.next
+        to_remove.next.prev = to_remove.prev
+        self.size -= 1
+
+    def list_to_dll(self, source: List[T]) -> None:
+        """
+        Construct the list from a standard Python list, or any iterable, in one linking pass.
+
+        :param source: values to store, in order.
+        :return: None.
+        """
+        sentinel = self._sentinel
+        sentinel.next = sentinel.prev = sentinel
+        self.size = 0
+        self.extend(source)
+
+    def extend(self, iterable: Iterable[T], back: bool = True) -> None:
+        """
+        Add every value of `iterable` to the back (or front), keeping their order.
+
+        :param iterable: values to be added; generators are consumed lazily.
+        :param back: if True, add after the last value; if False, before the first.
+        :return: None.
+        """
+        prevNode = self._sentinel.prev if back else self._sentinel
+        nextNode = prevNode.next
+        last = prevNode
+        count = 0
+        for count, value in enumerate(iterable, 1):
+            last.next = last = Node(value, None, last)
+        last.next = nextNode
+        nextNode.prev = last
+        self.size += count
+
+    def extendleft(self, iterable: Iterable[T]) -> None:
+        """
+        Push every value of `iterable` to the front in turn, like `collections.deque.extendleft`.
+
+        :param iterable: values to be added; generators are consumed lazily.
+        :return: None.
+        """
+        sentinel = self._sentinel
+        for value in iterable:
+            first = sentinel.next
+            sentinel.next = first.prev = Node(value, first, sentinel)
+            self.size += 1
+
+    def dll_to_list(self) -> List[T]:
+        """
+        Construct standard Python list from the SentinelDLL.
+
+        :return: standard Python list containing the values, front to back.
+        """
+        sentinel = self._sentinel
+        values = []
+        node = sentinel.next
+        while node is not sentinel:
+            values.append(node.value)
+            node = node.next
+        return values
+
+    def _find_nodes(self, val: T, find_first: bool = False) -> List[Node]:
+        """
+        Construct list of Nodes with value val.
+
+        :param val: The value to be found.
+        :param find_first: If True, only return the first occurrence of val.
+        :return: A list of the Nodes with value val.
+        """
+        sentinel = self._sentinel
+        matches = []
+        node = sentinel.next
+        while node is not sentinel:
+            if node.value == val:
+                matches.append(node)
+                if find_first:
+                    break
+            node = node.next
+        return matches
+
+    def find(self, val: T) -> Node:
+        """
+        Find first instance of `val` and return associated Node object.
+
+        :param val: value to be found.
+        :return: first Node containing `val`, None if absent.
+        """
+        nodes = self._find_nodes(val, True)
+        return nodes[0] if nodes else None
+
+    def find_all(self, val: T) -> List[Node]:
+        """
+        Find all instances of `val` and return Node objects in standard Python list.
+
+        :param val: value to be searched for.
+        :return: Python list of all Node objects containing `val`.
+        """
+        return self._find_nodes(val)
+
+    def remove(self, val: T) -> bool:
+        """
+        Delete first instance of `val`.
+
+        :param val: value to be deleted.
+        :return: True if Node containing `val` was deleted; else, False.
+        """
+        node = self.find(val)
+        if node is None:
+            return False
+        self.remove_node(node)
+        return True
+
+    def remove_all(self, val: T) -> int:
+        """
+        Delete all instances of `val`, unlinking them in a single pass.
+
+        :param val: value to be deleted.
+        :return: number of Nodes deleted.
+        """
+        return self._remove_matching(lambda value: value == val)
+
+    def remove_values(self, values: set) -> dict:
+        """
+        Delete every Node whose value is in `values`, in a single pass.
+
+        :param values: set of values to be deleted.
+        :return: dict mapping each value in `values` to the number of Nodes deleted, 0 if none.
+        """
+        counts = dict.fromkeys(values, 0)
+        self._remove_matching(values.__contains__, counts)
+        return counts
+
+    def remove_if(self, predicate: Callable[[T], bool]) -> dict:
+        """
+        Delete every Node whose value satisfies `predicate`, in a single pass.
+
+        :param predicate: called with each Node's value, True means delete.
+        :return: dict mapping each deleted value to the number of Nodes deleted.
+        """
+        counts = {}
+        self._remove_matching(predicate, counts)
+        return counts
+
+    def _remove_matching(self, match: Callable[[T], bool], counts: dict = None) -> int:
+        """
+        Walk the list once, unlinking every Node whose value `match` accepts.
+        The list stays consistent if `match` or the tally raises part way.
+
+        :param match: called with each Node's value, True means delete.
+        :param counts: if given, tallies each deleted value; values must then be hashable.
+        :return: number of Nodes deleted.
+        """
+        sentinel = self._sentinel
+        removed = 0
+        node = sentinel.next
+        while node is not sentinel:
+            if match(node.value):
+                if counts is not None:
+                    counts[node.value] = counts.get(node.value, 0) + 1
+                node.prev.next = node.next
+                node.next.prev = node.prev
+                self.size -= 1
+                removed += 1
+            node = node.next
+        return removed
+
+    def reverse(self) -> None:
+        """
+        Reverse in-place by swapping every Node's `next` and `prev`, the sentinel's included.
+
+        :return: None.
+        """
+        sentinel = self._sentinel
+        node = sentinel
+        while True:
+            node.next, node.prev = node.prev, node.next
+            node = node.prev
+            if node is sentinel:
+                break
+
+    def _node_at(self, index: int) -> Node:
+        """
+        Find the Node at position `index`, walking from the closer end.
+
+        :param index: position, negative counts from the back.
+        :return: Node at that position.
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("SentinelDLL index out of range")
+        if index <= self.size - 1 - index:
+            node = self._sentinel.next
+            for _ in range(index):
+                node = node.next
+        else:
+            node = self._sentinel.prev
+            for _ in range(self.size - 1 - index):
+                node = node.prev
+        return node
+
+    def __getitem__(self, index: int) -> T:
+        """
+        Return the value at position `index`.
+
+        :param index: position, negative counts from the back.
+        :return: value stored there.
+        """
+        return self._node_at(index).value
+
+    def insert_at(self, index: int, val: T) -> None:
+        """
+        Create Node containing `val` so it ends up at position `index`, like `list.insert`.
+
+        :param index: position in [-size, size]; size appends to the back.
+        :param val: value to be added.
+        :return: None.
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index <= self.size:
+            raise IndexError("SentinelDLL index out of range")
+        nextNode = self._sentinel if index == self.size else self._node_at(index)
+        prevNode = nextNode.prev
+        prevNode.next = nextNode.prev = Node(val, nextNode, prevNode)
+        self.size += 1
+
+    def pop_at(self, index: int) -> T:
+        """
+        Remove the Node at position `index` and return its value, like `list.pop`.
+
+        :param index: position, negative counts from the back.
+        :return: value that was stored there.
+        """
+        node = self._node_at(index)
+        self.remove_node(node)
+        return node.value
+
+
+class BlockNode:
+    """
+    Handle to one value of a BlockDLL, standing in for a Node.
+    It tracks its block and offset through block splits, merges and shifts,
+    so a handle from `find` stays valid until its value is removed.
+    """
+    __slots__ = ["_block", "_offset", "_value"]
+
+    def __init__(self, block: DLLBlock, offset: int) -> None:
+        """
+        Construct a handle.
+
+        :param block: block holding the value.
+        :param offset: position of the value in the block.
+        :return: None.
+        """
+        self._block = block
+        self._offset = offset
+        # only used once the value has been removed
+        self._value = None
+
+    @property
+    def value(self) -> T:
+        """
+        Value the handle refers to; removed handles keep their last value.
+        """
+        return self._value if self._block is None else self._block.values[self._offset]
+
+    @value.setter
+    def value(self, value: T) -> None:
+        if self._block is None:
+            self._value = value
+        else:
+            self._block.values[self._offset] = value
+
+    @property
+    def next(self) -> Optional[BlockNode]:
+        """
+        Handle to the following value; None at the back or once removed.
+        """
+        block = self._block
+        if block is None:
+            return None
+        if self._offset + 1 < len(block.values):
+            return block.handle(self._offset + 1)
+        return None if block.next is None else block.next.handle(0)
+
+    @property
+    def prev(self) -> Optional[BlockNode]:
+        """
+        Handle to the preceding value; None at the front or once removed.
+        """
+        block = self._block
+        if block is None:
+            return None
+        if self._offset > 0:
+            return block.handle(self._offset - 1)
+        return None if block.prev is None else block.prev.handle(len(block.prev.values) - 1)
+
+    def __repr__(self) -> str:
+        """
+        Represents the handle like a Node.
+
+        :return: string representation of the handle.
+        """
+        return f"Node({str(self.value)})"
+
+    __str__ = __repr__
+
+
+class DLLBlock:
+    """
+    Block of a BlockDLL, holding a run of values in a plain Python list.
+    `handles` runs parallel to `values` once a handle into the block exists.
+    """
+    __slots__ = ["values", "handles", "next", "prev"]
+
+    def __init__(self, values: list, next: DLLBlock = None, prev: DLLBlock = None) -> None:
+        """
+        Construct a block.
+
+        :param values: values held by the block, in order.
+        :param next: following block.
+        :param prev: preceding block.
+        :return: None.
+        """
+        self.values = values
+        self.handles = None
+        self.next = next
+        self.prev = prev
+
+    def __repr__(self) -> str:
+        """
+        Represents the block for debugging.
+
+        :return: string representation of the block.
+        """
+        return f"Block({self.values})"
+
+    def handle(self, offset: int) -> BlockNode:
+        """
+        Return the handle for the value at `offset`, creating it on first use.
+
+        :param offset: position in the block.
+        :return: handle.
+        """
+        if self.handles is None:
+            self.handles = [None] * len(self.values)
+        handle = self.handles[offset]
+        if handle is None:
+            handle = self.handles[offset] = BlockNode(self, offset)
+        return handle
+
+    def renumber(self, start: int = 0) -> None:
+        """
+        Point the handles from `start` on at their current block and offset.
+
+        :param start: first offset that moved.
+        :return: None.
+        """
+        if self.handles is not None:
+            for offset in range(start, len(self.handles)):
+                handle = self.handles[offset]
+                if handle is not None:
+                    handle._block, handle._offset = self, offset
+
+    def insert(self, offset: int, value: T) -> None:
+        """
+        Insert `value` at `offset`, shifting the later values (and handles) right.
+
+        :param offset: position in [0, len(values)].
+        :param value: value to store.
+        :return: None.
+        """
+        self.values.insert(offset, value)
+        if self.handles is not None:
+            self.handles.insert(offset, None)
+            self.renumber(offset + 1)
+
+    def delete(self, offset: int) -> T:
+        """
+        Remove and return the value at `offset`, detaching its handle.
+
+        :param offset: position in the block.
+        :return: the removed value.
+        """
+        value = self.values.pop(offset)
+        if self.handles is not None:
+            handle = self.handles.pop(offset)
+            if handle is not None:
+                handle._block, handle._value = None, value
+            self.renumber(offset)
+        return value
+
+    def split(self, offset: int) -> DLLBlock:
+        """
+        Move the values from `offset` on into a new block linked right after this one.
+
+        :param offset: first position to move.
+        :return: the new block.
+        """
+        newBlock = DLLBlock(self.values[offset:], self.next, self)
+        del self.values[offset:]
+        if self.handles is not None:
+            newBlock.handles = self.handles[offset:]
+            del self.handles[offset:]
+            newBlock.renumber()
+        if self.next is not None:
+            self.next.prev = newBlock
+        self.next = newBlock
+        return newBlock
+
+
+class BlockDLL:
+    """
+    Doubly linked list with DLL's list operations, storing its values in
+    doubly linked blocks of up to `capacity` values each. Scans and copies run
+    over plain Python lists, one block at a time, instead of one Node object per
+    value, so traversal speed and memory come close to those of a list.
+    Nodes are BlockNode handles, created only when asked for (by `find`,
+    `find_all`, `head`, `tail`). They follow their value through splits and
+    merges, so they stay valid until the value is removed. Blocks are never left
+    empty, and an underfull block is merged with its successor when both fit.
+    `head` and `tail` are read-only. Unlike DLL there is no value index
+    (`indexed`, `enable_index`, `disable_index`), no `flip`/`realign` and no
+    instrumentation (`enable_instrumentation`, `disable_instrumentation`,
+    `stats`).
+    """
+    __slots__ = ["_first", "_last", "size", "capacity"]
+
+    def __init__(self, capacity: int = 64) -> None:
+        """
+        Construct an empty block doubly linked list.
+
+        :param capacity: maximum number of values per block.
+        :return: None.
+        """
+        if capacity < 2:
+            raise ValueError("block capacity must be at least 2")
+        self._first = self._last = None
+        self.size = 0
+        self.capacity = capacity
+
+    def __repr__(self) -> str:
+        """
+        Represent the BlockDLL as a string, like DLL does.
+
+        :return: string representation of the BlockDLL.
+        """
+        return " <-> ".join(f"Node({str(value)})" for value in self.dll_to_list())
+
+    __str__ = __repr__
+
+    @property
+    def head(self) -> Optional[BlockNode]:
+        """
+        Handle of the first value, None if empty.
+        """
+        return None if self._first is None else self._first.handle(0)
+
+    @property
+    def tail(self) -> Optional[BlockNode]:
+        """
+        Handle of the last value, None if empty.
+        """
+        return None if self._last is None else self._last.handle(len(self._last.values) - 1)
+
+    def empty(self) -> bool:
+        """
+        Return boolean indicating whether BlockDLL is empty.
+
+        :return: True if empty, else False.
+        """
+        return self.size == 0
+
+    def _link_block(self, block: DLLBlock, back: bool) -> None:
+        """
+        Add a standalone block at the back (or front) of the chain.
+
+        :param block: block to add.
+        :param back: if True, after the last block; if False, before the first.
+        :return: None.
+        """
+        if self._first is None:
+            self._first = self._last = block
+        elif back:
+            block.prev, self._last.next = self._last, block
+            self._last = block
+        else:
+            block.next, self._first.prev = self._first, block
+            self._first = block
+
+    def _unlink_block(self, block: DLLBlock) -> None:
+        """
+        Remove an emptied block from the chain.
+
+        :param block: block to remove.
+        :return: None.
+        """
+        if block.prev is None:
+            self._first = block.next
+        else:
+            block.prev.next = block.next
+        if block.next is None:
+            self._last = block.prev
+        else:
+            block.next.prev = block.prev
+        block.next = block.prev = None
+
+    def _shrunk(self, block: DLLBlock) -> None:
+        """
+        Tidy up after values left `block`: drop it if empty, otherwise fold the
+        next block into it when it is at most half full and both fit in one.
+
+        :param block: block that just lost values.
+        :return: None.
+        """
+        if not block.values:
+            self._unlink_block(block)
+            return
+        nextBlock = block.next
+        if (nextBlock is not None and len(block.values) <= self.capacity // 2
+                and len(block.values) + len(nextBlock.values) <= self.capacity):
+            start = len(block.values)
+            block.values.extend(nextBlock.values)
+            if block.handles is not None or nextBlock.handles is not None:
+                block.handles = (block.handles or [None] * start) + \
+                    (nextBlock.handles or [None] * len(nextBlock.values))
+                block.renumber(start)
+            self._unlink_block(nextBlock)
+
+    def push(self, val: T, back: bool = True) -> None:
+        """
+        Add `val` to back (or front), opening a new block when that end's block is full.
+
+        :param val: value to be added.
+        :param back: if True, add to back (tail-end); if False, add to front (head-end).
+        :return: None.
+        """
+        block = self._last if back else self._first
+        if block is None or len(block.values) >= self.capacity:
+            self._link_block(DLLBlock([val]), back)
+        elif back:
+            block.values.append(val)
+            if block.handles is not None:
+                block.handles.append(None)
+        else:
+            block.insert(0, val)
+        self.size += 1
+
+    def pop(self, back: bool = True) -> None:
+        """
+        Remove the value at back (or front). If empty, do nothing.
+
+        :param back: if True, remove from back (tail-end); if False, remove from front (head-end).
+        :return: None.
+        """
+        if self.size == 0:
+            return
+        block = self._last if back else self._first
+        block.delete(len(block.values) - 1 if back else 0)
+        if not block.values:
+            self._unlink_block(block)
+        self.size -= 1
+
+    def list_to_dll(self, source: List[T]) -> None:
+        """
+        Construct the list from a standard Python list, or any iterable, a block at a time.
+
+        :param source: values to store, in order.
+        :return: None.
+        """
+        self._first = self._last = None
+        self.size = 0
+        self.extend(source)
+
+    def _blocks_of(self, iterable: Iterable[T], reverse: bool = False) -> Tuple[DLLBlock, DLLBlock, int]:
+        """
+        Cut `iterable` into a chain of full blocks, reading one block's worth at a time.
+
+        :param iterable: values to store, in order.
+        :param reverse: if True, the chain holds the values last to first.
+        :return: (first block, last block, value count), blocks None if no values.
+        """
+        values = iter(iterable)
+        first = last = None
+        count = 0
+        while True:
+            chunk = list(islice(values, self.capacity))
+            if not chunk:
+                return first, last, count
+            count += len(chunk)
+            if reverse:
+                chunk.reverse()
+                block = DLLBlock(chunk, first, None)
+                if first is None:
+                    last = block
+                else:
+                    first.prev = block
+                first = block
+            else:
+                block = DLLBlock(chunk, None, last)
+                if last is None:
+                    first = block
+                else:
+                    last.next = block
+                last = block
+
+    def extend(self, iterable: Iterable[T], back: bool = True) -> None:
+        """
+        Add every value of `iterable` to the back (or front), keeping their order.
+
+        :param iterable: values to be added; generators are consumed lazily.
+        :param back: if True, add after the last value; if False, before the first.
+        :return: None.
+        """
+        self._link_blocks(*self._blocks_of(iterable), back)
+
+    def extendleft(self, iterable: Iterable[T]) -> None:
+        """
+        Push every value of `iterable` to the front in turn, like `collections.deque.extendleft`.
+
+        :param iterable: values to be added; generators are consumed lazily.
+        :return: None.
+        """
+        self._link_blocks(*self._blocks_of(iterable, True), False)
+
+    def _link_blocks(self, first: DLLBlock, last: DLLBlock, count: int, back: bool) -> None:
+        """
+        Splice a chain of blocks from `_blocks_of` onto one end.
+
+        :param first: first block of the chain.
+        :param last: last block of the chain.
+        :param count: number of values in the chain, 0 if there are no blocks.
+        :param back: if True, add after the last value; if False, before the first.
+        :return: None.
+        """
+        if count == 0:
+            return
+        if self._first is None:
+            self._first, self._last = first, last
+        elif back:
+            self._last.next, first.prev = first, self._last
+            self._last = last
+        else:
+            last.next, self._first.prev = self._first, last
+            self._first = first
+        self.size += count
+
+    def dll_to_list(self) -> List[T]:
+        """
+        Construct standard Python list from the BlockDLL.
+
+        :return: standard Python list containing the values, front to back.
+        """
+        result = []
+        block = self._first
+        while block is not None:
+            result.extend(block.values)
+            block = block.next
+        return result
+
+    def _find_nodes(self, val: T, find_first: bool = False) -> List[BlockNode]:
+        """
+        Construct list of handles to values equal to `val`, skipping blocks
+        that can't hold it with one C-level membership test each.
+
+        :param val: The value to be found.
+        :param find_first: If True, only return the first occurrence of val.
+        :return: A list of handles, front to back.
+        """
+        matches = []
+        block = self._first
+        while block is not None:
+            values = block.values
+            if val in values:
+                offset = values.index(val)
+                while True:
+                    matches.append(block.handle(offset))
+                    if find_first:
+                        return matches
+                    try:
+                        offset = values.index(val, offset + 1)
+                    except ValueError:
+                        break
+            block = block.next
+        return matches
+
+    def find(self, val: T) -> BlockNode:
+        """
+        Find first instance of `val` and return a handle to it.
+
+        :param val: value to be found.
+        :return: handle to the first value equal to `val`, None if absent.
+        """
+        nodes = self._find_nodes(val, True)
+        return nodes[0] if nodes else None
+
+    def find_all(self, val: T) -> List[BlockNode]:
+        """
+        Find all instances of `val` and return handles in standard Python list.
+
+        :param val: value to be searched for.
+        :return: Python list of handles to every value equal to `val`.
+        """
+        return self._find_nodes(val)
+
+    def remove_node(self, to_remove: BlockNode) -> None:
+        """
+        Given a handle into the list, remove its value.
+
+        :param to_remove: handle whose value is to be removed.
+        :return: None
+        """
+        block = to_remove._block
+        block.delete(to_remove._offset)
+        self.size -= 1
+        self._shrunk(block)
+
+    def remove(self, val: T) -> bool:
+        """
+        Delete first instance of `val`.
+
+        :param val: value to be deleted.
+        :return: True if a value was deleted; else, False.
+        """
+        block = self._first
+        while block is not None:
+            if val in block.values:
+                block.delete(block.values.index(val))
+                self.size -= 1
+                self._shrunk(block)
+                return True
+            block = block.next
+        return False
+
+    def remove_all(self, val: T) -> int:
+        """
+        Delete all instances of `val` in a single pass over the blocks.
+
+        :param val: value to be deleted.
+        :return: number of values deleted.
+        """
+        return self._remove_matching(lambda value: value == val, None, lambda values: val in values)
+
+    def remove_values(self, values: set) -> dict:
+        """
+        Delete every value in `values`, in a single pass.
+
+        :param values: set of values to be deleted.
+        :return: dict mapping each value in `values` to the number deleted, 0 if none.
+        """
+        counts = dict.fromkeys(values, 0)
+        self._remove_matching(values.__contains__, counts)
+        return counts
+
+    def remove_if(self, predicate: Callable[[T], bool]) -> dict:
+        """
+        Delete every value satisfying `predicate`, in a single pass.
+
+        :param predicate: called with each value, True means delete.
+        :return: dict mapping each deleted value to the number deleted.
+        """
+        counts = {}
+        self._remove_matching(predicate, counts)
+        return counts
+
+    def _remove_matching(self, match: Callable[[T], bool], counts: dict = None,
+                         may_match: Callable[[list], bool] = None) -> int:
+        """
+        Rebuild every block without the values `match` accepts.
+        Each block is swapped for its filtered copy only once it has been fully
+        checked, so the list stays consistent if `match` or the tally raises.
+
+        :param match: called with each value, True means delete.
+        :param counts: if given, tallies each deleted value; values must then be hashable.
+        :param may_match: optional quick test on a block's values list, False skips the block.
+        :return: number of values deleted.
+        """
+        removed = 0
+        try:
+            block = self._first
+            while block is not None:
+                nextBlock = block.next
+                if may_match is None or may_match(block.values):
+                    keep, kept, gone = [], [], []
+                    handles = block.handles or [None] * len(block.values)
+                    for value, handle in zip(block.values, handles):
+                        if match(value):
+                            if counts is not None:
+                                counts[value] = counts.get(value, 0) + 1
+                            if handle is not None:
+                                gone.append(handle)
+                        else:
+                            keep.append(value)
+                            kept.append(handle)
+                    if len(keep) < len(block.values):
+                        for handle in gone:
+                            handle._block, handle._value = None, handle.value
+                        self.size -= len(block.values) - len(keep)
+                        removed += len(block.values) - len(keep)
+                        block.values = keep
+                        if block.handles is not None:
+                            block.handles = kept
+                            block.renumber()
+                block = nextBlock
+        finally:
+            # merging during the pass would fold unfiltered blocks into filtered ones
+            if removed:
+                block = self._first
+                while block is not None:
+                    nextBlock = block.next
+                    self._shrunk(block)
+                    # a block that absorbed its successor may take the next one too
+                    if block.next is not nextBlock and block.values:
+                        continue
+                    block = nextBlock
+        return removed
+
+    def reverse(self) -> None:
+        """
+        Reverse in-place: the block chain flips and each block reverses its values.
+
+        :return: None.
+        """
+        block = self._first
+        self._first, self._last = self._last, self._first
+        while block is not None:
+            block.next, block.prev = block.prev, block.next
+            block.values.reverse()
+            if block.handles is not None:
+                block.handles.reverse()
+                block.renumber()
+            block = block.prev
+
+    def _locate(self, index: int) -> Tuple[DLLBlock, int]:
+        """
+        Find the block and offset of position `index`, walking from the closer end.
+
+        :param index: position, negative counts from the back.
+        :return: (block, offset in the block).
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("BlockDLL index out of range")
+        if index <= self.size - 1 - index:
+            block = self._first
+            while index >= len(block.values):
+                index -= len(block.values)
+                block = block.next
+            return block, index
+        index = self.size - 1 - index
+        block = self._last
+        while index >= len(block.values):
+            index -= len(block.values)
+            block = block.prev
+        return block, len(block.values) - 1 - index
+
+    def __getitem__(self, index: int) -> T:
+        """
+        Return the value at position `index`.
+
+        :param index: position, negative counts from the back.
+        :return: value stored there.
+        """
+        block, offset = self._locate(index)
+        return block.values[offset]
+
+    def insert_at(self, index: int, val: T) -> None:
+        """
+        Insert `val` so it ends up at position `index`, like `list.insert`.
+        A full block is split in half first; handles follow their values.
+
+        :param index: position in [-size, size]; size appends to the back.
+        :param val: value to be added.
+        :return: None.
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index <= self.size:
+            raise IndexError("BlockDLL index out of range")
+        if index == self.size:
+            self.push(val)
+            return
+        block, offset = self._locate(index)
+        if len(block.values) >= self.capacity:
+            half = len(block.values) // 2
+            newBlock = block.split(half)
+            if block is self._last:
+                self._last = newBlock
+            if offset >= half:
+                block, offset = newBlock, offset - half
+        block.insert(offset, val)
+        self.size += 1
+
+    def pop_at(self, index: int) -> T:
+        """
+        Remove the value at position `index` and return it, like `list.pop`.
+
+        :param index: position, negative counts from the back.
+        :return: value that was stored there.
+        """
+        block, offset = self._locate(index)
+        value = block.delete(offset)
+        self.size -= 1
+        self._shrunk(block)
+        return value
+
 
 class Spotify_Music_Player:
     def __init__(self, paid: bool=False) -> None:
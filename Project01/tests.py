@@ -6,9 +6,11 @@ Originally Authored By: Andrew McDonald, Alex Woodring & Andrew Haas
 tests.py
 """
 
-from solution import DLL, Node, Spotify_Music_Player
+from solution import DLL, Node, SentinelDLL, BlockDLL, Spotify_Music_Player
 from typing import List, TypeVar
+import collections
 import copy
+import random
 import unittest
 
 # for more information on typehinting, check out https://docs.python.org/3/library/typing.html
@@ -575,6 +577,709 @@ class DLLTests(unittest.TestCase):
         self.assertIs(new_tail, old_head)
 
 
+    def test_instrumentation(self):
+
+        # (1) disabled by default, nothing recorded
+        dll = DLL()
+        dll.list_to_dll([1, 2, 1, 3])
+        dll.find(3)
+        self.assertEqual({}, dll.stats())
+        self.assertIs(DLL, type(dll))
+
+        # (2) scans record the Nodes they walk
+        dll.enable_instrumentation()
+        self.assertIsInstance(dll, DLL)
+        self.assertEqual(3, dll.find(3).value)
+        self.assertEqual(2, dll.remove_all(1))
+        dll.reverse()
+        self.check_dll([3, 2], dll)  # if failure here, see (2)
+        stats = dll.stats()
+        self.assertEqual(4, stats["find"]["nodes_visited"])
+        self.assertEqual(4, stats["remove_all"]["nodes_visited"])
+        self.assertEqual(1, stats["remove_all"]["calls"])
+        self.assertEqual(2, stats["reverse"]["nodes_visited"])
+        self.assertGreaterEqual(stats["reverse"]["seconds"], 0)
+
+        # (3) allocations and net Nodes added, reset
+        dll.push(5)
+        dll.push(6, False)
+        dll.pop()
+        stats = dll.stats(reset=True)
+        self.assertEqual(2, stats["push"]["net_nodes_added"])
+        self.assertEqual(-1, stats["pop"]["net_nodes_added"])
+        self.assertEqual(2, stats["push"]["allocations"])
+        self.assertEqual(0, stats["pop"]["allocations"])
+        self.assertEqual({}, dll.stats())
+        self.check_dll([6, 3, 2], dll)  # if failure here, see (3)
+        dll.list_to_dll([4, 5, 6])
+        self.assertEqual(0, dll.stats()["list_to_dll"]["net_nodes_added"])
+        self.assertEqual(3, dll.stats()["list_to_dll"]["allocations"])
+        self.check_dll([4, 5, 6], dll)  # if failure here, see (3)
+
+        # (4) turning it off restores the plain class and keeps the counts
+        dll.dll_to_list()
+        dll.disable_instrumentation()
+        self.assertIs(DLL, type(dll))
+        dll.dll_to_list()
+        self.assertEqual(1, dll.stats()["dll_to_list"]["calls"])
+        self.assertEqual(3, dll.stats()["dll_to_list"]["nodes_visited"])
+
+
+    def test_index(self):
+
+        # (1) indexed lookups return the same Nodes as scanning
+        dll = DLL(indexed=True)
+        dll.list_to_dll([1, 2, 1, 3, 1])
+        self.check_dll([1, 2, 1, 3, 1], dll)  # if failure here, see (1)
+        ones = dll.find_all(1)
+        self.assertEqual([dll.head, dll.head.next.next, dll.tail], ones)
+        self.assertIs(dll.head, dll.find(1))
+        self.assertIsNone(dll.find(4))
+        self.assertEqual([], dll.find_all(4))
+
+        # (2) push to the front makes the new Node the first match
+        dll.push(1, False)
+        self.assertIs(dll.head, dll.find(1))
+        self.assertEqual(4, len(dll.find_all(1)))
+
+        # (3) pop, remove_node and remove_all keep the index current
+        dll.pop()
+        dll.pop(False)
+        self.check_dll([1, 2, 1, 3], dll)  # if failure here, see (3)
+        self.assertEqual([dll.head, dll.head.next.next], dll.find_all(1))
+        dll.remove_node(dll.head)
+        self.assertIs(dll.head.next, dll.find(1))
+        self.assertEqual(1, dll.remove_all(1))
+        self.assertIsNone(dll.find(1))
+        self.check_dll([2, 3], dll)  # if failure here, see (3)
+
+        # (4) reverse keeps every bucket in list order
+        dll.list_to_dll([5, 6, 5, 7, 5])
+        first, middle, last = dll.head, dll.head.next.next, dll.tail
+        dll.reverse()
+        self.assertEqual([last, middle, first], dll.find_all(5))
+        self.assertIs(last, dll.find(5))
+        self.assertEqual({5, 6, 7}, set(dll._index))
+
+        # (5) turning the index on and off
+        dll = DLL()
+        dll.list_to_dll([8, 9, 8])
+        dll.enable_index()
+        self.assertEqual([dll.head, dll.tail], dll.find_all(8))
+        dll.disable_index()
+        self.assertIsNone(dll._index)
+        self.assertEqual([dll.head, dll.tail], dll.find_all(8))
+
+        # (6) random operations behave exactly like the unindexed DLL
+        random.seed(331)
+        plain, indexed = DLL(), DLL(indexed=True)
+        for _ in range(2000):
+            op, value = random.randint(0, 6), random.randint(0, 9)
+            if op <= 1:
+                plain.push(value, op == 0)
+                indexed.push(value, op == 0)
+            elif op == 2:
+                plain.pop(value % 2 == 0)
+                indexed.pop(value % 2 == 0)
+            elif op == 3:
+                self.assertEqual(plain.remove(value), indexed.remove(value))
+            elif op == 4:
+                self.assertEqual(plain.remove_all(value), indexed.remove_all(value))
+            elif op == 5:
+                plain.reverse()
+                indexed.reverse()
+            else:
+                node = indexed.find(value)
+                if node is not None:
+                    indexed.remove_node(node)
+                    plain.remove_node(plain.find(value))
+            expected = plain.dll_to_list()
+            self.check_dll(expected, indexed)  # if failure here, see (6)
+            for value in range(10):
+                self.assertEqual([node.value for node in plain.find_all(value)],
+                                 [node.value for node in indexed.find_all(value)])
+                nodes = indexed.find_all(value)
+                position = [i for i, v in enumerate(expected) if v == value]
+                self.assertEqual(len(position), len(nodes))
+            # the index hands back Nodes in list order
+            order, node = {}, indexed.head
+            while node is not None:
+                order[node] = len(order)
+                node = node.next
+            for nodes in indexed._index.values():
+                ranks = [order[node] for node in nodes]
+                self.assertEqual(sorted(ranks), ranks)
+
+        # (7) front pushes of a repeated value add to the bucket without rebuilding it
+        dll = DLL(indexed=True)
+        for value in range(2000):
+            dll.push(value % 2, value % 3 == 0)
+        bucket = dll._index[0]
+        self.assertEqual(len(bucket.front) + len(bucket.back), len(dll.find_all(0)))
+        self.assertGreater(len(bucket.front), 0)
+        self.assertGreater(len(bucket.back), 0)
+        order, node = {}, dll.head
+        while node is not None:
+            order[node] = len(order)
+            node = node.next
+        for value in (0, 1):
+            ranks = [order[node] for node in dll.find_all(value)]
+            self.assertEqual(sorted(ranks), ranks)
+        dll.reverse()
+        self.assertIs(dll.head, dll.find(dll.head.value))
+        self.assertIs(dll.tail, dll.find_all(dll.tail.value)[-1])
+
+
+    def test_remove_values(self):
+
+        # (1) remove_values reports every requested value, removed or not
+        for indexed in (False, True):
+            dll = DLL(indexed)
+            dll.list_to_dll([1, 2, 3, 1, 4, 2, 1])
+            self.assertEqual({1: 3, 2: 2, 9: 0}, dll.remove_values({1, 2, 9}))
+            self.check_dll([3, 4], dll)  # if failure here, see (1)
+            self.assertEqual({3: 1, 4: 1}, dll.remove_values({3, 4}))
+            self.check_dll([], dll)  # if failure here, see (1)
+            self.assertEqual({5: 0}, dll.remove_values({5}))
+
+        # (2) remove_if reports only what it removed
+        for indexed in (False, True):
+            dll = DLL(indexed)
+            dll.list_to_dll([1, 2, 3, 4, 5, 6, 2])
+            self.assertEqual({2: 2, 4: 1, 6: 1}, dll.remove_if(lambda value: value % 2 == 0))
+            self.check_dll([1, 3, 5], dll)  # if failure here, see (2)
+            self.assertEqual({}, dll.remove_if(lambda value: value > 10))
+            if indexed:
+                self.assertEqual({1, 3, 5}, set(dll._index))
+
+        # (3) head, tail and single-Node removals
+        dll = DLL()
+        dll.list_to_dll([7])
+        self.assertEqual({7: 1}, dll.remove_if(lambda value: True))
+        self.check_dll([], dll)  # if failure here, see (3)
+        dll.list_to_dll([7, 8, 8, 7])
+        self.assertEqual(2, dll.remove_all(7))
+        self.check_dll([8, 8], dll)  # if failure here, see (3)
+
+        # (4) random purges match a plain Python list
+        random.seed(20)
+        for indexed in (False, True):
+            expected = [random.randint(0, 9) for _ in range(300)]
+            dll = DLL(indexed)
+            dll.list_to_dll(expected)
+            while expected:
+                values = {random.randint(0, 9) for _ in range(2)}
+                counts = dll.remove_values(values)
+                self.assertEqual({value: expected.count(value) for value in values}, counts)
+                expected = [value for value in expected if value not in values]
+                self.check_dll(expected, dll)  # if failure here, see (4)
+
+        # (5) unhashable values: remove_all still works, remove_if raises and leaves the list intact
+        for engine in (DLL, SentinelDLL, BlockDLL):
+            dll = engine()
+            dll.list_to_dll([[1], [2], [1]])
+            self.assertEqual(2, dll.remove_all([1]))
+            self.assertEqual([[2]], dll.dll_to_list())
+            self.assertEqual(1, dll.size)
+            dll.list_to_dll([[1], [2], [1]])
+            with self.assertRaises(TypeError):
+                dll.remove_if(lambda value: value == [1])
+            self.assertEqual([[1], [2], [1]], dll.dll_to_list())
+            self.assertEqual(3, dll.size)
+
+    def test_positional(self):
+
+        # (1) __getitem__ from either end, negative positions count from the back
+        dll = DLL()
+        dll.list_to_dll(list(range(10)))
+        self.assertEqual([i for i in range(10)], [dll[i] for i in range(10)])
+        self.assertEqual(9, dll[-1])
+        self.assertEqual(0, dll[-10])
+        with self.assertRaises(IndexError):
+            dll[10]
+        with self.assertRaises(IndexError):
+            dll[-11]
+        with self.assertRaises(IndexError):
+            DLL()[0]
+
+        # (2) the finger makes nearby accesses cheap
+        dll.enable_instrumentation()
+        dll[5]
+        dll[6]
+        dll[4]
+        self.assertEqual(4 + 1 + 2, dll.stats()["__getitem__"]["nodes_visited"])
+        dll.disable_instrumentation()
+
+        # (3) insert_at and pop_at behave like list.insert and list.pop
+        dll.insert_at(0, "a")
+        dll.insert_at(11, "z")
+        dll.insert_at(5, "m")
+        dll.insert_at(-1, "y")
+        self.check_dll(["a", 0, 1, 2, 3, "m", 4, 5, 6, 7, 8, 9, "y", "z"], dll)  # if failure here, see (3)
+        self.assertEqual("m", dll.pop_at(5))
+        self.assertEqual("a", dll.pop_at(0))
+        self.assertEqual("z", dll.pop_at(-1))
+        self.check_dll([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, "y"], dll)  # if failure here, see (3)
+        with self.assertRaises(IndexError):
+            dll.insert_at(12, 0)
+        with self.assertRaises(IndexError):
+            dll.pop_at(11)
+        single = DLL()
+        single.insert_at(0, 1)
+        self.assertEqual(1, single.pop_at(0))
+        self.check_dll([], single)  # if failure here, see (3)
+
+        # (4) indexed DLLs keep their buckets in list order
+        dll = DLL(indexed=True)
+        dll.list_to_dll([1, 2, 1, 2, 1])
+        dll.insert_at(3, 1)
+        dll.insert_at(1, 1)
+        node, order = dll.head, []
+        while node is not None:
+            if node.value == 1:
+                order.append(node)
+            node = node.next
+        self.assertEqual(order, dll.find_all(1))
+        self.assertEqual(1, dll.pop_at(1))
+        self.assertEqual(4, len(dll.find_all(1)))
+
+        # (5) random edits elsewhere never leave the finger stale
+        random.seed(21)
+        for indexed in (False, True):
+            dll, expected = DLL(indexed), []
+            for _ in range(3000):
+                op, value = random.randint(0, 8), random.randint(0, 9)
+                if op == 0:
+                    dll.push(value, value % 2 == 0)
+                    expected.insert(len(expected) if value % 2 == 0 else 0, value)
+                elif op == 1 and expected:
+                    dll.pop(value % 2 == 0)
+                    expected.pop(-1 if value % 2 == 0 else 0)
+                elif op == 2:
+                    position = random.randint(-len(expected), len(expected))
+                    dll.insert_at(position, value)
+                    expected.insert(position, value)
+                elif op == 3 and expected:
+                    position = random.randint(-len(expected), len(expected) - 1)
+                    self.assertEqual(expected.pop(position), dll.pop_at(position))
+                elif op == 4 and expected:
+                    position = random.randint(-len(expected), len(expected) - 1)
+                    self.assertEqual(expected[position], dll[position])
+                elif op == 5:
+                    self.assertEqual(value in expected, dll.remove(value))
+                    if value in expected:
+                        expected.remove(value)
+                elif op == 6:
+                    dll.reverse()
+                    expected.reverse()
+                elif op == 7 and value == 0:
+                    value = random.randint(0, 9)
+                    self.assertEqual(expected.count(value), dll.remove_all(value))
+                    expected = [v for v in expected if v != value]
+                self.check_dll(expected, dll)  # if failure here, see (5)
+            for position in range(len(expected)):
+                self.assertEqual(expected[position], dll[position])
+            if indexed:
+                order, node = {}, dll.head
+                while node is not None:
+                    order[node] = len(order)
+                    node = node.next
+                for value in range(10):
+                    ranks = [order[node] for node in dll.find_all(value)]
+                    self.assertEqual([i for i, v in enumerate(expected) if v == value], ranks)
+
+
+    def test_flip(self):
+
+        # (1) flipping only changes which end the DLL reads from
+        dll = DLL()
+        dll.list_to_dll([1, 2, 3])
+        head, tail = dll.head, dll.tail
+        dll.flip()
+        self.assertIs(head, dll.head)
+        self.assertIs(tail, dll.tail)
+        self.assertEqual([3, 2, 1], dll.dll_to_list())
+        self.assertEqual("Node(3) <-> Node(2) <-> Node(1)", repr(dll))
+        self.assertEqual(3, dll[0])
+        self.assertEqual(1, dll[-1])
+
+        # (2) push and pop follow the reading direction
+        dll.push(0)
+        dll.push(4, False)
+        self.assertEqual([4, 3, 2, 1, 0], dll.dll_to_list())
+        dll.pop()
+        self.assertEqual([4, 3, 2, 1], dll.dll_to_list())
+        dll.pop(False)
+        self.assertEqual([3, 2, 1], dll.dll_to_list())
+
+        # (3) find returns the first match in reading order
+        dll.list_to_dll([1, 2, 1])
+        first, last = dll.head, dll.tail
+        dll.flip()
+        self.assertIs(last, dll.find(1))
+        self.assertEqual([last, first], dll.find_all(1))
+        self.assertTrue(dll.remove(1))
+        self.assertEqual([2, 1], dll.dll_to_list())
+        self.assertIs(first, dll.find(1))
+
+        # (4) realign relinks so head is the front again, a second flip undoes the first
+        dll.list_to_dll([1, 2, 3, 4])
+        dll.flip()
+        dll.flip()
+        self.check_dll([1, 2, 3, 4], dll)  # if failure here, see (4)
+        dll.flip()
+        dll.realign()
+        self.check_dll([4, 3, 2, 1], dll)  # if failure here, see (4)
+        dll.realign()
+        self.check_dll([4, 3, 2, 1], dll)  # if failure here, see (4)
+
+        # (5) random operations on a flipping DLL match a Python list
+        random.seed(22)
+        for indexed in (False, True):
+            dll, expected = DLL(indexed), []
+            for _ in range(3000):
+                op, value = random.randint(0, 9), random.randint(0, 9)
+                if op == 0:
+                    dll.push(value, value % 2 == 0)
+                    expected.insert(len(expected) if value % 2 == 0 else 0, value)
+                elif op == 1 and expected:
+                    dll.pop(value % 2 == 0)
+                    expected.pop(-1 if value % 2 == 0 else 0)
+                elif op == 2:
+                    position = random.randint(-len(expected), len(expected))
+                    dll.insert_at(position, value)
+                    expected.insert(position, value)
+                elif op == 3 and expected:
+                    position = random.randint(-len(expected), len(expected) - 1)
+                    self.assertEqual(expected.pop(position), dll.pop_at(position))
+                elif op == 4 and expected:
+                    position = random.randint(-len(expected), len(expected) - 1)
+                    self.assertEqual(expected[position], dll[position])
+                elif op == 5:
+                    self.assertEqual(value in expected, dll.remove(value))
+                    if value in expected:
+                        expected.remove(value)
+                elif op == 6:
+                    dll.flip()
+                    expected.reverse()
+                elif op == 7:
+                    dll.reverse()
+                    expected.reverse()
+                elif op == 8 and value == 0:
+                    dll.realign()
+                    self.check_dll(expected, dll)  # if failure here, see (5)
+                else:
+                    node = dll.find(value)
+                    if node is None:
+                        self.assertNotIn(value, expected)
+                    else:
+                        position = expected.index(value)
+                        self.assertIs(node, dll._node_at(dll._physical(position)))
+                self.assertEqual(expected, dll.dll_to_list())
+                self.assertEqual(len(expected), dll.size)
+            self.assertEqual(" <-> ".join(f"Node({v})" for v in expected), repr(dll))
+            dll.realign()
+            self.check_dll(expected, dll)  # if failure here, see (5)
+
+
+    def test_extend(self):
+
+        # (1) list_to_dll takes any iterable, including generators
+        dll = DLL()
+        dll.list_to_dll(value * 2 for value in range(5))
+        self.check_dll([0, 2, 4, 6, 8], dll)  # if failure here, see (1)
+        dll.list_to_dll([])
+        self.check_dll([], dll)  # if failure here, see (1)
+
+        # (2) extend keeps order at either end, extendleft reverses like deque
+        dll.extend(iter([3, 4]))
+        self.check_dll([3, 4], dll)  # if failure here, see (2)
+        dll.extend([1, 2], back=False)
+        self.check_dll([1, 2, 3, 4], dll)  # if failure here, see (2)
+        dll.extend(range(5, 7))
+        dll.extendleft([0, -1])
+        self.check_dll([-1, 0, 1, 2, 3, 4, 5, 6], dll)  # if failure here, see (2)
+        dll.extend([])
+        dll.extendleft(iter(()))
+        self.check_dll([-1, 0, 1, 2, 3, 4, 5, 6], dll)  # if failure here, see (2)
+        single = DLL()
+        single.extendleft([1])
+        self.check_dll([1], single)  # if failure here, see (2)
+
+        # (3) flipped DLLs extend their reading-order ends
+        dll = DLL()
+        dll.list_to_dll([1, 2])
+        dll.flip()
+        dll.extend([0, -1])
+        dll.extend([4, 3], back=False)
+        dll.extendleft([5, 6])
+        self.assertEqual([6, 5, 4, 3, 2, 1, 0, -1], dll.dll_to_list())
+        self.assertEqual(4, dll[2])
+        dll.realign()
+        self.check_dll([6, 5, 4, 3, 2, 1, 0, -1], dll)  # if failure here, see (3)
+
+        # (4) the index and the finger stay current
+        dll = DLL(indexed=True)
+        dll.list_to_dll([1, 2, 1])
+        self.assertEqual(2, dll[1])
+        dll.extend([1, 3])
+        dll.extend([1, 2], back=False)
+        dll.extendleft([2, 1])
+        self.check_dll([1, 2, 1, 2, 1, 2, 1, 1, 3], dll)  # if failure here, see (4)
+        self.assertEqual(2, dll[5])
+        node, ones = dll.head, []
+        while node is not None:
+            if node.value == 1:
+                ones.append(node)
+            node = node.next
+        self.assertEqual(ones, dll.find_all(1))
+        self.assertIs(dll.tail, dll.find(3))
+
+        # (5) bulk loading matches pushing one value at a time
+        pushed, bulk = DLL(), DLL()
+        for value in range(1000):
+            pushed.push(value)
+        bulk.list_to_dll(range(1000))
+        self.assertEqual(pushed.dll_to_list(), bulk.dll_to_list())
+        self.check_dll(list(range(1000)), bulk)  # if failure here, see (5)
+
+
+    def test_sentinel(self):
+
+        def check_sentinel(expected, dll):
+            # both directions of the ring hold the expected values
+            self.assertEqual(len(expected), dll.size)
+            self.assertEqual(expected, dll.dll_to_list())
+            backward, node = [], dll.tail
+            while node is not None and node is not dll._sentinel:
+                backward.append(node.value)
+                node = node.prev
+            self.assertEqual(expected[::-1], backward)
+            if expected:
+                self.assertEqual(expected[0], dll.head.value)
+                self.assertEqual(expected[-1], dll.tail.value)
+            else:
+                self.assertIsNone(dll.head)
+                self.assertIsNone(dll.tail)
+
+        # (1) empty list, pop does nothing
+        dll = SentinelDLL()
+        self.assertTrue(dll.empty())
+        dll.pop()
+        dll.pop(False)
+        check_sentinel([], dll)
+        self.assertEqual("", repr(dll))
+
+        # (2) push, pop and remove_node at every position
+        dll.push(2)
+        dll.push(1, False)
+        dll.push(3)
+        check_sentinel([1, 2, 3], dll)
+        self.assertEqual("Node(1) <-> Node(2) <-> Node(3)", str(dll))
+        dll.remove_node(dll.find(2))
+        check_sentinel([1, 3], dll)
+        dll.pop(False)
+        dll.pop()
+        check_sentinel([], dll)
+        # removing from an empty list does nothing, like DLL
+        dll.push(4)
+        stale = dll.head
+        dll.remove_node(stale)
+        dll.remove_node(stale)
+        dll.remove_node(None)
+        check_sentinel([], dll)
+
+        # (3) the rest of the DLL API
+        dll.list_to_dll(range(6))
+        dll.extend([0, 1], back=False)
+        dll.extendleft([7])
+        check_sentinel([7, 0, 1, 0, 1, 2, 3, 4, 5], dll)
+        self.assertEqual(2, len(dll.find_all(0)))
+        self.assertIsNone(dll.find(9))
+        self.assertTrue(dll.remove(7))
+        self.assertFalse(dll.remove(9))
+        self.assertEqual(2, dll.remove_all(1))
+        self.assertEqual({0: 2, 9: 0}, dll.remove_values({0, 9}))
+        self.assertEqual({2: 1, 4: 1}, dll.remove_if(lambda value: value % 2 == 0))
+        check_sentinel([3, 5], dll)
+        dll.reverse()
+        check_sentinel([5, 3], dll)
+        dll.insert_at(1, 4)
+        dll.insert_at(-3, 6)
+        self.assertEqual(6, dll.pop_at(0))
+        self.assertEqual(3, dll[-1])
+        with self.assertRaises(IndexError):
+            dll[3]
+        check_sentinel([5, 4, 3], dll)
+
+        # (4) random operations match the DLL
+        random.seed(24)
+        plain, sentinel = DLL(), SentinelDLL()
+        for _ in range(3000):
+            op, value = random.randint(0, 7), random.randint(0, 9)
+            if op <= 1:
+                plain.push(value, op == 0)
+                sentinel.push(value, op == 0)
+            elif op == 2:
+                plain.pop(value % 2 == 0)
+                sentinel.pop(value % 2 == 0)
+            elif op == 3:
+                self.assertEqual(plain.remove(value), sentinel.remove(value))
+            elif op == 4:
+                self.assertEqual(plain.remove_all(value), sentinel.remove_all(value))
+            elif op == 5:
+                plain.reverse()
+                sentinel.reverse()
+            elif op == 6 and plain.size:
+                position = random.randint(-plain.size, plain.size - 1)
+                self.assertEqual(plain.pop_at(position), sentinel.pop_at(position))
+            else:
+                position = random.randint(-plain.size, plain.size)
+                plain.insert_at(position, value)
+                sentinel.insert_at(position, value)
+            check_sentinel(plain.dll_to_list(), sentinel)
+
+
+    def test_block(self):
+
+        # (1) empty list and capacity checks
+        with self.assertRaises(ValueError):
+            BlockDLL(capacity=1)
+        dll = BlockDLL(capacity=4)
+        self.assertTrue(dll.empty())
+        self.assertIsNone(dll.head)
+        self.assertIsNone(dll.tail)
+        dll.pop()
+        self.assertEqual([], dll.dll_to_list())
+        self.assertEqual("", repr(dll))
+
+        # (2) the DLL API, across several blocks
+        dll.list_to_dll(value for value in range(10))
+        self.assertEqual(list(range(10)), dll.dll_to_list())
+        self.assertEqual([4, 4, 2], [len(block.values) for block in (dll._first, dll._first.next, dll._last)])
+        dll.push(10)
+        dll.push(-1, False)
+        dll.extend([11, 12])
+        dll.extendleft([-2, -3])
+        self.assertEqual(list(range(-3, 13)), dll.dll_to_list())
+        self.assertEqual(16, dll.size)
+        self.assertEqual(-3, dll.head.value)
+        self.assertEqual(12, dll.tail.value)
+        self.assertEqual(5, dll[8])
+        self.assertEqual(12, dll[-1])
+        with self.assertRaises(IndexError):
+            dll[16]
+        dll.reverse()
+        self.assertEqual(list(range(12, -4, -1)), dll.dll_to_list())
+        dll.reverse()
+        self.assertTrue(dll.remove(0))
+        self.assertFalse(dll.remove(0))
+        self.assertEqual({1: 1, 2: 1, 99: 0}, dll.remove_values({1, 2, 99}))
+        self.assertEqual({3: 1, 6: 1, 9: 1, 12: 1, -3: 1}, dll.remove_if(lambda value: value % 3 == 0))
+        self.assertEqual([-2, -1, 4, 5, 7, 8, 10, 11], dll.dll_to_list())
+
+        # (3) handles from find stay valid through splits, merges, shifts and reversal
+        dll = BlockDLL(capacity=4)
+        dll.list_to_dll("abcdefgh")
+        handles = {value: dll.find(value) for value in "abcdefgh"}
+        dll.insert_at(1, "x")  # splits the first block
+        dll.insert_at(0, "y")
+        dll.insert_at(6, "z")  # splits the second block
+        self.assertEqual(list("yaxbcdzefgh"), dll.dll_to_list())
+        for value, handle in handles.items():
+            self.assertEqual(value, handle.value)
+        dll.reverse()
+        for value, handle in handles.items():
+            self.assertEqual(value, handle.value)
+        dll.reverse()
+        self.assertEqual(3, dll.remove_all("x") + dll.remove_all("y") + dll.remove_all("z"))
+        dll.remove_node(handles["c"])
+        self.assertEqual("c", handles["c"].value)
+        dll.pop_at(1)
+        dll.pop(False)
+        self.assertEqual(list("defgh"), dll.dll_to_list())
+        for value in "defgh":
+            self.assertEqual(value, handles[value].value)
+            self.assertIs(handles[value], dll.find(value))
+        handles["e"].value = "E"
+        self.assertEqual(list("dEfgh"), dll.dll_to_list())
+        self.assertEqual([handles["d"], handles["f"]], [dll.head, dll.find("f")])
+
+        # (4) random operations match the DLL, and every live handle keeps its value
+        random.seed(25)
+        plain, block = DLL(), BlockDLL(capacity=4)
+        handles = []
+        for _ in range(3000):
+            op, value = random.randint(0, 9), random.randint(0, 9)
+            if op <= 1:
+                plain.push(value, op == 0)
+                block.push(value, op == 0)
+            elif op == 2:
+                plain.pop(value % 2 == 0)
+                block.pop(value % 2 == 0)
+            elif op == 3:
+                self.assertEqual(plain.remove(value), block.remove(value))
+            elif op == 4:
+                self.assertEqual(plain.remove_all(value), block.remove_all(value))
+            elif op == 5:
+                plain.reverse()
+                block.reverse()
+            elif op == 6 and plain.size:
+                position = random.randint(-plain.size, plain.size - 1)
+                self.assertEqual(plain.pop_at(position), block.pop_at(position))
+            elif op == 7:
+                position = random.randint(-plain.size, plain.size)
+                plain.insert_at(position, value)
+                block.insert_at(position, value)
+            elif op == 8:
+                self.assertEqual(len(plain.find_all(value)), len(block.find_all(value)))
+                handle = block.find(value)
+                if handle is not None:
+                    handles.append((handle, value))
+            else:
+                node = block.find(value)
+                if node is not None:
+                    block.remove_node(node)
+                    plain.remove_node(plain.find(value))
+            self.assertEqual(plain.dll_to_list(), block.dll_to_list())
+            self.assertEqual(plain.size, block.size)
+        for handle, value in handles:
+            self.assertEqual(value, handle.value)
+        # no block is ever left empty
+        node = block._first
+        while node is not None:
+            self.assertTrue(0 < len(node.values) <= 4)
+            node = node.next
+
+        # (5) handles walk next and prev across blocks like Nodes, and extendleft matches deque
+        dll = BlockDLL(capacity=4)
+        dll.list_to_dll(range(10))
+        node, forward = dll.head, []
+        while node is not None:
+            forward.append(node.value)
+            node = node.next
+        self.assertEqual(list(range(10)), forward)
+        node, backward = dll.tail, []
+        while node is not None:
+            backward.append(node.value)
+            node = node.prev
+        self.assertEqual(list(range(9, -1, -1)), backward)
+        self.assertIs(dll.find(4), dll.find(3).next)
+        self.assertIs(dll.find(3), dll.find(4).prev)
+        removed = dll.find(5)
+        dll.remove_node(removed)
+        self.assertIsNone(removed.next)
+        self.assertIsNone(removed.prev)
+        self.assertEqual(6, dll.find(4).next.value)
+        expected = collections.deque(range(10))
+        expected.remove(5)
+        for values in ([], [-1], range(-2, -12, -1)):
+            dll.extendleft(value for value in values)
+            expected.extendleft(values)
+            self.assertEqual(list(expected), dll.dll_to_list())
+            self.assertEqual(len(expected), dll.size)
+
+
 class Spotify_Music_PlayerTests(unittest.TestCase):
     # Spotify_Music_Player test cases
     def test_play_favorite_next(self):